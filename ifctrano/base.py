@@ -1,43 +1,135 @@
 import json
 import math
 import sys
+from abc import ABC, abstractmethod
+from functools import cache
 from itertools import combinations
 from multiprocessing import Process
 from pathlib import Path
-from typing import Tuple, Literal, List, Annotated, Any, Dict, cast
+from typing import (
+    TYPE_CHECKING,
+    Tuple,
+    Literal,
+    List,
+    Any,
+    Dict,
+    Optional,
+    Union,
+    cast,
+)
 
 import ifcopenshell.geom
 import numpy as np
-import open3d  # type: ignore
 from numpy import ndarray
 from pydantic import (
     BaseModel,
-    BeforeValidator,
     ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
     model_validator,
-    computed_field,
 )
+from pydantic_core import core_schema
+from shapely import wkt  # type: ignore
 from shapely.geometry.polygon import Polygon  # type: ignore
-from vedo import Line, Arrow, Mesh, show, write  # type: ignore
-
-from ifctrano.exceptions import VectorWithNansError
 
-settings = ifcopenshell.geom.settings()  # type: ignore
+from ifctrano.box_points import get_axis_aligned_box_points
+from ifctrano.exceptions import DetachedEntityError, VectorWithNansError
+
+if TYPE_CHECKING:
+    from vedo import Line  # type: ignore
+
+GeometryProfile = Literal["fast", "default", "precise"]
+GEOMETRY_PROFILES: Dict[str, Dict[str, Any]] = {
+    "fast": {
+        "mesher-linear-deflection": 0.01,
+        "mesher-angular-deflection": 1.0,
+        "circle-segments": 8,
+        "disable-opening-subtractions": True,
+    },
+    "default": {},
+    "precise": {
+        "mesher-linear-deflection": 0.0001,
+        "mesher-angular-deflection": 0.1,
+        "circle-segments": 32,
+    },
+}
+
+
+@cache
+def get_settings(profile: GeometryProfile = "default") -> ifcopenshell.geom.settings:
+    """Geometry settings of a profile.
+
+    fast tessellates curved surfaces coarsely and skips the subtraction of
+    openings, precise tessellates them finely. See tests/benchmarks for the
+    cost and accuracy of each profile.
+    """
+    settings_ = ifcopenshell.geom.settings()  # type: ignore
+    for name, value in GEOMETRY_PROFILES[profile].items():
+        settings_.set(name, value)  # type: ignore
+    return settings_
+
+
+settings = get_settings("default")
 Coordinate = Literal["x", "y", "z"]
 AREA_TOLERANCE = 0.5
 ROUNDING_FACTOR = 5
 CLASH_CLEARANCE = 0.5
+FloatArray = np.ndarray[tuple[int, ...], np.dtype[np.float64]]
 
 
 class BaseModelConfig(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class DetachedEntity(BaseModel):
+    """IFC entity reduced to what is used once its file is released."""
+
+    model_config = ConfigDict(frozen=True)
+    global_id: str
+    ifc_class: str
+    name: Optional[str] = None
+    construction_id: Optional[int] = None
+
+    @classmethod
+    def from_entity(
+        cls, entity: "Entity", construction_id: Optional[int] = None
+    ) -> "DetachedEntity":
+        return cls(
+            global_id=entity.GlobalId,
+            ifc_class=entity.is_a(),
+            name=entity.Name,
+            construction_id=construction_id,
+        )
+
+    @property
+    def GlobalId(self) -> str:  # noqa: N802
+        return self.global_id
+
+    @property
+    def Name(self) -> Optional[str]:  # noqa: N802
+        return self.name
+
+    def is_a(self) -> str:
+        return self.ifc_class
+
+    def id(self) -> int:
+        """Detached entities have no step id, caches keyed by it must not see them."""
+        raise DetachedEntityError(
+            f"Entity {self.global_id} ({self.ifc_class}) is detached from its file "
+            "and has no id."
+        )
+
+
+Entity = Union[ifcopenshell.entity_instance, DetachedEntity]
+
+
 def round_two_decimals(value: float) -> float:
     return round(value, 10)
 
 
-def _show(lines: List[Line], interactive: bool = True) -> None:
+def _show(lines: List["Line"], interactive: bool = True) -> None:
+    from vedo import show
+
     show(
         *lines,
         axes=1,
@@ -50,7 +142,7 @@ def _show(lines: List[Line], interactive: bool = True) -> None:
 class BaseShow(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def lines(self) -> List[Line]: ...  # type: ignore
+    def lines(self) -> List["Line"]: ...  # type: ignore
 
     def description(self) -> Any: ...  # noqa: ANN401
 
@@ -62,6 +154,7 @@ class BaseShow(BaseModel):
         p.start()
 
     def write(self) -> None:
+        from vedo import write
 
         write(
             *self.lines(),
@@ -82,33 +175,192 @@ class BaseShow(BaseModel):
         return cast(Dict[str, Any], json.loads(json.dumps(sorted(self.description()))))
 
 
-class BasePoint(BaseModel):
-    x: Annotated[float, BeforeValidator(round_two_decimals)]
-    y: Annotated[float, BeforeValidator(round_two_decimals)]
-    z: Annotated[float, BeforeValidator(round_two_decimals)]
+def _round_coordinates(values: Any) -> FloatArray:  # noqa: ANN401
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "f":
+            return np.round(values, 10).astype(np.float64)
+        return values.astype(np.float64)
+    return np.array([round_two_decimals(value) for value in values], dtype=np.float64)
+
+
+def _read_only(array: FloatArray) -> FloatArray:
+    array.setflags(write=False)
+    return array
+
+
+def polygon_wkt(coordinates: List[List[float]]) -> str:
+    if not coordinates:
+        return "POLYGON EMPTY"
+    ring = ", ".join(
+        " ".join(np.format_float_positional(value, trim="-") for value in coordinate)
+        for coordinate in coordinates
+    )
+    return f"POLYGON (({ring}))"
+
+
+class ArrayModel(ABC):
+    """Lightweight NumPy-backed model usable as a pydantic field.
+
+    Subclasses define how they are built from and dumped to a dict, which
+    pydantic uses to validate and serialize them.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler  # noqa: ANN401
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.model_validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.model_dump()
+            ),
+        )
+
+    @classmethod
+    def model_validate(cls, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls._from_dict(value)
+        raise ValueError(f"Cannot convert {type(value).__name__} to {cls.__name__}.")
+
+    @classmethod
+    @abstractmethod
+    def _from_dict(cls, value: Dict[str, Any]) -> Any: ...  # noqa: ANN401
+
+    @abstractmethod
+    def model_dump(self) -> Dict[str, Any]: ...
+
+
+class PolygonRing(ArrayModel):
+    """Exterior ring of a planar polygon stored as an (n, 2) coordinate array.
+
+    The WKT representation is only built when requested.
+    """
+
+    __slots__ = ("_array",)
+    _array: FloatArray
+
+    def __init__(self, coordinates: Optional[List[List[float]]] = None) -> None:
+        self._array = _read_only(
+            np.array(coordinates or [], dtype=np.float64).reshape(-1, 2)
+        )
+
+    @classmethod
+    def model_validate(cls, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, str):
+            return cls.from_wkt(value)
+        if isinstance(value, (list, np.ndarray)):
+            return cls(coordinates=value)  # type: ignore
+        return super().model_validate(value)
+
+    @classmethod
+    def _from_dict(cls, value: Dict[str, Any]) -> "PolygonRing":
+        return cls(coordinates=value["coordinates"])
+
+    def model_dump(self) -> Dict[str, Any]:
+        return {"coordinates": self.to_list()}
+
+    @classmethod
+    def from_wkt(cls, value: str) -> "PolygonRing":
+        polygon = wkt.loads(value)
+        if polygon.is_empty or not isinstance(polygon, Polygon):
+            return cls()
+        return cls(
+            coordinates=[coordinate[:2] for coordinate in polygon.exterior.coords]
+        )
+
+    @property
+    def wkt(self) -> str:
+        return polygon_wkt(self.to_list())
+
+    def to_array(self) -> FloatArray:
+        return self._array
+
+    def to_list(self) -> List[List[float]]:
+        return self._array.tolist()  # type: ignore
+
+    def to_polygon(self) -> Polygon:
+        if not len(self._array):
+            return Polygon()
+        return Polygon(self._array)
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and np.array_equal(
+            self._array, other._array  # type: ignore
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._array + 0.0).tobytes())
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(coordinates={self.to_list()})"
+
+
+class BasePoint(ArrayModel):
+    __slots__ = ("_array",)
+    _array: FloatArray
+
+    def __init__(self, x: float, y: float, z: float) -> None:
+        self._set_array(_round_coordinates((x, y, z)))
+
+    def _set_array(self, array: FloatArray) -> None:
+        self._array = _read_only(array)
+
+    @classmethod
+    def _from_rounded(cls, array: FloatArray) -> Any:  # noqa: ANN401
+        point = cls.__new__(cls)
+        point._set_array(array)
+        return point
+
+    @property
+    def x(self) -> float:
+        return float(self._array[0])
+
+    @property
+    def y(self) -> float:
+        return float(self._array[1])
+
+    @property
+    def z(self) -> float:
+        return float(self._array[2])
+
+    @classmethod
+    def _from_dict(cls, value: Dict[str, Any]) -> "BasePoint":
+        return cls(x=value["x"], y=value["y"], z=value["z"])
+
+    def model_dump(self) -> Dict[str, Any]:
+        return dict(zip("xyz", self.to_list()))
 
     @classmethod
     def from_coordinate(cls, point: Tuple[float, float, float]) -> "BasePoint":
         return cls(x=point[0], y=point[1], z=point[2])
 
     def to_array(self) -> np.ndarray:  # type: ignore
-        return np.array([self.x, self.y, self.z])
+        return self._array
 
     def to_list(self) -> List[float]:
-        return [self.x, self.y, self.z]
+        return self._array.tolist()  # type: ignore
 
     def to_tuple(self) -> Tuple[float, float, float]:
-        return (self.x, self.y, self.z)
+        return tuple(self._array.tolist())
 
     @classmethod
     def from_array(cls, array: np.ndarray) -> "BasePoint":  # type: ignore
-        try:
-            return cls(x=array[0], y=array[1], z=array[2])
-        except IndexError as e:
-            raise ValueError("Array must have three components") from e
+        if len(array) < 3:
+            raise ValueError("Array must have three components")
+        return cls._from_rounded(_round_coordinates(array[:3]))  # type: ignore
 
     def __eq__(self, other: "BasePoint") -> bool:  # type: ignore
-        return all([self.x == other.x, self.y == other.y, self.z == other.z])
+        return bool((self._array == other._array).all())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(x={self.x}, y={self.y}, z={self.z})"
 
 
 Signs = Literal[-1, 1]
@@ -124,20 +376,18 @@ class Sign(BaseModel):
 
 
 class Vector(BasePoint):
+    __slots__ = ()
 
-    @model_validator(mode="after")
-    def _validator(self) -> "Vector":
-        if any(np.isnan(v) for v in self.to_list()):
+    def _set_array(self, array: FloatArray) -> None:
+        if np.isnan(array).any():
             raise VectorWithNansError("Vector cannot have NaN values")
-        return self
+        super()._set_array(array)
 
     def __mul__(self, other: "Vector") -> "Vector":
-
-        array = np.cross(self.to_array(), other.to_array())
-        return Vector(x=array[0], y=array[1], z=array[2])
+        return Vector.from_array(np.cross(self._array, other._array))
 
     def dot(self, other: "Vector") -> float:
-        return np.dot(self.to_array(), other.to_array())  # type: ignore
+        return np.dot(self._array, other._array)  # type: ignore
 
     def angle(self, other: "Vector") -> int:
         dot_product = np.dot(self.to_xy(), other.to_xy())
@@ -150,49 +400,54 @@ class Vector(BasePoint):
 
     def project(self, other: "Vector") -> "Vector":
         a = self.dot(other) / other.dot(other)
-        return Vector(x=a * other.x, y=a * other.y, z=a * other.z)
+        return Vector.from_array(a * other._array)
 
     def normalize(self) -> "Vector":
-        normalized_vector = self.to_array() / np.linalg.norm(self.to_array())
-        return Vector(
-            x=normalized_vector[0], y=normalized_vector[1], z=normalized_vector[2]
-        )
+        return Vector.from_array(self._array / np.linalg.norm(self._array))
 
     def norm(self) -> float:
-        return float(np.linalg.norm(self.to_array()))
-
-    def to_array(self) -> np.ndarray:  # type: ignore
-        return np.array([self.x, self.y, self.z])
+        return float(np.linalg.norm(self._array))
 
     def to_xy(self) -> np.ndarray:  # type: ignore
-        return np.array([self.x, self.y])
+        return self._array[:2]
 
     def get_normal_index(self) -> int:
         normal_index_list = [abs(v) for v in self.to_list()]
         return normal_index_list.index(max(normal_index_list))
 
     def is_null(self, tolerance: float = 0.1) -> bool:
-        return all(abs(value) < tolerance for value in self.to_list())
+        return bool((np.abs(self._array) < tolerance).all())
 
     @classmethod
     def from_array(cls, array: np.ndarray) -> "Vector":  # type: ignore
-        return cls.model_validate(super().from_array(array).model_dump())
+        return cast(Vector, super().from_array(array))
 
 
 class Point(BasePoint):
-    def __sub__(self, other: "Point") -> Vector:
+    __slots__ = ()
 
-        return Vector(x=self.x - other.x, y=self.y - other.y, z=self.z - other.z)
+    def __sub__(self, other: "Point") -> Vector:
+        return cast(
+            Vector,
+            Vector._from_rounded(
+                _round_coordinates((self._array - other._array).tolist())
+            ),
+        )
 
     def __add__(self, other: "Point") -> "Point":
-        return Point(x=self.x + other.x, y=self.y + other.y, z=self.z + other.z)
+        return cast(
+            Point,
+            Point._from_rounded(
+                _round_coordinates((self._array + other._array).tolist())
+            ),
+        )
 
     def s(self, signs: Sign) -> "Point":
         return Point(x=self.x * signs.x, y=self.y * signs.y, z=self.z * signs.z)
 
 
 class P(Point):
-    pass
+    __slots__ = ()
 
 
 class GlobalId(BaseModelConfig):
@@ -231,28 +486,75 @@ class CoordinateSystem(BaseModel):
         return np.round(np.dot(array, np.linalg.inv(self.to_array())), ROUNDING_FACTOR)  # type: ignore
 
 
-class Vertices(BaseModel):
-    points: List[Point]
+class Vertices(ArrayModel):
+    __slots__ = ("_array", "_points")
+    _array: FloatArray
+
+    def __init__(self, points: List[Point]) -> None:
+        self._set_array(
+            np.array([point.to_array() for point in points], dtype=np.float64).reshape(
+                -1, 3
+            )
+        )
+
+    def _set_array(self, array: FloatArray) -> None:
+        self._array = _read_only(array)
+        self._points: Optional[List[Point]] = None
+
+    @classmethod
+    def _from_rounded(cls, array: FloatArray) -> Any:  # noqa: ANN401
+        vertices = cls.__new__(cls)
+        vertices._set_array(array)
+        return vertices
+
+    @property
+    def points(self) -> List[Point]:
+        if self._points is None:
+            self._points = [Point._from_rounded(array) for array in self._array]
+        return self._points
+
+    @classmethod
+    def _from_dict(cls, value: Dict[str, Any]) -> "Vertices":
+        return cls(points=[Point.model_validate(point) for point in value["points"]])
+
+    def model_dump(self) -> Dict[str, Any]:
+        return {"points": [dict(zip("xyz", point)) for point in self.to_list()]}
 
     @classmethod
     def from_arrays(
         cls, arrays: np.ndarray[tuple[int, ...], np.dtype[np.float64]]
     ) -> "Vertices":
-        return cls(
-            points=[Point(x=array[0], y=array[1], z=array[2]) for array in arrays]
-        )
+        if isinstance(arrays, np.ndarray) and arrays.ndim == 2:
+            return cls._from_rounded(_round_coordinates(arrays[:, :3]))  # type: ignore
+        return cls(points=[Point.from_array(array) for array in arrays])  # type: ignore
 
     def to_array(self) -> ndarray:  # type: ignore
-        return np.array([point.to_array() for point in self.points])
+        return self._array
 
     def to_list(self) -> List[List[float]]:
-        return self.to_array().tolist()  # type: ignore
+        return self._array.tolist()  # type: ignore
 
     def to_tuple(self) -> List[List[float]]:
-        return tuple(tuple(t) for t in self.to_array().tolist())  # type: ignore
+        return tuple(tuple(t) for t in self._array.tolist())  # type: ignore
 
     def to_face_vertices(self) -> "FaceVertices":
-        return FaceVertices(points=self.points)
+        return FaceVertices._from_rounded(self._array)  # type: ignore
+
+    def select_faces(self, faces: List[List[int]]) -> List["FaceVertices"]:
+        """Face vertices of faces given as indexes of these vertices."""
+        return [FaceVertices._from_rounded(self._array[face]) for face in faces]
+
+    def __eq__(self, other: "Vertices") -> bool:  # type: ignore
+        return type(self) is type(other) and np.array_equal(self._array, other._array)
+
+    def __hash__(self) -> int:
+        return hash((self._array + 0.0).tobytes())
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(points={self.to_list()})"
 
     def get_local_coordinate_system(self) -> CoordinateSystem:
         vectors = [
@@ -277,53 +579,58 @@ class Vertices(BaseModel):
     def get_bounding_box(self) -> "Vertices":
         coordinates = self.get_local_coordinate_system()
         projected = coordinates.project(self.to_array())
-        points_ = open3d.utility.Vector3dVector(projected)
-        aab = open3d.geometry.AxisAlignedBoundingBox.create_from_points(points_)
-        reversed = coordinates.inverse(np.array(aab.get_box_points()))
+        reversed = coordinates.inverse(get_axis_aligned_box_points(projected))
         return Vertices.from_arrays(reversed)
 
     def is_box_shaped(self) -> bool:
-        return len(self.points) == 8
+        return len(self._array) == 8
 
 
 class FaceVertices(Vertices):
+    __slots__ = ("_vector_1_", "_vector_2_", "_coordinates")
 
-    @model_validator(mode="after")
-    def _model_validator(self) -> "FaceVertices":
-        if len(self.points) < 3:
+    def _set_array(self, array: FloatArray) -> None:
+        if len(array) < 3:
             raise ValueError("Face must have more than 3 vertices.")
-        return self
-
-    @computed_field
-    def _vector_1(self) -> Vector:
-        point_0 = self.points[0]
-        point_1 = self.points[1]
-        vector_0 = point_1 - point_0
+        super()._set_array(array)
+        self._vector_1_: Optional[Vector] = None
+        self._vector_2_: Optional[Vector] = None
+        self._coordinates: Optional[CoordinateSystem] = None
+
+    def _unit_vector(self, index: int) -> Vector:
+        vector_0 = Point._from_rounded(self._array[index]) - Point._from_rounded(
+            self._array[0]
+        )
         return Vector.from_array(
             vector_0.to_array() / np.linalg.norm(vector_0.to_array())
         )
 
-    @computed_field
+    @property
+    def _vector_1(self) -> Vector:
+        if self._vector_1_ is None:
+            self._vector_1_ = self._unit_vector(1)
+        return self._vector_1_
+
+    @property
     def _vector_2(self) -> Vector:
-        point_0 = self.points[0]
-        point_2 = self.points[2]
-        vector_0 = point_2 - point_0
-        return Vector.from_array(
-            vector_0.to_array() / np.linalg.norm(vector_0.to_array())
-        )
+        if self._vector_2_ is None:
+            self._vector_2_ = self._unit_vector(2)
+        return self._vector_2_
 
     def get_normal(self) -> Vector:
-        normal_vector = self._vector_1 * self._vector_2  # type: ignore
+        normal_vector = self._vector_1 * self._vector_2
         normal_normalized = normal_vector.to_array() / np.linalg.norm(
             normal_vector.to_array()
         )
         return Vector.from_array(normal_normalized)
 
     def get_coordinates(self) -> CoordinateSystem:
-        z_axis = self.get_normal()
-        x_axis = self._vector_1
-        y_axis = z_axis * x_axis  # type: ignore
-        return CoordinateSystem(x=x_axis, y=y_axis, z=z_axis)
+        if self._coordinates is None:
+            z_axis = self.get_normal()
+            x_axis = self._vector_1
+            y_axis = z_axis * x_axis
+            self._coordinates = CoordinateSystem(x=x_axis, y=y_axis, z=z_axis)
+        return self._coordinates
 
     def project(self, vertices: "FaceVertices") -> "ProjectedFaceVertices":
         coordinates = self.get_coordinates()
@@ -335,10 +642,12 @@ class FaceVertices(Vertices):
         return float(round(projected.to_polygon().area, ROUNDING_FACTOR))
 
     def get_center(self) -> Point:
-        x = np.mean([point.x for point in self.points])
-        y = np.mean([point.y for point in self.points])
-        z = np.mean([point.z for point in self.points])
-        return Point(x=x, y=y, z=z)
+        return cast(
+            Point,
+            Point.from_array(
+                np.array([np.mean(axis) for axis in self._array.T.copy()])
+            ),
+        )
 
     def get_distance(self, other: "FaceVertices") -> float:
         return math.dist(self.get_center().to_list(), other.get_center().to_list())
@@ -350,8 +659,34 @@ class FixedIndex(BaseModel):
 
 
 class ProjectedFaceVertices(FaceVertices):
+    __slots__ = ("coordinate_system",)
     coordinate_system: CoordinateSystem
 
+    def __init__(
+        self, points: List[Point], coordinate_system: CoordinateSystem
+    ) -> None:
+        super().__init__(points)
+        self.coordinate_system = coordinate_system
+
+    @classmethod
+    def _from_dict(cls, value: Dict[str, Any]) -> "ProjectedFaceVertices":
+        return cls(
+            points=[Point.model_validate(point) for point in value["points"]],
+            coordinate_system=CoordinateSystem.model_validate(
+                value["coordinate_system"]
+            ),
+        )
+
+    def model_dump(self) -> Dict[str, Any]:
+        return super().model_dump() | {
+            "coordinate_system": self.coordinate_system.model_dump()
+        }
+
+    def __eq__(self, other: "ProjectedFaceVertices") -> bool:  # type: ignore
+        return (
+            super().__eq__(other) and self.coordinate_system == other.coordinate_system
+        )
+
     def get_fixed_index(self) -> FixedIndex:
         fixed_indexes = [
             FixedIndex(index=i, value=x[0])
@@ -363,20 +698,83 @@ class ProjectedFaceVertices(FaceVertices):
         return fixed_indexes[0]
 
     def to_polygon(self) -> Polygon:
-        vertices_ = self.to_list()
         try:
             fixed_index = self.get_fixed_index()
         except ValueError:
             return Polygon()
         indexes = [0, 1, 2]
         indexes.remove(fixed_index.index)
-        vertices_ = [*vertices_, vertices_[0]]
-        points = [np.array(v)[indexes] for v in vertices_]
-        return Polygon(points)
+        points = self._array[:, indexes]
+        return Polygon(np.vstack([points, points[:1]]))
+
+    def get_rectangle(self) -> Optional[Tuple[FixedIndex, FloatArray, FloatArray]]:
+        """Fixed index and in-plane bounds of a face aligned with the plane axes."""
+        try:
+            fixed_index = self.get_fixed_index()
+        except ValueError:
+            return None
+        points = np.delete(self._array, fixed_index.index, axis=1)
+        edges = np.roll(points, -1, axis=0) - points
+        if len(points) != 4 or ((edges != 0).sum(axis=1) != 1).any():
+            return None
+        return fixed_index, points.min(axis=0), points.max(axis=0)
+
+    def intersect_rectangle(
+        self, other: "ProjectedFaceVertices"
+    ) -> Optional[Tuple[float, List[List[float]]]]:
+        """Area and ring of the intersection of two aligned rectangular faces.
+
+        Returns None when one of the faces is not an aligned rectangle.
+        """
+        rectangle = self.get_rectangle()
+        other_rectangle = other.get_rectangle()
+        if (
+            rectangle is None
+            or other_rectangle is None
+            or rectangle[0].index != other_rectangle[0].index
+        ):
+            return None
+        lower = np.maximum(rectangle[1], other_rectangle[1])
+        upper = np.minimum(rectangle[2], other_rectangle[2])
+        if (upper <= lower).any():
+            return 0.0, []
+        (x_0, y_0), (x_1, y_1) = lower.tolist(), upper.tolist()
+        return (x_1 - x_0) * (y_1 - y_0), [
+            [x_0, y_0],
+            [x_0, y_1],
+            [x_1, y_1],
+            [x_1, y_0],
+            [x_0, y_0],
+        ]
+
+    def intersect(
+        self, other: "ProjectedFaceVertices"
+    ) -> Tuple[float, List[List[float]]]:
+        """Area and ring coordinates of the intersection with another face.
+
+        Aligned rectangles are intersected analytically and other faces with shapely.
+        """
+        rectangle = self.intersect_rectangle(other)
+        if rectangle is not None:
+            return rectangle
+        intersection = other.to_polygon().intersection(self.to_polygon())
+        if not intersection.area:
+            return 0.0, []
+        return (
+            intersection.area,
+            [list(coord) for coord in intersection.exterior.coords],
+        )
 
     def common_vertices(self, polygon: Polygon) -> FaceVertices:
+        return self.common_vertices_from_coordinates(
+            [list(coord) for coord in list(polygon.exterior.coords)]
+        )
+
+    def common_vertices_from_coordinates(
+        self, coordinates: List[List[float]]
+    ) -> FaceVertices:
         fixed_index = self.get_fixed_index()
-        coords = [list(coord) for coord in list(polygon.exterior.coords)]
+        coords = [list(coord) for coord in coordinates]
         [coord.insert(fixed_index.index, fixed_index.value) for coord in coords]  # type: ignore
         vertices = FaceVertices.from_arrays(np.array(coords))
         original = self.coordinate_system.inverse(vertices.to_array())
@@ -386,10 +784,9 @@ class ProjectedFaceVertices(FaceVertices):
     def from_arrays_(
         cls, arrays: ndarray[Any, Any], coordinate_system: CoordinateSystem
     ) -> "ProjectedFaceVertices":
-        return cls(
-            points=[Point(x=array[0], y=array[1], z=array[2]) for array in arrays],
-            coordinate_system=coordinate_system,
-        )
+        vertices = cls._from_rounded(_round_coordinates(arrays[:, :3]))
+        vertices.coordinate_system = coordinate_system
+        return vertices  # type: ignore
 
 
 class CommonSurface(BaseShow):
@@ -398,15 +795,15 @@ class CommonSurface(BaseShow):
     main_vertices: FaceVertices
     common_vertices: FaceVertices
     exterior: bool = True
-    polygon: str
+    polygon: PolygonRing = Field(default_factory=PolygonRing)
 
     def __hash__(self) -> int:
         return hash(
             (
                 self.area,
-                tuple(self.orientation.to_list()),
-                self.main_vertices.to_tuple(),
-                self.common_vertices.to_tuple(),
+                self.orientation.to_tuple(),
+                self.main_vertices,
+                self.common_vertices,
             )
         )
 
@@ -418,7 +815,9 @@ class CommonSurface(BaseShow):
     def description(self) -> tuple[list[float], list[float]]:
         return ([self.area], self.orientation.to_list())
 
-    def lines(self) -> List[Line]:
+    def lines(self) -> List["Line"]:
+        from vedo import Arrow, Mesh
+
         lines = []
         lst = self.common_vertices.to_list()[:4]
 
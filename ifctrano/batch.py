@@ -0,0 +1,234 @@
+import glob
+import json
+import logging
+import multiprocessing
+import time
+from collections import deque
+from contextlib import suppress
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Deque, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ifctrano.base import GeometryProfile, Libraries
+from ifctrano.geometry_cache import GeometryCache
+
+logger = logging.getLogger(__name__)
+
+BatchStatus = Literal["success", "failed", "timeout"]
+BatchOutput = Literal["config", "model"]
+POLL_INTERVAL = 0.1
+STOP_TIMEOUT = 1
+
+
+class BatchOptions(BaseModel):
+    output: BatchOutput = "config"
+    library: Libraries = "Buildings"
+    output_directory: Optional[Path] = None
+    geometry_profile: GeometryProfile = "default"
+    geometry_cache: Optional[GeometryCache] = None
+
+    def output_path(self, ifc_file_path: Path) -> Path:
+        suffix = ".yaml" if self.output == "config" else ".mo"
+        directory = self.output_directory or ifc_file_path.parent
+        return directory / f"{ifc_file_path.stem}{suffix}"
+
+
+class BatchResult(BaseModel):
+    path: Path
+    status: BatchStatus
+    output_path: Optional[Path] = None
+    timings: Dict[str, float] = Field(default_factory=dict)
+    spaces: Optional[int] = None
+    internal_elements: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BatchSummary(BaseModel):
+    results: List[BatchResult]
+    duration: float
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            status: sum(result.status == status for result in self.results)
+            for status in ["success", "failed", "timeout"]
+        }
+
+    def to_json(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(
+                {"counts": self.counts()} | self.model_dump(mode="json"), indent=2
+            )
+        )
+
+
+def collect_ifc_files(pattern: str) -> List[Path]:
+    """IFC files of a directory, or the files matching a glob pattern."""
+    directory = Path(pattern)
+    if directory.is_dir():
+        return sorted(
+            path
+            for path in directory.iterdir()
+            if path.is_file() and path.suffix.lower() == ".ifc"
+        )
+    return sorted(Path(path) for path in glob.glob(pattern, recursive=True))
+
+
+def convert(ifc_file_path: Path, options: BatchOptions) -> BatchResult:
+    """Convert one IFC file, reporting errors in the result instead of raising."""
+    from ifctrano.building import Building
+
+    timings = {}
+    start = time.perf_counter()
+    output_path = options.output_path(ifc_file_path)
+    try:
+        building = Building.from_ifc(
+            ifc_file_path,
+            geometry_cache=options.geometry_cache,
+            geometry_profile=options.geometry_profile,
+        )
+        timings["from_ifc"] = time.perf_counter() - start
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if options.output == "config":
+            building.to_yaml(output_path)
+        else:
+            output_path.write_text(
+                building.create_network(library=options.library).model()
+            )
+        timings["write"] = time.perf_counter() - start - timings["from_ifc"]
+    except Exception as e:
+        logger.error(f"Cannot convert {ifc_file_path}. Reason {e}")
+        return BatchResult(
+            path=ifc_file_path,
+            status="failed",
+            timings={"total": time.perf_counter() - start},
+            error=f"{type(e).__name__}: {e}",
+        )
+    timings["total"] = time.perf_counter() - start
+    return BatchResult(
+        path=ifc_file_path,
+        status="success",
+        output_path=output_path,
+        timings=timings,
+        spaces=len(building.space_boundaries),
+        internal_elements=len(building.internal_elements.elements),
+    )
+
+
+def _work(connection: Connection, options: BatchOptions) -> None:
+    while (ifc_file_path := connection.recv()) is not None:
+        connection.send(convert(ifc_file_path, options))
+
+
+class _Worker:
+    """Process converting the files it is sent one at a time.
+
+    Each worker has its own pipe, so that a worker that times out can be
+    terminated without affecting the others.
+    """
+
+    def __init__(self, options: BatchOptions) -> None:
+        self.options = options
+        self.task: Optional[Tuple[int, Path]] = None
+        self.started = 0.0
+        self._start()
+
+    def _start(self) -> None:
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_work, args=(child_connection, self.options), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+
+    def submit(self, index: int, ifc_file_path: Path) -> None:
+        self.task = (index, ifc_file_path)
+        self.started = time.perf_counter()
+        self.connection.send(ifc_file_path)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def receive(self, ifc_file_path: Path) -> BatchResult:
+        try:
+            result: BatchResult = self.connection.recv()
+        except EOFError:
+            self.process.join()
+            result = BatchResult(
+                path=ifc_file_path,
+                status="failed",
+                timings={"total": self.elapsed()},
+                error=f"Worker process exited with code {self.process.exitcode}.",
+            )
+            self.restart()
+            return result
+        self.task = None
+        return result
+
+    def cancel(self, ifc_file_path: Path, timeout: float) -> BatchResult:
+        logger.error(f"Conversion of {ifc_file_path} timed out.")
+        result = BatchResult(
+            path=ifc_file_path,
+            status="timeout",
+            timings={"total": self.elapsed()},
+            error=f"Timed out after {timeout} seconds.",
+        )
+        self.restart()
+        return result
+
+    def restart(self) -> None:
+        self.stop(terminate=True)
+        self.task = None
+        self._start()
+
+    def stop(self, terminate: bool = False) -> None:
+        if not terminate and self.process.is_alive():
+            with suppress(OSError):
+                self.connection.send(None)
+            self.process.join(timeout=STOP_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def run_batch(
+    ifc_file_paths: List[Path],
+    options: Optional[BatchOptions] = None,
+    jobs: int = 1,
+    timeout: Optional[float] = None,
+) -> BatchSummary:
+    """Convert IFC files in jobs worker processes.
+
+    Workers are reused from one file to the next, so the import cost is only
+    paid once per worker. A file taking longer than timeout seconds has its
+    worker terminated and replaced.
+    """
+    if jobs < 1:
+        raise ValueError(f"The number of jobs must be at least 1, got {jobs}.")
+    options = options or BatchOptions()
+    start = time.perf_counter()
+    pending: Deque[Tuple[int, Path]] = deque(enumerate(ifc_file_paths))
+    results: Dict[int, BatchResult] = {}
+    workers = [_Worker(options) for _ in range(min(jobs, len(ifc_file_paths)))]
+    try:
+        while len(results) < len(ifc_file_paths):
+            for worker in workers:
+                if worker.task is None and pending:
+                    worker.submit(*pending.popleft())
+            busy = [worker for worker in workers if worker.task is not None]
+            ready = wait([worker.connection for worker in busy], POLL_INTERVAL)
+            for worker in busy:
+                index, ifc_file_path = worker.task  # type: ignore
+                if worker.connection in ready:
+                    results[index] = worker.receive(ifc_file_path)
+                elif timeout is not None and worker.elapsed() > timeout:
+                    results[index] = worker.cancel(ifc_file_path, timeout)
+    finally:
+        for worker in workers:
+            worker.stop()
+    return BatchSummary(
+        results=[results[index] for index in range(len(ifc_file_paths))],
+        duration=time.perf_counter() - start,
+    )
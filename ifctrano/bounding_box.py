@@ -1,21 +1,21 @@
 from itertools import combinations
 from logging import getLogger
-from typing import List, Optional, Any, Tuple
+from typing import TYPE_CHECKING, List, Optional, Any, Tuple, Dict
+from weakref import WeakValueDictionary
 
 import ifcopenshell
 import ifcopenshell.geom
 import ifcopenshell.util.placement
 import ifcopenshell.util.shape
 import numpy as np
-import open3d  # type: ignore
 from ifcopenshell import entity_instance
 from pydantic import (
     BaseModel,
     Field,
     ConfigDict,
+    PrivateAttr,
 )
 from scipy.spatial import ConvexHull, QhullError  # type: ignore
-from vedo import Line  # type: ignore
 
 from ifctrano.base import (
     Point,
@@ -23,16 +23,90 @@ from ifctrano.base import (
     Vertices,
     BaseModelConfig,
     settings,
+    get_settings,
+    GeometryProfile,
     CommonSurface,
     AREA_TOLERANCE,
     FaceVertices,
     BaseShow,
+    PolygonRing,
+    Entity,
 )
+from ifctrano.box_points import get_axis_aligned_box
 from ifctrano.exceptions import VectorWithNansError
 
+if TYPE_CHECKING:
+    from vedo import Line  # type: ignore
+
 logger = getLogger(__name__)
 
 
+NULL_VECTOR_TOLERANCE = 0.1
+PROJECTION_PADDING = 1e-4
+BOX_FACES = [
+    [0, 1, 6, 3],
+    [2, 5, 4, 7],
+    [0, 3, 5, 2],
+    [1, 7, 4, 6],
+    [0, 2, 7, 1],
+    [3, 6, 4, 5],
+]
+SCREEN_CHUNK_SIZE = 1024
+EXTREME_POINT_THRESHOLD = 64
+EXTREME_POINT_DIRECTIONS = np.array(
+    [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 1, 0],
+        [1, -1, 0],
+        [1, 0, 1],
+        [1, 0, -1],
+        [0, 1, 1],
+        [0, 1, -1],
+        [1, 1, 1],
+        [1, 1, -1],
+        [1, -1, 1],
+        [-1, 1, 1],
+    ],
+    dtype=np.float64,
+)
+
+
+def get_extreme_vertices(
+    vertices: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+    """Keep the vertices extreme along the axes and the diagonals of a cube.
+
+    The minimum and maximum along each axis are kept, so the axis aligned
+    bounding box of the result is the one of all the vertices.
+    """
+    if not isinstance(vertices, np.ndarray) or len(vertices) <= (
+        EXTREME_POINT_THRESHOLD
+    ):
+        return vertices
+    projections = EXTREME_POINT_DIRECTIONS @ vertices[:, :3].T
+    indices = np.unique(
+        np.concatenate([projections.argmin(axis=1), projections.argmax(axis=1)])
+    )
+    return vertices[indices]  # type: ignore
+
+
+def get_convex_hull_vertices(
+    vertices: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+    entity: entity_instance,
+) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+    vertices_ = Vertices.from_arrays(get_extreme_vertices(vertices)).to_array()
+    try:
+        hull = ConvexHull(vertices_)
+    except QhullError:
+        logger.error(
+            f"Convex hull failed for {entity.GlobalId} ({entity.is_a()}).... Continuing without it."
+        )
+        return vertices_
+    return vertices_[hull.vertices]  # type: ignore
+
+
 class BoundingBoxFace(BaseModelConfig):
     vertices: FaceVertices
     normal: Vector
@@ -54,20 +128,33 @@ class BoundingBoxFaces(BaseModel):
     def build(
         cls, box_points: np.ndarray[tuple[int, ...], np.dtype[np.float64]]
     ) -> "BoundingBoxFaces":
-        faces = [
-            [0, 1, 6, 3],
-            [2, 5, 4, 7],
-            [0, 3, 5, 2],
-            [1, 7, 4, 6],
-            [0, 2, 7, 1],
-            [3, 6, 4, 5],
-        ]
         faces_ = [
             BoundingBoxFace.build(Vertices.from_arrays(np.array(box_points)[face]))
-            for face in faces
+            for face in BOX_FACES
         ]
         return cls(faces=faces_)
 
+    @classmethod
+    def from_normals(
+        cls,
+        box_points: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        normals: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+    ) -> "BoundingBoxFaces":
+        """Faces of a box whose normals were already computed by build."""
+        faces = Vertices.from_arrays(np.asarray(box_points)).select_faces(BOX_FACES)
+        return cls(
+            faces=[
+                BoundingBoxFace(vertices=face, normal=Vector.from_array(normal))
+                for face, normal in zip(faces, normals)
+            ]
+        )
+
+    def to_box_points(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        box_points = np.zeros((8, 3))
+        for face, indexes in zip(self.faces, BOX_FACES):
+            box_points[indexes] = face.vertices.to_array()
+        return box_points
+
 
 class ExtendCommonSurface(CommonSurface):
     distance: float
@@ -89,9 +176,11 @@ class OrientedBoundingBox(BaseShow):
     area_tolerance: float = Field(default=AREA_TOLERANCE)
     volume: float
     height: float
-    entity: Optional[entity_instance] = None
+    entity: Optional[Entity] = None
+
+    def lines(self) -> List["Line"]:
+        from vedo import Line
 
-    def lines(self) -> List[Line]:
         lines = []
         for f in self.faces.faces:
             face = f.vertices.to_list()
@@ -99,48 +188,82 @@ class OrientedBoundingBox(BaseShow):
                 lines.append(Line(a, b))
         return lines
 
+    def normals(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return np.array([face.normal.to_array() for face in self.faces.faces])
+
+    def candidate_face_pairs(
+        self, other: "OrientedBoundingBox"
+    ) -> List[Tuple[BoundingBoxFace, BoundingBoxFace]]:
+        """Parallel face pairs whose projections can overlap by more than the tolerance.
+
+        All 36 pairs are screened at once: two faces are parallel when the cross
+        product of their normals is null, and the overlap of the rectangles
+        bounding their projections on the face plane is an upper bound of the
+        area that intersect_faces would compute.
+        """
+        cross_products = np.round(
+            np.cross(self.normals()[:, np.newaxis], other.normals()[np.newaxis]), 10
+        )
+        parallel = (np.abs(cross_products) < NULL_VECTOR_TOLERANCE).all(axis=-1)
+        if not parallel.any():
+            return []
+        rows = np.unique(np.nonzero(parallel)[0])
+        inverses = np.linalg.inv(
+            [
+                self.faces.faces[row].vertices.get_coordinates().to_array()
+                for row in rows
+            ]
+        )
+        faces = np.array(BOX_FACES)
+        projected = np.einsum("pc,icd->ipd", self.to_box_points(), inverses)
+        other_projected = np.einsum("pc,icd->ipd", other.to_box_points(), inverses)
+        face_points = projected[np.arange(len(rows))[:, np.newaxis], faces[rows], :2]
+        other_face_points = other_projected[:, faces, :2]
+        lower = np.maximum(
+            face_points.min(axis=1)[:, np.newaxis], other_face_points.min(axis=2)
+        )
+        upper = np.minimum(
+            face_points.max(axis=1)[:, np.newaxis], other_face_points.max(axis=2)
+        )
+        overlap = np.clip(upper - lower + 2 * PROJECTION_PADDING, 0, None).prod(axis=-1)
+        candidates = np.zeros_like(parallel)
+        candidates[rows] = parallel[rows] & (overlap > self.area_tolerance)  # type: ignore
+        return [
+            (self.faces.faces[row], other.faces.faces[column])
+            for row, column in zip(*np.nonzero(candidates))
+        ]
+
     def intersect_faces(self, other: "OrientedBoundingBox") -> Optional[CommonSurface]:
         extend_surfaces = []
-        for face in self.faces.faces:
-
-            for other_face in other.faces.faces:
-                vector = face.normal * other_face.normal
-                if vector.is_null():
-                    projected_face_1 = face.vertices.project(face.vertices)
-                    projected_face_2 = face.vertices.project(other_face.vertices)
-                    polygon_1 = projected_face_1.to_polygon()
-                    polygon_2 = projected_face_2.to_polygon()
-                    intersection = polygon_2.intersection(polygon_1)
-                    if intersection.area > self.area_tolerance:
-                        distance = projected_face_1.get_distance(projected_face_2)
-                        area = intersection.area
-                        try:
-                            direction_vector = (
-                                other.centroid - self.centroid
-                            ).normalize()
-                            orientation = direction_vector.project(
-                                face.normal
-                            ).normalize()
-                        except VectorWithNansError as e:
-                            logger.warning(
-                                "Orientation vector was not properly computed when computing the intersection between "
-                                f"two elements "
-                                f"({(self.entity.GlobalId, self.entity.is_a(), self.entity.Name) if self.entity else None}"  # noqa: E501
-                                f", {(other.entity.GlobalId, other.entity.is_a(), other.entity.Name)if other.entity else None}). Error: {e}"  # noqa: E501
-                            )
-                            continue
-                        extend_surfaces.append(
-                            ExtendCommonSurface(
-                                distance=distance,
-                                area=area,
-                                orientation=orientation,
-                                main_vertices=face.vertices,
-                                common_vertices=projected_face_1.common_vertices(
-                                    intersection
-                                ),
-                                polygon=intersection.wkt,
-                            )
-                        )
+        for face, other_face in self.candidate_face_pairs(other):
+            projected_face_1 = face.vertices.project(face.vertices)
+            projected_face_2 = face.vertices.project(other_face.vertices)
+            area, coordinates = projected_face_1.intersect(projected_face_2)
+            if area > self.area_tolerance:
+                distance = projected_face_1.get_distance(projected_face_2)
+                try:
+                    direction_vector = (other.centroid - self.centroid).normalize()
+                    orientation = direction_vector.project(face.normal).normalize()
+                except VectorWithNansError as e:
+                    logger.warning(
+                        "Orientation vector was not properly computed when computing the intersection between "
+                        f"two elements "
+                        f"({(self.entity.GlobalId, self.entity.is_a(), self.entity.Name) if self.entity else None}"
+                        f", {(other.entity.GlobalId, other.entity.is_a(), other.entity.Name)if other.entity else None}). Error: {e}"  # noqa: E501
+                    )
+                    continue
+                extend_surfaces.append(
+                    ExtendCommonSurface(
+                        distance=distance,
+                        area=area,
+                        orientation=orientation,
+                        main_vertices=face.vertices,
+                        common_vertices=projected_face_1.common_vertices_from_coordinates(
+                            coordinates
+                        ),
+                        polygon=PolygonRing(coordinates=coordinates),
+                    )
+                )
 
         if extend_surfaces:
             if not all(
@@ -168,6 +291,8 @@ class OrientedBoundingBox(BaseShow):
         vertices: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
         entity: Optional[entity_instance] = None,
     ) -> "OrientedBoundingBox":
+        import open3d  # type: ignore
+
         points_ = open3d.utility.Vector3dVector(vertices)
         mobb = open3d.geometry.OrientedBoundingBox.create_from_points_minimal(
             points_, robust=True
@@ -175,31 +300,364 @@ class OrientedBoundingBox(BaseShow):
         height = (mobb.get_max_bound() - mobb.get_min_bound())[
             2
         ]  # assuming that height is the z axis
-        centroid = Point.from_array(mobb.get_center())
-        faces = BoundingBoxFaces.build(np.array(mobb.get_box_points()))
+        return cls.from_box_points(
+            np.array(mobb.get_box_points()),
+            np.array([*mobb.get_center(), mobb.volume(), height]),
+            entity,
+        )
+
+    @classmethod
+    def from_box_points(
+        cls,
+        box_points: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        properties: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        entity: Optional[entity_instance] = None,
+        normals: Optional[np.ndarray[tuple[int, ...], np.dtype[np.float64]]] = None,
+    ) -> "OrientedBoundingBox":
+        """Build a box from its 8 corners and [x, y, z, volume, height].
+
+        The normals of the faces are computed unless given.
+        """
         return cls(
-            faces=faces,
-            centroid=centroid,
-            volume=mobb.volume(),
-            height=height,
+            faces=(
+                BoundingBoxFaces.build(box_points)
+                if normals is None
+                else BoundingBoxFaces.from_normals(box_points, normals)
+            ),
+            centroid=Point.from_array(properties[:3]),
+            volume=float(properties[3]),
+            height=float(properties[4]),
             entity=entity,
         )
 
+    def to_box_points(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self.faces.to_box_points()
+
+    def to_properties(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return np.array([*self.centroid.to_array(), self.volume, self.height])
+
     @classmethod
-    def from_entity(cls, entity: entity_instance) -> "OrientedBoundingBox":
+    def from_entity(
+        cls, entity: entity_instance, shape_cache: Optional["ShapeCache"] = None
+    ) -> "OrientedBoundingBox":
+        if shape_cache is not None:
+            return shape_cache.get_bounding_box(entity)
         entity_shape = ifcopenshell.geom.create_shape(settings, entity)
         vertices = ifcopenshell.util.shape.get_shape_vertices(
             entity_shape, entity_shape.geometry  # type: ignore
         )
-        vertices_ = Vertices.from_arrays(np.asarray(vertices))
-        try:
-            hull = ConvexHull(vertices_.to_array())
-            vertices_ = Vertices.from_arrays(vertices_.to_array()[hull.vertices])
+        return cls.from_shape_vertices(np.asarray(vertices), entity)
+
+    @classmethod
+    def from_shape_vertices(
+        cls,
+        vertices: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        entity: entity_instance,
+    ) -> "OrientedBoundingBox":
+        return cls.from_hull_vertices(
+            get_convex_hull_vertices(vertices, entity), entity
+        )
+
+    @classmethod
+    def from_hull_vertices(
+        cls,
+        vertices: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        entity: entity_instance,
+    ) -> "OrientedBoundingBox":
+        """Axis aligned box of the vertices, built from its corners without open3d."""
+        return cls.from_box_points(*get_axis_aligned_box(vertices), entity)
+
+
+BOX_ARRAYS = {
+    "corners": (8, 3),
+    "normals": (6, 3),
+    "centroids": (3,),
+    "volumes": (),
+    "heights": (),
+}
+
+
+def get_face_normals(
+    corners: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+    """Normals of the faces of (N, 8, 3) corners, as computed by BoundingBoxFaces.build."""
+    return np.array(
+        [
+            [face.normal.to_array() for face in BoundingBoxFaces.build(box).faces]
+            for box in corners
+        ]
+    ).reshape(-1, 6, 3)
+
+
+def have_candidate_face_pairs(
+    boxes: List[OrientedBoundingBox], pairs: List[Tuple[int, int]]
+) -> np.ndarray[tuple[int, ...], np.dtype[np.bool_]]:
+    """Whether candidate_face_pairs finds a face pair for each (i, j) pair of boxes.
+
+    The screen of candidate_face_pairs is run on all pairs at once, in chunks
+    of SCREEN_CHUNK_SIZE pairs. intersect_faces finds no common surface for
+    the pairs screened out. Pairs whose first box has faces whose coordinate
+    systems cannot be inverted are kept.
+    """
+    normals = np.array([box.normals() for box in boxes]).reshape(-1, 6, 3)
+    box_points = np.array([box.to_box_points() for box in boxes]).reshape(-1, 8, 3)
+    area_tolerances = np.array([box.area_tolerance for box in boxes])
+    frames = np.array(
+        [
+            [face.vertices.get_coordinates().to_array() for face in box.faces.faces]
+            for box in boxes
+        ]
+    ).reshape(-1, 6, 3, 3)
+    invertible = (np.linalg.det(frames) != 0).all(axis=1)
+    inverses = np.zeros_like(frames)
+    inverses[invertible] = np.linalg.inv(frames[invertible])
+    faces = np.array(BOX_FACES)
+    projected = np.einsum("npc,nicd->nipd", box_points, inverses)
+    face_points = projected[:, np.arange(len(faces))[:, np.newaxis], faces, :2]
+    lower, upper = face_points.min(axis=2), face_points.max(axis=2)
+    pairs_ = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    found = np.ones(len(pairs_), dtype=bool)
+    for start in range(0, len(pairs_), SCREEN_CHUNK_SIZE):
+        first, second = pairs_[start : start + SCREEN_CHUNK_SIZE].T
+        cross_products = np.round(
+            np.cross(normals[first][:, :, np.newaxis], normals[second][:, np.newaxis]),
+            10,
+        )
+        parallel = (np.abs(cross_products) < NULL_VECTOR_TOLERANCE).all(axis=-1)
+        other_projected = np.einsum(
+            "kpc,kicd->kipd", box_points[second], inverses[first]
+        )
+        other_face_points = other_projected[:, :, faces, :2]
+        overlap = np.clip(
+            np.minimum(upper[first][:, :, np.newaxis], other_face_points.max(axis=3))
+            - np.maximum(lower[first][:, :, np.newaxis], other_face_points.min(axis=3))
+            + 2 * PROJECTION_PADDING,
+            0,
+            None,
+        ).prod(axis=-1)
+        found[start : start + SCREEN_CHUNK_SIZE] = (
+            parallel & (overlap > area_tolerances[first][:, np.newaxis, np.newaxis])
+        ).any(axis=(1, 2)) | ~invertible[first]
+    return found
+
+
+class BoundingBoxStore(BaseModelConfig):
+    """Oriented bounding boxes packed in arrays and indexed by entity id.
+
+    OrientedBoundingBox instances are built from the rows of an entity when
+    it is requested. They are memoised per row only while they are in use
+    elsewhere, the arrays are the only storage.
+    """
+
+    indexes: Dict[int, int] = Field(default_factory=dict)
+    _buffers: Dict[str, np.ndarray[tuple[int, ...], np.dtype[np.float64]]] = (
+        PrivateAttr(
+            default_factory=lambda: {
+                name: np.zeros((0, *shape)) for name, shape in BOX_ARRAYS.items()
+            }
+        )
+    )
+    _boxes: "WeakValueDictionary[int, OrientedBoundingBox]" = PrivateAttr(
+        default_factory=WeakValueDictionary
+    )
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        state = super().__getstate__()
+        private = {
+            name: value
+            for name, value in state["__pydantic_private__"].items()
+            if name != "_boxes"
+        }
+        return {**state, "__pydantic_private__": private}
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        self._boxes = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.indexes
+
+    def _array(self, name: str) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self._buffers[name][: len(self)]
+
+    @property
+    def corners(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self._array("corners")
+
+    @property
+    def normals(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self._array("normals")
+
+    @property
+    def centroids(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self._array("centroids")
+
+    @property
+    def volumes(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self._array("volumes")
+
+    @property
+    def heights(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return self._array("heights")
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._buffers["volumes"])
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 16)
+        for name, buffer in self._buffers.items():
+            resized = np.zeros((capacity, *buffer.shape[1:]))
+            resized[: len(self)] = buffer[: len(self)]
+            self._buffers[name] = resized
+
+    def add_arrays(
+        self,
+        entity_ids: List[int],
+        corners: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        properties: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+        normals: Optional[np.ndarray[tuple[int, ...], np.dtype[np.float64]]] = None,
+    ) -> None:
+        """Add boxes from (N, 8, 3) corners and (N, 5) [x, y, z, volume, height].
+
+        The (N, 6, 3) normals of the faces are computed unless given.
+        """
+        rows = [i for i, id_ in enumerate(entity_ids) if id_ not in self.indexes]
+        if len(rows) != len(entity_ids):
+            entity_ids = [entity_ids[row] for row in rows]
+            corners, properties = corners[rows], properties[rows]
+            normals = None if normals is None else normals[rows]
+        if normals is None:
+            normals = get_face_normals(corners)
+        start = len(self)
+        stop = start + len(entity_ids)
+        self._reserve(stop)
+        self._buffers["corners"][start:stop] = corners
+        self._buffers["normals"][start:stop] = normals
+        self._buffers["centroids"][start:stop] = properties[:, :3]
+        self._buffers["volumes"][start:stop] = properties[:, 3]
+        self._buffers["heights"][start:stop] = properties[:, 4]
+        self.indexes.update({id_: start + i for i, id_ in enumerate(entity_ids)})
+
+    def add_bounding_box(self, bounding_box: OrientedBoundingBox) -> None:
+        if bounding_box.entity is None:
+            return
+        entity_id = bounding_box.entity.id()
+        self.add_arrays(
+            [entity_id],
+            bounding_box.to_box_points()[np.newaxis],
+            bounding_box.to_properties()[np.newaxis],
+            bounding_box.normals()[np.newaxis],
+        )
+
+    def get(self, entity: entity_instance) -> OrientedBoundingBox:
+        index = self.indexes[entity.id()]
+        bounding_box = self._boxes.get(index)
+        if bounding_box is None:
+            bounding_box = OrientedBoundingBox.from_box_points(
+                self.corners[index],
+                np.array(
+                    [
+                        *self.centroids[index],
+                        self.volumes[index],
+                        self.heights[index],
+                    ]
+                ),
+                entity,
+                self.normals[index],
+            )
+            self._boxes[index] = bounding_box
+        return bounding_box
+
+    def entity_ids(self) -> List[int]:
+        return list(self.indexes)
+
+    def properties(self) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        return np.column_stack([self.centroids, self.volumes, self.heights])
+
+    def _corners(
+        self, entity_ids: Optional[List[int]]
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        if entity_ids is None:
+            return self.corners
+        return self.corners[[self.indexes[entity_id] for entity_id in entity_ids]]
+
+    def min_bounds(
+        self, entity_ids: Optional[List[int]] = None
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        """Lower corners of the boxes of entity_ids, of all boxes by default."""
+        return self._corners(entity_ids).min(axis=1)  # type: ignore
+
+    def max_bounds(
+        self, entity_ids: Optional[List[int]] = None
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        """Upper corners of the boxes of entity_ids, of all boxes by default."""
+        return self._corners(entity_ids).max(axis=1)  # type: ignore
+
+
+class ShapeCache(BaseModelConfig):
+    vertices: Dict[int, np.ndarray[tuple[int, ...], np.dtype[np.float64]]] = Field(
+        default_factory=dict
+    )
+    hulls: Dict[int, np.ndarray[tuple[int, ...], np.dtype[np.float64]]] = Field(
+        default_factory=dict
+    )
+    footprint_areas: Dict[int, float] = Field(default_factory=dict)
+    volumes: Dict[int, float] = Field(default_factory=dict)
+    bounding_boxes: BoundingBoxStore = Field(default_factory=BoundingBoxStore)
+    geometry_profile: GeometryProfile = "default"
+
+    @property
+    def settings(self) -> ifcopenshell.geom.settings:
+        return get_settings(self.geometry_profile)
+
+    def add_shape(self, entity_shape: Any) -> None:  # noqa: ANN401
+        entity_id = int(entity_shape.id)
+        self.vertices[entity_id] = np.asarray(
+            ifcopenshell.util.shape.get_shape_vertices(
+                entity_shape, entity_shape.geometry
+            )
+        )
+        if entity_shape.type == "IfcSpace":
+            self.footprint_areas[entity_id] = (
+                ifcopenshell.util.shape.get_footprint_area(entity_shape.geometry)
+            )
+            self.volumes[entity_id] = ifcopenshell.util.shape.get_volume(
+                entity_shape.geometry
+            )
+
+    def _add_entity(self, entity: entity_instance) -> None:
+        logger.debug(f"Shape of {entity.GlobalId} ({entity.is_a()}) not cached.")
+        self.add_shape(ifcopenshell.geom.create_shape(self.settings, entity))
+
+    def get_vertices(
+        self, entity: entity_instance
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        if entity.id() not in self.vertices:
+            self._add_entity(entity)
+        return self.vertices[entity.id()]
+
+    def get_footprint_area_and_volume(
+        self, entity: entity_instance
+    ) -> Tuple[float, float]:
+        if entity.id() not in self.footprint_areas:
+            self._add_entity(entity)
+        return self.footprint_areas[entity.id()], self.volumes[entity.id()]
+
+    def get_hull(
+        self, entity: entity_instance
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+        if entity.id() not in self.hulls:
+            self.hulls[entity.id()] = get_convex_hull_vertices(
+                self.get_vertices(entity), entity
+            )
+        return self.hulls[entity.id()]
 
-        except QhullError:
-            logger.error(
-                f"Convex hull failed for {entity.GlobalId} ({entity.is_a()}).... Continuing without it."
+    def get_bounding_box(self, entity: entity_instance) -> OrientedBoundingBox:
+        if entity.id() not in self.bounding_boxes:
+            self.bounding_boxes.add_bounding_box(
+                OrientedBoundingBox.from_hull_vertices(self.get_hull(entity), entity)
             )
-        points_ = open3d.utility.Vector3dVector(vertices_.to_array())
-        aab = open3d.geometry.AxisAlignedBoundingBox.create_from_points(points_)
-        return cls.from_vertices(aab.get_box_points(), entity)
+        return self.bounding_boxes.get(entity)
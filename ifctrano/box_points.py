@@ -0,0 +1,34 @@
+"""Axis aligned bounding boxes of point sets given as their 8 corners.
+
+Corners are ordered and computed as by open3d's AxisAlignedBoundingBox
+get_box_points, the order the faces of ifctrano.bounding_box.BOX_FACES are
+built on, so that the boxes are the same bit for bit.
+"""
+
+from typing import Any, Tuple
+
+import numpy as np
+
+FloatArray = np.ndarray[Any, np.dtype[np.float64]]
+
+AXES = np.eye(3)
+
+
+def get_box_points(lower: FloatArray, upper: FloatArray) -> FloatArray:
+    """Corners of the box spanning lower to upper."""
+    extent = (upper - lower) * AXES
+    return np.concatenate([lower[None], lower + extent, upper[None], upper - extent])
+
+
+def get_axis_aligned_box_points(vertices: FloatArray) -> FloatArray:
+    return get_axis_aligned_box(vertices)[0]
+
+
+def get_axis_aligned_box(vertices: FloatArray) -> Tuple[FloatArray, FloatArray]:
+    """Corners and [x, y, z, volume, height] of the axis aligned box of vertices."""
+    vertices_ = np.asarray(vertices, dtype=np.float64)[:, :3]
+    lower, upper = vertices_.min(axis=0), vertices_.max(axis=0)
+    extent = upper - lower
+    return get_box_points(lower, upper), np.array(
+        [*(lower + upper) / 2, np.prod(extent), extent[2]]
+    )
@@ -1,20 +1,55 @@
 import logging
 import re
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple, Any, Optional, Set, Dict
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Tuple,
+    Any,
+    Optional,
+    Set,
+    Dict,
+    Iterator,
+    Callable,
+    DefaultDict,
+)
 
 import ifcopenshell
+import ifcopenshell.geom
+import numpy as np
 import yaml
 from ifcopenshell import file, entity_instance
-from pydantic import validate_call, Field, model_validator, field_validator
+from pydantic import (
+    validate_call,
+    Field,
+    model_validator,
+    field_validator,
+    BaseModel,
+)
 from trano.elements import InternalElement  # type: ignore
 from trano.elements.envelope import SpaceTilt  # type: ignore
 from trano.elements.library.library import Library  # type: ignore
 from trano.elements.types import Tilt  # type: ignore
 from trano.topology import Network  # type: ignore
-from vedo import Line  # type: ignore
 
-from ifctrano.base import BaseModelConfig, Libraries, Vector, BaseShow, CommonSurface
+from ifctrano.base import (
+    BaseModelConfig,
+    Libraries,
+    Vector,
+    BaseShow,
+    CommonSurface,
+    CLASH_CLEARANCE,
+    FloatArray,
+    DetachedEntity,
+    Entity,
+    GeometryProfile,
+)
+from ifctrano.bounding_box import ShapeCache, have_candidate_face_pairs
+from ifctrano.fingerprint import changed_global_ids, get_fingerprints
+from ifctrano.geometry_cache import GeometryCache
 from ifctrano.exceptions import (
     IfcFileNotFoundError,
     NoIfcSpaceFoundError,
@@ -22,17 +57,28 @@ from ifctrano.exceptions import (
 )
 from ifctrano.space_boundary import (
     SpaceBoundaries,
+    SpaceBoundary,
     initialize_tree,
+    add_shapes,
     Space,
+    get_space_candidates,
 )
+from ifctrano.tracing import get_tracer, span, traced, tracing, TraceEvent
+from ifctrano.utils import get_building_elements
 from ifctrano.construction import (
     Constructions,
     default_construction,
     default_internal_construction,
 )
 
+if TYPE_CHECKING:
+    from vedo import Line  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+Adjacency = Dict[Tuple[str, str], List[Tuple[int, int, int]]]
+MAX_CHUNK_SIZE = 32
+
 
 def get_spaces(ifcopenshell_file: file) -> List[entity_instance]:
     return ifcopenshell_file.by_type("IfcSpace")
@@ -40,7 +86,7 @@ def get_spaces(ifcopenshell_file: file) -> List[entity_instance]:
 
 class IfcInternalElement(BaseModelConfig):
     spaces: List[Space]
-    element: entity_instance
+    element: Entity
     area: float
     common_surface: CommonSurface
 
@@ -57,14 +103,14 @@ class IfcInternalElement(BaseModelConfig):
         return hash(self) == hash(other)
 
     def description(self) -> Tuple[Any, Any, str, float]:
-        return (
+        return (  # type: ignore
             *sorted([space.global_id for space in self.spaces]),
             self.element.GlobalId,
             self.element.is_a(),
             self.area,
         )
 
-    def lines(self) -> List[Line]:
+    def lines(self) -> List["Line"]:
         lines = []
         if self.common_surface:
             lines += self.common_surface.lines()
@@ -83,72 +129,463 @@ class InternalElements(BaseShow):
         )
 
 
-def get_internal_elements(space1_boundaries: List[SpaceBoundaries]) -> InternalElements:
+def get_element_index(
+    space_boundaries: List[SpaceBoundaries],
+) -> DefaultDict[str, List[Tuple[int, int]]]:
+    """Space and boundary indexes of the boundaries referencing each element GlobalId."""
+    element_index: DefaultDict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for index, space_boundaries_ in enumerate(space_boundaries):
+        for boundary_index, boundary in enumerate(space_boundaries_.boundaries):
+            element_index[boundary.entity.GlobalId].append((index, boundary_index))
+    return element_index
+
+
+def _get_orientation(boundary: SpaceBoundary) -> FloatArray:
+    if not boundary.common_surface:
+        return np.zeros(3)
+    return boundary.common_surface.orientation.to_array()
+
+
+def get_space_pairs(
+    space_boundaries: List[SpaceBoundaries],
+) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+    """Boundary pairs that can be the two sides of an element, by ordered pair of spaces.
+
+    The element index is built once and only the elements referenced by two
+    or more boundaries are walked. Two boundaries of an element are paired
+    when their common surfaces face opposite directions, and spaces without
+    such a pair of boundaries are not paired.
+    """
+    space_pairs: DefaultDict[Tuple[int, int], List[Tuple[int, int]]] = defaultdict(list)
+    for references in get_element_index(space_boundaries).values():
+        if len(references) < 2:
+            continue
+        orientations = np.array(
+            [
+                _get_orientation(space_boundaries[index].boundaries[boundary_index])
+                for index, boundary_index in references
+            ]
+        )
+        for first, second in np.argwhere(orientations @ orientations.T < 0).tolist():
+            index, boundary_index = references[first]
+            other, other_boundary_index = references[second]
+            space_pairs[(index, other)].append((boundary_index, other_boundary_index))
+    return {
+        space_pair: sorted(boundary_pairs)
+        for space_pair, boundary_pairs in sorted(space_pairs.items())
+    }
+
+
+def get_space_pair_matches(
+    space_boundaries_1: SpaceBoundaries,
+    space_boundaries_2: SpaceBoundaries,
+    boundary_pairs: List[Tuple[int, int]],
+) -> List[Tuple[int, int, int]]:
+    """Boundaries of two spaces that are the two sides of an internal element.
+
+    boundary_pairs holds the indexes of the boundaries of each space paired
+    by get_space_pairs. Each match holds the indexes of the two boundaries
+    and which of their common surfaces, the smallest, describes the internal
+    element.
+    """
+    space_1 = space_boundaries_1.space
+    space_2 = space_boundaries_2.space
+    common_surface = space_1.bounding_box.intersect_faces(space_2.bounding_box)
+    matches = []
+    for index, other in boundary_pairs:
+        boundary = space_boundaries_1.boundaries[index]
+        boundary_ = space_boundaries_2.boundaries[other]
+        if (
+            common_surface
+            and (
+                boundary.common_surface.orientation * common_surface.orientation
+            ).is_null()
+            and (
+                boundary_.common_surface.orientation * common_surface.orientation
+            ).is_null()
+        ):
+            smallest = int(boundary_.common_surface.area < boundary.common_surface.area)
+            common_surface = [boundary, boundary_][smallest].common_surface
+            matches.append((index, other, smallest))
+    return matches
+
+
+def get_internal_elements(
+    space1_boundaries: List[SpaceBoundaries], adjacency: Optional[Adjacency] = None
+) -> InternalElements:
+    """Internal elements shared by neighbouring spaces.
+
+    Only the pairs of spaces sharing a boundary element are matched, and the
+    pairs whose space boxes have no candidate face pair are screened out at
+    once before any face intersection. The boundaries of the internal
+    elements are removed from the spaces. The matches of the space pairs
+    found in adjacency are reused and the missing ones are added to it.
+    """
+    adjacency = {} if adjacency is None else adjacency
     elements = []
-    seen = set()
-    common_boundaries = []
+    common_boundaries: Dict[int, SpaceBoundary] = {}
+    global_ids = [
+        space_boundaries_.space.global_id for space_boundaries_ in space1_boundaries
+    ]
+    space_pairs = get_space_pairs(space1_boundaries)
+    new_pairs = [
+        (index, other)
+        for index, other in space_pairs
+        if (global_ids[index], global_ids[other]) not in adjacency
+    ]
+    screened = have_candidate_face_pairs(
+        [
+            space_boundaries_.space.bounding_box
+            for space_boundaries_ in space1_boundaries
+        ],
+        new_pairs,
+    )
+    for (index, other), found in zip(new_pairs, screened):
+        adjacency[(global_ids[index], global_ids[other])] = (
+            get_space_pair_matches(
+                space1_boundaries[index],
+                space1_boundaries[other],
+                space_pairs[(index, other)],
+            )
+            if found
+            else []
+        )
+    for index, other in space_pairs:
+        space_boundaries_ = space1_boundaries[index]
+        space_boundaries__ = space1_boundaries[other]
+        space_1 = space_boundaries_.space
+        space_2 = space_boundaries__.space
+        for index_1, index_2, smallest in adjacency[
+            (global_ids[index], global_ids[other])
+        ]:
+            boundary = space_boundaries_.boundaries[index_1]
+            boundary_ = space_boundaries__.boundaries[index_2]
+            common_boundaries.update({id(boundary): boundary, id(boundary_): boundary_})
+            common_surface = [boundary, boundary_][smallest].common_surface
+            common_surface.exterior = False
+            elements.append(
+                IfcInternalElement(
+                    spaces=[space_1, space_2],
+                    element=boundary_.entity,
+                    area=common_surface.area,
+                    common_surface=common_surface,
+                )
+            )
     for space_boundaries_ in space1_boundaries:
-        for space_boundaries__ in space1_boundaries:
-            space_1 = space_boundaries_.space
-            space_2 = space_boundaries__.space
+        space_boundaries_.remove(list(common_boundaries.values()))
+    return InternalElements(elements=list(set(elements)))
 
-            if (
-                space_1.global_id == space_2.global_id
-                and (space_1.global_id, space_2.global_id) in seen
-            ):
-                continue
-            seen.update(
-                {
-                    (space_1.global_id, space_2.global_id),
-                    (space_2.global_id, space_1.global_id),
+
+def _dump_entities(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, entity_instance):
+        return DetachedEntity.from_entity(value)
+    if isinstance(value, dict):
+        return {key: _dump_entities(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_dump_entities(item) for item in value]
+    return value
+
+
+def _load_entities(value: Any, ifc_file: file) -> Any:  # noqa: ANN401
+    if isinstance(value, DetachedEntity):
+        return ifc_file.by_guid(value.global_id)
+    if isinstance(value, dict):
+        return {key: _load_entities(item, ifc_file) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_load_entities(item, ifc_file) for item in value]
+    return value
+
+
+def _replace_entities(
+    value: Any,  # noqa: ANN401
+    replace: Callable[[Entity], Entity],
+    copies: Dict[int, Any],
+) -> Any:  # noqa: ANN401
+    """Copy of the models in value with their entities replaced.
+
+    Models shared in value are copied once and stay shared in the copy.
+    """
+    if isinstance(value, (entity_instance, DetachedEntity)):
+        return replace(value)
+    if isinstance(value, BaseModel):
+        if id(value) not in copies:
+            copies[id(value)] = value.model_copy(
+                update={
+                    name: _replace_entities(getattr(value, name), replace, copies)
+                    for name in type(value).model_fields
                 }
             )
-            common_surface = space_1.bounding_box.intersect_faces(space_2.bounding_box)
-
-            for boundary in space_boundaries_.boundaries:
-                for boundary_ in space_boundaries__.boundaries:
-                    if (
-                        boundary.entity.GlobalId == boundary_.entity.GlobalId
-                        and boundary.common_surface
-                        and boundary_.common_surface
-                        and common_surface
-                        and (
-                            boundary.common_surface.orientation
-                            * common_surface.orientation
-                        ).is_null()
-                        and (
-                            boundary_.common_surface.orientation
-                            * common_surface.orientation
-                        ).is_null()
-                    ) and boundary.common_surface.orientation.dot(
-                        boundary_.common_surface.orientation
-                    ) < 0:
-                        common_boundaries.extend([boundary, boundary_])
-                        common_surface = sorted(
-                            [boundary.common_surface, boundary_.common_surface],
-                            key=lambda s: s.area,
-                        )[0]
-                        common_surface.exterior = False
-                        elements.append(
-                            IfcInternalElement(
-                                spaces=[space_1, space_2],
-                                element=boundary_.entity,
-                                area=common_surface.area,
-                                common_surface=common_surface,
-                            )
+        return copies[id(value)]
+    if isinstance(value, dict):
+        return {
+            key: _replace_entities(item, replace, copies) for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_replace_entities(item, replace, copies) for item in value]
+    return value
+
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_worker(
+    ifc_file_path: Path, shape_cache: ShapeCache, trace: bool
+) -> None:
+    _worker_state.update(
+        ifc_file=ifcopenshell.open(str(ifc_file_path)),
+        shape_cache=shape_cache,
+        trace=trace,
+    )
+
+
+def _space_boundaries_worker(
+    space_candidates: List[Tuple[str, List[str]]],
+) -> Tuple[List[Tuple[Optional[Dict[str, Any]], Optional[str]]], List[TraceEvent]]:
+    """Dumped space boundaries or errors, with the trace events of the chunk."""
+    ifc_file = _worker_state["ifc_file"]
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[str]]] = []
+    with tracing() as tracer:
+        for space_global_id, candidate_global_ids in space_candidates:
+            try:
+                space_boundaries = SpaceBoundaries.from_space_candidates(
+                    ifc_file.by_guid(space_global_id),
+                    [ifc_file.by_guid(global_id) for global_id in candidate_global_ids],
+                    _worker_state["shape_cache"],
+                )
+            except Exception as e:
+                results.append((None, str(e)))
+                continue
+            results.append((_dump_entities(space_boundaries.model_dump()), None))
+    return results, tracer.events if _worker_state["trace"] else []
+
+
+def _iter_space_boundaries(
+    ifc_file: file,
+    candidates: Dict[str, List[entity_instance]],
+    shape_cache: ShapeCache,
+) -> Iterator[SpaceBoundaries]:
+    for space_global_id, elements in candidates.items():
+        space = ifc_file.by_guid(space_global_id)
+        try:
+            space_boundaries = SpaceBoundaries.from_space_candidates(
+                space, elements, shape_cache
+            )
+        except Exception as e:
+            logger.error(f"Cannot process space {space.id()}. Reason {e}")
+            continue
+        yield space_boundaries
+
+
+def _iter_space_boundaries_parallel(
+    ifc_file_path: Path,
+    ifc_file: file,
+    candidates: Dict[str, List[entity_instance]],
+    shape_cache: ShapeCache,
+    workers: int,
+) -> Iterator[SpaceBoundaries]:
+    """Space boundaries computed by workers, yielded in the order of candidates.
+
+    Spaces are sent in chunks and at most two chunks per worker are pending, so
+    that results are yielded as soon as possible and do not pile up.
+    """
+    space_candidates = [
+        (space_global_id, [element.GlobalId for element in elements])
+        for space_global_id, elements in candidates.items()
+    ]
+    chunk_size = max(1, min(len(space_candidates) // (workers * 4), MAX_CHUNK_SIZE))
+    tracer = get_tracer()
+    chunks = iter(
+        [
+            space_candidates[start : start + chunk_size]
+            for start in range(0, len(space_candidates), chunk_size)
+        ]
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(ifc_file_path, shape_cache, tracer is not None),
+    ) as executor:
+        pending = deque(
+            (chunk, executor.submit(_space_boundaries_worker, chunk))
+            for chunk in islice(chunks, workers * 2)
+        )
+        try:
+            while pending:
+                chunk, future = pending.popleft()
+                results, events = future.result()
+                if tracer is not None:
+                    tracer.merge(events)
+                for next_chunk in islice(chunks, 1):
+                    pending.append(
+                        (
+                            next_chunk,
+                            executor.submit(_space_boundaries_worker, next_chunk),
                         )
-    for space_boundaries_ in space1_boundaries:
-        space_boundaries_.remove(common_boundaries)
-    return InternalElements(elements=list(set(elements)))
+                    )
+                for (space_global_id, _), (data, error) in zip(chunk, results):
+                    if data is None:
+                        space = ifc_file.by_guid(space_global_id)
+                        logger.error(
+                            f"Cannot process space {space.id()}. Reason {error}"
+                        )
+                        continue
+                    space_boundaries = SpaceBoundaries.model_validate(
+                        _load_entities(data, ifc_file)
+                    )
+                    shape_cache.bounding_boxes.add_bounding_box(
+                        space_boundaries.space.bounding_box
+                    )
+                    for boundary in space_boundaries.boundaries:
+                        shape_cache.bounding_boxes.add_bounding_box(
+                            boundary.bounding_box
+                        )
+                    yield space_boundaries
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+class SpaceBoundariesSource(BaseModelConfig):
+    """Spaces of an IFC file with the elements that can bound them."""
+
+    ifc_file_path: Path
+    ifc_file: file
+    shape_cache: ShapeCache
+    candidates: Dict[str, List[entity_instance]]
+
+    @classmethod
+    def from_ifc(
+        cls,
+        ifc_file_path: Path,
+        selected_spaces_global_id: Optional[List[str]] = None,
+        geometry_cache: Optional[GeometryCache] = None,
+        geometry_profile: GeometryProfile = "default",
+    ) -> "SpaceBoundariesSource":
+        selected_spaces_global_id = selected_spaces_global_id or []
+        if not ifc_file_path.exists():
+            raise IfcFileNotFoundError(
+                f"File specified {ifc_file_path} does not exist."
+            )
+        with span("ifcopenshell.open", path=str(ifc_file_path)):
+            ifc_file = ifcopenshell.open(str(ifc_file_path))
+        spaces = get_spaces(ifc_file)
+        if selected_spaces_global_id:
+            spaces = [
+                space for space in spaces if space.GlobalId in selected_spaces_global_id
+            ]
+        if not spaces:
+            raise NoIfcSpaceFoundError("No IfcSpace found in the file.")
+        shape_cache = ShapeCache(geometry_profile=geometry_profile)
+        with span("GeometryCache.load") as attributes:
+            candidates = (
+                geometry_cache.load(ifc_file_path, ifc_file, shape_cache, spaces)
+                if geometry_cache
+                else None
+            )
+            attributes["hit"] = candidates is not None
+        if candidates is None:
+            tree = initialize_tree(ifc_file, shape_cache)
+            candidates = get_space_candidates(ifc_file, tree, spaces)
+        return cls(
+            ifc_file_path=ifc_file_path,
+            ifc_file=ifc_file,
+            shape_cache=shape_cache,
+            candidates=candidates,
+        )
+
+    def iter_space_boundaries(self, workers: int = 1) -> Iterator[SpaceBoundaries]:
+        if workers > 1:
+            return _iter_space_boundaries_parallel(
+                self.ifc_file_path,
+                self.ifc_file,
+                self.candidates,
+                self.shape_cache,
+                workers,
+            )
+        return _iter_space_boundaries(self.ifc_file, self.candidates, self.shape_cache)
+
+    def save(self, geometry_cache: GeometryCache) -> None:
+        geometry_cache.save(
+            self.ifc_file_path, self.ifc_file, self.shape_cache, self.candidates
+        )
+
+
+def iter_space_boundaries(
+    ifc_file_path: Path,
+    selected_spaces_global_id: Optional[List[str]] = None,
+    workers: int = 1,
+    geometry_cache: Optional[GeometryCache] = None,
+    geometry_profile: GeometryProfile = "default",
+) -> Iterator[SpaceBoundaries]:
+    """Yield the boundaries of each space of the IFC file as soon as computed.
+
+    The boundaries are those found before adjacency, internal elements are
+    only resolved by Building. The geometry cache is saved once all spaces
+    are processed.
+    """
+    source = SpaceBoundariesSource.from_ifc(
+        ifc_file_path, selected_spaces_global_id, geometry_cache, geometry_profile
+    )
+    yield from source.iter_space_boundaries(workers)
+    if geometry_cache:
+        source.save(geometry_cache)
+
+
+def get_bounds(
+    entities: List[entity_instance], shape_cache: ShapeCache
+) -> Dict[str, FloatArray]:
+    """Lower and upper corners of the tessellation of each entity."""
+    bounds = {}
+    for entity in entities:
+        vertices = shape_cache.vertices.get(entity.id())
+        if vertices is not None and len(vertices):
+            bounds[entity.GlobalId] = np.array(
+                [vertices.min(axis=0), vertices.max(axis=0)]
+            )
+    return bounds
+
+
+def get_close_global_ids(
+    bounds: Dict[str, FloatArray], other_bounds: Dict[str, FloatArray]
+) -> Set[str]:
+    """GlobalIds in bounds within the clash clearance of any bounds in other_bounds."""
+    if not bounds or not other_bounds:
+        return set()
+    global_ids = list(bounds)
+    boxes = np.array(list(bounds.values()))[:, np.newaxis]
+    other_boxes = np.array(list(other_bounds.values()))[np.newaxis]
+    close = np.all(
+        (boxes[..., 0, :] - CLASH_CLEARANCE <= other_boxes[..., 1, :])
+        & (other_boxes[..., 0, :] <= boxes[..., 1, :] + CLASH_CLEARANCE),
+        axis=-1,
+    ).any(axis=1)
+    return {global_ids[index] for index in np.flatnonzero(close)}
+
+
+class BuildingState(BaseModelConfig):
+    """Intermediate results kept to update a building from a new IFC revision.
+
+    space_boundaries holds the boundaries of each space before the internal
+    ones are removed and adjacency the matches of each pair of spaces.
+    Fingerprints are only computed when needed.
+    """
+
+    geometry_profile: GeometryProfile = "default"
+    fingerprints: Dict[str, str] = Field(default_factory=dict)
+    candidates: Dict[str, List[str]] = Field(default_factory=dict)
+    bounds: Dict[str, FloatArray] = Field(default_factory=dict)
+    space_boundaries: Dict[str, SpaceBoundaries] = Field(default_factory=dict)
+    adjacency: Adjacency = Field(default_factory=dict)
 
 
 class Building(BaseShow):
     name: str
     space_boundaries: List[SpaceBoundaries]
-    ifc_file: file
+    ifc_file: Optional[file] = None
     parent_folder: Path
     internal_elements: InternalElements = Field(default_factory=InternalElements)
     constructions: Constructions
+    state: BuildingState = Field(default_factory=BuildingState)
 
     def get_boundaries(self, space_id: str) -> SpaceBoundaries:
         return next(
@@ -158,7 +595,7 @@ class Building(BaseShow):
     def description(self) -> list[list[tuple[float, tuple[float, ...], Any, str]]]:
         return sorted([sorted(b.description()) for b in self.space_boundaries])
 
-    def lines(self) -> List[Line]:
+    def lines(self) -> List["Line"]:
         lines = []
         for space_boundaries_ in [
             *self.space_boundaries,
@@ -175,53 +612,250 @@ class Building(BaseShow):
         return name.lower()
 
     @classmethod
-    def from_ifc(
-        cls, ifc_file_path: Path, selected_spaces_global_id: Optional[List[str]] = None
+    @traced("Building.from_ifc")
+    def from_ifc(  # noqa: PLR0913
+        cls,
+        ifc_file_path: Path,
+        selected_spaces_global_id: Optional[List[str]] = None,
+        workers: int = 1,
+        geometry_cache: Optional[GeometryCache] = None,
+        geometry_profile: GeometryProfile = "default",
     ) -> "Building":
+        source = SpaceBoundariesSource.from_ifc(
+            ifc_file_path, selected_spaces_global_id, geometry_cache, geometry_profile
+        )
+        ifc_file = source.ifc_file
+        candidates = source.candidates
+        constructions = Constructions.from_ifc(ifc_file)
+        space_boundaries = list(source.iter_space_boundaries(workers))
+        if geometry_cache:
+            source.save(geometry_cache)
+        if not space_boundaries:
+            raise NoSpaceBoundariesError("No valid space boundaries found.")
+
+        return cls(
+            space_boundaries=space_boundaries,
+            ifc_file=ifc_file,
+            parent_folder=ifc_file_path.parent,
+            name=ifc_file_path.stem,
+            constructions=constructions,
+            state=BuildingState(
+                geometry_profile=geometry_profile,
+                candidates={
+                    space_global_id: [element.GlobalId for element in elements]
+                    for space_global_id, elements in candidates.items()
+                },
+                bounds=get_bounds(
+                    [*get_spaces(ifc_file), *get_building_elements(ifc_file)],
+                    source.shape_cache,
+                ),
+            ),
+        )
+
+    @classmethod
+    @traced("Building.update_from_ifc")
+    def update_from_ifc(
+        cls,
+        ifc_file_path: Path,
+        previous: "Building",
+        selected_spaces_global_id: Optional[List[str]] = None,
+    ) -> "Building":
+        """Building of a new revision of the IFC file previous was created from.
+
+        Spaces and elements are compared through their fingerprints. Only the
+        spaces that changed or are close to an element that changed are
+        processed again, and only the adjacency of their pairs is recomputed.
+        The other spaces reuse the boundaries of previous.
+        """
         selected_spaces_global_id = selected_spaces_global_id or []
         if not ifc_file_path.exists():
             raise IfcFileNotFoundError(
                 f"File specified {ifc_file_path} does not exist."
             )
-        ifc_file = ifcopenshell.open(str(ifc_file_path))
-        tree = initialize_tree(ifc_file)
+        with span("ifcopenshell.open", path=str(ifc_file_path)):
+            ifc_file = ifcopenshell.open(str(ifc_file_path))
         spaces = get_spaces(ifc_file)
+        elements = get_building_elements(ifc_file)
         constructions = Constructions.from_ifc(ifc_file)
+        with span("get_fingerprints") as attributes:
+            fingerprints = get_fingerprints([*spaces, *elements])
+            changed = changed_global_ids(previous.entity_fingerprints(), fingerprints)
+            attributes["changed"] = len(changed)
         if selected_spaces_global_id:
             spaces = [
                 space for space in spaces if space.GlobalId in selected_spaces_global_id
             ]
         if not spaces:
             raise NoIfcSpaceFoundError("No IfcSpace found in the file.")
-        space_boundaries = []
-        for space in spaces:
-            try:
-                space_boundaries.append(
-                    SpaceBoundaries.from_space_entity(ifc_file, tree, space)
-                )
-            except Exception as e:  # noqa: PERF203
-                logger.error(f"Cannot process space {space.id()}. Reason {e}")
-                continue
+        geometry_profile = previous.state.geometry_profile
+        shape_cache = ShapeCache(geometry_profile=geometry_profile)
+        tree = ifcopenshell.geom.tree()
+        changed_entities = [
+            entity for entity in [*spaces, *elements] if entity.GlobalId in changed
+        ]
+        with span("add_shapes", entities=len(changed_entities)):
+            add_shapes(tree, ifc_file, shape_cache, changed_entities)
+        changed_bounds = get_bounds(changed_entities, shape_cache)
+        bounds = {
+            global_id: bounds_
+            for global_id, bounds_ in previous.state.bounds.items()
+            if global_id not in changed
+        } | changed_bounds
+        close_spaces = get_close_global_ids(
+            {
+                space.GlobalId: bounds[space.GlobalId]
+                for space in spaces
+                if space.GlobalId in bounds
+            },
+            changed_bounds,
+        )
+        affected_spaces = [
+            space
+            for space in spaces
+            if space.GlobalId not in previous.state.space_boundaries
+            or space.GlobalId in changed
+            or space.GlobalId in close_spaces
+            or any(
+                global_id in changed
+                for global_id in previous.state.candidates.get(space.GlobalId, [])
+            )
+        ]
+        affected_global_ids = {space.GlobalId for space in affected_spaces}
+        close_elements = get_close_global_ids(
+            {
+                element.GlobalId: bounds[element.GlobalId]
+                for element in elements
+                if element.GlobalId in bounds
+            },
+            {
+                global_id: bounds[global_id]
+                for global_id in affected_global_ids
+                if global_id in bounds
+            },
+        )
+        unchanged_entities = [
+            entity
+            for entity in [*affected_spaces, *elements]
+            if entity.GlobalId not in changed
+            and (
+                entity.GlobalId in affected_global_ids
+                or entity.GlobalId in close_elements
+            )
+        ]
+        with span("add_shapes", entities=len(unchanged_entities)):
+            add_shapes(tree, ifc_file, shape_cache, unchanged_entities)
+        candidates = get_space_candidates(ifc_file, tree, affected_spaces)
+        space_boundaries_ = {
+            space_boundaries.space.global_id: space_boundaries
+            for space_boundaries in _iter_space_boundaries(
+                ifc_file, candidates, shape_cache
+            )
+        } | {
+            space.GlobalId: _replace_entities(
+                previous.state.space_boundaries[space.GlobalId],
+                lambda entity: ifc_file.by_guid(entity.GlobalId),
+                {},
+            )
+            for space in spaces
+            if space.GlobalId not in affected_global_ids
+        }
+        space_boundaries = [
+            space_boundaries_[space.GlobalId]
+            for space in spaces
+            if space.GlobalId in space_boundaries_
+        ]
         if not space_boundaries:
             raise NoSpaceBoundariesError("No valid space boundaries found.")
-
+        logger.info(f"Processed {len(affected_spaces)} of {len(spaces)} spaces again.")
         return cls(
             space_boundaries=space_boundaries,
             ifc_file=ifc_file,
             parent_folder=ifc_file_path.parent,
             name=ifc_file_path.stem,
             constructions=constructions,
+            state=BuildingState(
+                geometry_profile=geometry_profile,
+                fingerprints=fingerprints,
+                candidates={
+                    space.GlobalId: previous.state.candidates.get(space.GlobalId, [])
+                    for space in spaces
+                    if space.GlobalId not in affected_global_ids
+                }
+                | {
+                    space_global_id: [element.GlobalId for element in elements_]
+                    for space_global_id, elements_ in candidates.items()
+                },
+                bounds=bounds,
+                adjacency={
+                    key: matches
+                    for key, matches in previous.state.adjacency.items()
+                    if not affected_global_ids.intersection(key)
+                },
+            ),
+        )
+
+    def entity_fingerprints(self) -> Dict[str, str]:
+        if not self.state.fingerprints and self.ifc_file is not None:
+            self.state.fingerprints = get_fingerprints(
+                [*get_spaces(self.ifc_file), *get_building_elements(self.ifc_file)]
+            )
+        return self.state.fingerprints
+
+    def detach(self) -> "Building":
+        """Copy of the building that no longer references the IFC file.
+
+        Entities are replaced by DetachedEntity, which keeps their GlobalId,
+        class, name and construction. The copy can be pickled, converted and
+        updated from a new revision once the IFC file is released.
+        """
+        fingerprints = self.entity_fingerprints()
+        detached: Dict[str, DetachedEntity] = {}
+
+        def detach_entity(entity: Entity) -> DetachedEntity:
+            if entity.GlobalId not in detached:
+                detached[entity.GlobalId] = DetachedEntity.from_entity(
+                    entity,
+                    (
+                        None
+                        if entity.is_a() == "IfcSpace"
+                        else self.constructions.get_construction_id(entity)
+                    ),
+                )
+            return detached[entity.GlobalId]
+
+        copies: Dict[int, Any] = {}
+        return self.model_copy(
+            update={
+                "ifc_file": None,
+                "space_boundaries": _replace_entities(
+                    self.space_boundaries, detach_entity, copies
+                ),
+                "internal_elements": _replace_entities(
+                    self.internal_elements, detach_entity, copies
+                ),
+                "state": _replace_entities(
+                    self.state, detach_entity, copies
+                ).model_copy(update={"fingerprints": fingerprints}),
+            }
         )
 
     @model_validator(mode="after")
     def _validator(self) -> "Building":
-        self.internal_elements = self.get_adjacency()
+        self.state.space_boundaries = {
+            space_boundaries.space.global_id: space_boundaries.model_copy()
+            for space_boundaries in self.space_boundaries
+        }
+        with span("get_internal_elements", spaces=len(self.space_boundaries)):
+            self.internal_elements = get_internal_elements(
+                self.space_boundaries, self.state.adjacency
+            )
         return self
 
     def get_adjacency(self) -> InternalElements:
         return get_internal_elements(self.space_boundaries)
 
     @validate_call
+    @traced("Building.to_config")
     def to_config(
         self,
         north_axis: Optional[Vector] = None,
@@ -299,6 +933,7 @@ class Building(BaseShow):
         yaml_path.write_text(yaml_data)
 
     @validate_call
+    @traced("Building.create_network")
     def create_network(
         self,
         library: Libraries = "Buildings",
@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 
 from ifcopenshell import file, entity_instance
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from trano.elements.construction import (  # type: ignore
     Material,
     Layer,
@@ -14,6 +14,8 @@ from trano.elements.construction import (  # type: ignore
     GlassLayer,
     GasLayer,
 )
+from ifctrano.base import DetachedEntity, Entity
+from ifctrano.tracing import traced
 from ifctrano.utils import remove_non_alphanumeric, generate_alphanumeric_uuid
 
 logger = logging.getLogger(__name__)
@@ -96,6 +98,11 @@ class ConstructionId(Construction):  # type: ignore
 
 class Materials(BaseModel):
     materials: List[MaterialId]
+    _indexes: Dict[int, MaterialId] = PrivateAttr(default_factory=dict)
+    _converted: Dict[int, Material] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:  # noqa: ANN401
+        self._indexes = {material.id: material for material in self.materials}
 
     @classmethod
     def from_ifc(cls, ifc_file: file) -> "Materials":
@@ -115,10 +122,12 @@ class Materials(BaseModel):
         return cls(materials=materials)
 
     def get_material(self, id: int) -> Material:
-        for material in self.materials:
-            if material.id == id:
-                return material.to_material()
-        raise ValueError(f"Material {id} not found in materials list.")
+        converted = self._converted
+        if id not in converted:
+            if id not in self._indexes:
+                raise ValueError(f"Material {id} not found in materials list.")
+            converted[id] = self._indexes[id].to_material()
+        return converted[id]
 
 
 def _get_unit_factor(ifc_file: file) -> float:
@@ -132,6 +141,11 @@ def _get_unit_factor(ifc_file: file) -> float:
 
 class Layers(BaseModel):
     layers: List[LayerId]
+    _positions: Dict[int, int] = PrivateAttr(default_factory=dict)
+    _converted: Dict[int, Layer] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:  # noqa: ANN401
+        self._positions = {layer.id: index for index, layer in enumerate(self.layers)}
 
     @classmethod
     def from_ifc(cls, ifc_file: file, materials: Materials) -> "Layers":
@@ -160,14 +174,36 @@ class Layers(BaseModel):
             )
         return cls(layers=layers)
 
+    def get_layer(self, id: int) -> Layer:
+        converted = self._converted
+        if id not in converted:
+            converted[id] = self.layers[self._positions[id]].to_layer()
+        return converted[id]
+
     def from_ids(self, ids: List[int]) -> List[Layer]:
-        return [layer.to_layer() for layer in self.layers if layer.id in ids]
+        """Layers with the given ids, in the order of the layers list."""
+        positions = sorted({self._positions[id] for id in ids if id in self._positions})
+        return [self.get_layer(self.layers[position].id) for position in positions]
 
 
 class Constructions(BaseModel):
+    """Constructions of an IFC file, converted once and indexed by id.
+
+    The construction id of an entity is resolved once per GlobalId.
+    """
+
     constructions: List[ConstructionId]
+    _indexes: Dict[int, ConstructionId] = PrivateAttr(default_factory=dict)
+    _converted: Dict[int, Construction] = PrivateAttr(default_factory=dict)
+    _construction_ids: Dict[str, Optional[int]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:  # noqa: ANN401
+        self._indexes = {
+            construction.id: construction for construction in self.constructions
+        }
 
     @classmethod
+    @traced("Constructions.from_ifc")
     def from_ifc(cls, ifc_file: file) -> "Constructions":
         materials = Materials.from_ifc(ifc_file)
         layers = Layers.from_ifc(ifc_file, materials)
@@ -193,25 +229,34 @@ class Constructions(BaseModel):
         return cls(constructions=constructions)
 
     def get_construction(
-        self, entity: entity_instance, default: Optional[Construction] = None
+        self, entity: Entity, default: Optional[Construction] = None
     ) -> Construction:
-        construction_id = self._get_construction_id(entity)
+        construction_id = self.get_construction_id(entity)
         if construction_id is None:
             logger.warning(
                 f"Construction ID not found for {entity.GlobalId} ({entity.is_a()}). "
                 f"Using default construction."
             )
             return default or default_construction
-        constructions = [
-            construction.to_construction()
-            for construction in self.constructions
-            if construction.id == construction_id
-        ]
-        if not constructions:
-            raise ValueError(f"No construction found for {entity.GlobalId}")
-        return constructions[0]
-
-    def _get_construction_id(self, entity: entity_instance) -> Optional[int]:
+        converted = self._converted
+        if construction_id not in converted:
+            if construction_id not in self._indexes:
+                raise ValueError(f"No construction found for {entity.GlobalId}")
+            converted[construction_id] = self._indexes[
+                construction_id
+            ].to_construction()
+        return converted[construction_id]
+
+    def get_construction_id(self, entity: Entity) -> Optional[int]:
+        construction_ids = self._construction_ids
+        global_id = entity.GlobalId
+        if global_id not in construction_ids:
+            construction_ids[global_id] = self._resolve_construction_id(entity)
+        return construction_ids[global_id]
+
+    def _resolve_construction_id(self, entity: Entity) -> Optional[int]:
+        if isinstance(entity, DetachedEntity):
+            return entity.construction_id
         associates_materials = [
             association
             for association in entity.HasAssociations
@@ -26,9 +26,17 @@ class InvalidLibraryError(Exception):
     pass
 
 
+class InvalidGeometryProfileError(Exception):
+    pass
+
+
 class VectorWithNansError(Exception):
     pass
 
 
 class HasWindowsWithoutWallsError(Exception):
     pass
+
+
+class DetachedEntityError(Exception):
+    pass
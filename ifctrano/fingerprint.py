@@ -0,0 +1,67 @@
+import hashlib
+from typing import Any, Dict, List, Set
+
+from ifcopenshell import entity_instance
+
+
+def _value_digest(value: Any, digests: Dict[int, str]) -> str:  # noqa: ANN401
+    if isinstance(value, entity_instance):
+        return entity_digest(value, digests)
+    if isinstance(value, tuple):
+        return f"({','.join(_value_digest(item, digests) for item in value)})"
+    return repr(value)
+
+
+def entity_digest(entity: entity_instance, digests: Dict[int, str]) -> str:
+    """Digest of an entity and everything it references.
+
+    Step ids are left out so that an unchanged entity keeps its digest when an
+    authoring tool renumbers the file.
+    """
+    entity_id = entity.id()
+    if entity_id and entity_id in digests:
+        return digests[entity_id]
+    hash_ = hashlib.sha1(entity.is_a().encode(), usedforsecurity=False)
+    for index in range(len(entity)):
+        value = entity[index]
+        hash_.update(_value_digest(value, digests).encode())
+    digest = hash_.hexdigest()
+    if entity_id:
+        digests[entity_id] = digest
+    return digest
+
+
+def fingerprint(entity: entity_instance, digests: Dict[int, str]) -> str:
+    """Fingerprint of what drives the boundaries computed for a space or element.
+
+    It covers the class, name, placement and representation of the entity, the
+    openings voiding it and the element it is a part of.
+    """
+    values = [
+        entity.is_a(),
+        entity.Name,
+        entity.ObjectPlacement,
+        entity.Representation,
+        *[
+            opening.RelatedOpeningElement
+            for opening in (entity.HasOpenings if entity.is_a("IfcElement") else ())
+        ],
+        *[decompose.RelatingObject.GlobalId for decompose in entity.Decomposes],
+    ]
+    return hashlib.sha1(
+        _value_digest(tuple(values), digests).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+def get_fingerprints(entities: List[entity_instance]) -> Dict[str, str]:
+    digests: Dict[int, str] = {}
+    return {entity.GlobalId: fingerprint(entity, digests) for entity in entities}
+
+
+def changed_global_ids(previous: Dict[str, str], current: Dict[str, str]) -> Set[str]:
+    """GlobalIds added, removed or modified between two sets of fingerprints."""
+    return {
+        global_id
+        for global_id in previous.keys() | current.keys()
+        if previous.get(global_id) != current.get(global_id)
+    }
@@ -0,0 +1,353 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import ifcopenshell.geom
+import numpy as np
+from ifcopenshell import entity_instance, file
+from pydantic import BaseModel, Field
+
+from ifctrano.base import settings
+from ifctrano.bounding_box import ShapeCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 7
+DEFAULT_CACHE_SIZE = 2 * 1024**3
+ACCESS_MARKER = "accessed"
+METADATA_FILE = "metadata.json"
+PART_PREFIX = "part-"
+TEMPORARY_PREFIX = ".tmp-"
+REMOVED_PREFIX = ".removed-"
+PART_ARRAYS = [
+    "vertices",
+    "vertex_offsets",
+    "hulls",
+    "hull_offsets",
+    "boxes",
+    "box_properties",
+    "box_normals",
+]
+CHUNK_SIZE = 1024**2
+
+Part = Tuple[Dict[str, Any], Dict[str, np.ndarray[Any, Any]]]
+
+
+def _get_setting(settings_: ifcopenshell.geom.settings, name: str) -> Optional[str]:
+    try:
+        return repr(settings_.get(name))  # type: ignore
+    except RuntimeError:
+        return None
+
+
+def settings_description(
+    settings_: ifcopenshell.geom.settings = settings,
+) -> Dict[str, Optional[str]]:
+    return {name: _get_setting(settings_, name) for name in settings_.setting_names()}
+
+
+def file_hash(ifc_file_path: Path) -> str:
+    hash_ = hashlib.sha256()
+    with ifc_file_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hash_.update(chunk)
+    return hash_.hexdigest()
+
+
+def cache_key(
+    ifc_file_path: Path, settings_: ifcopenshell.geom.settings = settings
+) -> str:
+    hash_ = hashlib.sha256()
+    hash_.update(file_hash(ifc_file_path).encode())
+    hash_.update(json.dumps(settings_description(settings_), sort_keys=True).encode())
+    hash_.update(str(CACHE_FORMAT_VERSION).encode())
+    return hash_.hexdigest()
+
+
+def _pack(
+    arrays: List[np.ndarray[tuple[int, ...], np.dtype[np.float64]]],
+) -> tuple[
+    np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+    np.ndarray[tuple[int, ...], np.dtype[np.int64]],
+]:
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(array) for array in arrays])
+    if not arrays:
+        return np.zeros((0, 3)), offsets
+    return np.concatenate(arrays).reshape(-1, 3), offsets
+
+
+def _unpack(
+    values: np.ndarray[tuple[int, ...], np.dtype[np.float64]],
+    offsets: np.ndarray[tuple[int, ...], np.dtype[np.int64]],
+    index: int,
+) -> np.ndarray[tuple[int, ...], np.dtype[np.float64]]:
+    return values[offsets[index] : offsets[index + 1]]
+
+
+class GeometryCache(BaseModel):
+    """On-disk cache of tessellated geometry.
+
+    Entries are keyed by the IFC file content and the geometry settings, and
+    hold per-GlobalId vertices, convex hulls and oriented bounding boxes as
+    memory-mappable numpy arrays. An entry is made of parts that are never
+    modified once written, a run only adds a part with the geometry that is
+    not stored yet. The least recently used entries are evicted once the
+    directory grows beyond max_size bytes.
+    """
+
+    directory: Path
+    max_size: int = Field(default=DEFAULT_CACHE_SIZE, ge=0)
+
+    def entry(self, key: str) -> Path:
+        return self.directory / key
+
+    def load(
+        self,
+        ifc_file_path: Path,
+        ifc_file: file,
+        shape_cache: ShapeCache,
+        spaces: List[entity_instance],
+    ) -> Optional[Dict[str, List[entity_instance]]]:
+        """Fill shape_cache from disk.
+
+        Returns the stored space candidates when they cover all given spaces.
+        """
+        entry = self.entry(cache_key(ifc_file_path, shape_cache.settings))
+        try:
+            parts = _read_parts(entry)
+            if parts:
+                (entry / ACCESS_MARKER).touch()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring corrupted geometry cache entry {entry}: {e}")
+            return None
+        if not parts:
+            return None
+        candidates: Dict[str, List[str]] = {}
+        for metadata, arrays in parts:
+            for index, global_id in enumerate(metadata["global_ids"]):
+                entity_id = ifc_file.by_guid(global_id).id()
+                shape_cache.vertices[entity_id] = _unpack(
+                    arrays["vertices"], arrays["vertex_offsets"], index
+                )
+                hull = _unpack(arrays["hulls"], arrays["hull_offsets"], index)
+                if len(hull):
+                    shape_cache.hulls[entity_id] = hull
+            shape_cache.bounding_boxes.add_arrays(
+                [
+                    ifc_file.by_guid(global_id).id()
+                    for global_id in metadata["box_global_ids"]
+                ],
+                arrays["boxes"],
+                arrays["box_properties"],
+                arrays["box_normals"],
+            )
+            for global_id, (area, volume) in metadata["spaces"].items():
+                entity_id = ifc_file.by_guid(global_id).id()
+                shape_cache.footprint_areas[entity_id] = area
+                shape_cache.volumes[entity_id] = volume
+            candidates |= metadata["candidates"]
+        if any(space.GlobalId not in candidates for space in spaces):
+            return None
+        return {
+            space.GlobalId: [
+                ifc_file.by_guid(global_id) for global_id in candidates[space.GlobalId]
+            ]
+            for space in spaces
+        }
+
+    def save(
+        self,
+        ifc_file_path: Path,
+        ifc_file: file,
+        shape_cache: ShapeCache,
+        candidates: Dict[str, List[entity_instance]],
+    ) -> None:
+        """Add a part with the geometry not stored yet, if any."""
+        key = cache_key(ifc_file_path, shape_cache.settings)
+        entry = self.entry(key)
+        try:
+            stored = _stored_global_ids(_read_parts(entry))
+        except (OSError, ValueError):
+            stored = _stored_global_ids([])
+        global_ids = []
+        vertices = []
+        hulls = []
+        for entity_id, vertices_ in shape_cache.vertices.items():
+            global_id = ifc_file.by_id(entity_id).GlobalId
+            hull = shape_cache.hulls.get(entity_id)
+            if global_id in stored["global_ids"] and (
+                hull is None or global_id in stored["hull_global_ids"]
+            ):
+                continue
+            global_ids.append(global_id)
+            vertices.append(vertices_)
+            hulls.append(np.zeros((0, 3)) if hull is None else hull)
+        bounding_boxes = shape_cache.bounding_boxes
+        box_ids = [
+            entity_id
+            for entity_id in bounding_boxes.entity_ids()
+            if ifc_file.by_id(entity_id).GlobalId not in stored["box_global_ids"]
+        ]
+        metadata = {
+            "file": str(ifc_file_path),
+            "global_ids": global_ids,
+            "box_global_ids": [
+                ifc_file.by_id(entity_id).GlobalId for entity_id in box_ids
+            ],
+            "spaces": {
+                global_id: [area, shape_cache.volumes[entity_id]]
+                for entity_id, area in shape_cache.footprint_areas.items()
+                if (global_id := ifc_file.by_id(entity_id).GlobalId)
+                not in stored["spaces"]
+            },
+            "candidates": {
+                space_global_id: [element.GlobalId for element in elements]
+                for space_global_id, elements in candidates.items()
+                if space_global_id not in stored["candidates"]
+            },
+        }
+        if not any(
+            metadata[name]
+            for name in ["global_ids", "box_global_ids", "spaces", "candidates"]
+        ):
+            return
+        vertices_, vertex_offsets = _pack(vertices)
+        hulls_, hull_offsets = _pack(hulls)
+        rows = [bounding_boxes.indexes[entity_id] for entity_id in box_ids]
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            temporary = Path(tempfile.mkdtemp(dir=entry, prefix=TEMPORARY_PREFIX))
+            try:
+                for name, array in {
+                    "vertices": vertices_,
+                    "vertex_offsets": vertex_offsets,
+                    "hulls": hulls_,
+                    "hull_offsets": hull_offsets,
+                    "boxes": bounding_boxes.corners[rows],
+                    "box_properties": bounding_boxes.properties()[rows],
+                    "box_normals": bounding_boxes.normals[rows],
+                }.items():
+                    np.save(temporary / f"{name}.npy", array)
+                (temporary / METADATA_FILE).write_text(json.dumps(metadata))
+                os.replace(
+                    temporary,
+                    entry / f"{PART_PREFIX}{time.time_ns()}-{uuid.uuid4().hex}",
+                )
+            finally:
+                shutil.rmtree(temporary, ignore_errors=True)
+            (entry / ACCESS_MARKER).touch()
+        except OSError as e:
+            logger.warning(f"Could not save geometry cache entry {entry}: {e}")
+            return
+        self.evict(keep=key)
+
+    def entries(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return [
+            path
+            for path in self.directory.iterdir()
+            if path.is_dir()
+            and not path.name.startswith(".")
+            and (path / ACCESS_MARKER).exists()
+        ]
+
+    def size(self) -> int:
+        return sum(_entry_size(entry) for entry in self.entries())
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        entries = sorted(self.entries(), key=_access_time)
+        sizes = {entry: _entry_size(entry) for entry in entries}
+        total = sum(sizes.values())
+        for entry in entries:
+            if total <= self.max_size:
+                break
+            if entry.name == keep:
+                continue
+            logger.debug(f"Evicting geometry cache entry {entry}.")
+            if _remove_entry(entry):
+                total -= sizes[entry]
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            _remove_entry(entry)
+
+
+def _read_parts(entry: Path) -> List[Part]:
+    """Metadata and memory-mapped arrays of the parts of an entry."""
+    if not entry.is_dir():
+        return []
+    return [
+        (
+            json.loads((part / METADATA_FILE).read_text()),
+            {
+                name: np.load(part / f"{name}.npy", mmap_mode="r")
+                for name in PART_ARRAYS
+            },
+        )
+        for part in sorted(entry.glob(f"{PART_PREFIX}*"))
+    ]
+
+
+def _stored_global_ids(parts: List[Part]) -> Dict[str, Set[str]]:
+    stored: Dict[str, Set[str]] = {
+        name: set()
+        for name in [
+            "global_ids",
+            "hull_global_ids",
+            "box_global_ids",
+            "spaces",
+            "candidates",
+        ]
+    }
+    for metadata, arrays in parts:
+        hull_sizes = np.diff(arrays["hull_offsets"])
+        stored["global_ids"].update(metadata["global_ids"])
+        stored["hull_global_ids"].update(
+            global_id
+            for global_id, size in zip(metadata["global_ids"], hull_sizes)
+            if size
+        )
+        for name in ["box_global_ids", "spaces", "candidates"]:
+            stored[name].update(metadata[name])
+    return stored
+
+
+def _access_time(entry: Path) -> float:
+    try:
+        return (entry / ACCESS_MARKER).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _remove_entry(entry: Path) -> bool:
+    """Remove an entry unless it cannot be moved, e.g. while its files are mapped.
+
+    The entry is first renamed so that other processes never see it partially
+    removed.
+    """
+    removed = entry.with_name(f"{REMOVED_PREFIX}{entry.name}-{uuid.uuid4().hex}")
+    try:
+        entry.rename(removed)
+    except OSError:
+        return False
+    shutil.rmtree(removed, ignore_errors=True)
+    return True
+
+
+def _entry_size(entry: Path) -> int:
+    size = 0
+    for path in entry.rglob("*"):
+        with suppress(OSError):
+            if path.is_file():
+                size += path.stat().st_size
+    return size
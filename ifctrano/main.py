@@ -2,38 +2,64 @@ import shutil
 import webbrowser
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Annotated, get_args, Callable
+from typing import TYPE_CHECKING, Annotated, get_args, Callable, Optional
 
 import typer
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from trano.data_models.conversion import convert_network  # type: ignore
-from trano.elements.library.library import Library  # type: ignore
-from trano.reporting.html import to_html_reporting  # type: ignore
-from trano.reporting.reporting import ModelDocumentation  # type: ignore
-from trano.reporting.types import ResultFile  # type: ignore
-from trano.simulate.simulate import simulate  # type: ignore
-from trano.topology import Network  # type: ignore
-from trano.utils.utils import is_success  # type: ignore
-
-from ifctrano.base import Libraries
-from ifctrano.building import Building
-from ifctrano.exceptions import InvalidLibraryError
+
+from ifctrano.base import GeometryProfile, Libraries
+from ifctrano.batch import BatchOptions, BatchOutput, collect_ifc_files, run_batch
+from ifctrano.exceptions import InvalidGeometryProfileError, InvalidLibraryError
+from ifctrano.geometry_cache import GeometryCache, DEFAULT_CACHE_SIZE
+from ifctrano.server import DEFAULT_HOST, DEFAULT_PORT, serve as serve_conversions
+from ifctrano.tracing import tracing
 from rich import print
 
+if TYPE_CHECKING:
+    from trano.topology import Network  # type: ignore
+
+# Building, trano's simulation and reporting are imported by the commands
+# using them, so that the command line starts without loading them.
 app = typer.Typer()
 CHECKMARK = "[green]✔[/green]"
 CROSS_MARK = "[red]✘[/red]"
 
 
-def _create_network(model: str, library: str) -> Network:
+def _create_network(model: str, library: str) -> "Network":
+    from trano.data_models.conversion import convert_network  # type: ignore
+    from trano.elements.library.library import Library  # type: ignore
+
     library_ = Library.from_configuration(library)
     model_ = Path(model).resolve()
     return convert_network(str(model_.stem), model_, library=library_)
 
 
+def _geometry_cache(
+    cache_directory: Optional[Path], cache_size: int
+) -> Optional[GeometryCache]:
+    if cache_directory is None:
+        return None
+    return GeometryCache(directory=cache_directory, max_size=cache_size * 1024**2)
+
+
+def _geometry_profile(geometry_profile: str) -> GeometryProfile:
+    if geometry_profile not in get_args(GeometryProfile):
+        raise InvalidGeometryProfileError(
+            f"Invalid geometry profile {geometry_profile}. "
+            f"Valid geometry profiles are {get_args(GeometryProfile)}"
+        )
+    return geometry_profile  # type: ignore
+
+
 def _simulate(
-    modelica_model_path: Path, create_network_callable: Callable[[], Network]
+    modelica_model_path: Path, create_network_callable: Callable[[], "Network"]
 ) -> None:
+    from trano.reporting.html import to_html_reporting  # type: ignore
+    from trano.reporting.reporting import ModelDocumentation  # type: ignore
+    from trano.reporting.types import ResultFile  # type: ignore
+    from trano.simulate.simulate import simulate  # type: ignore
+    from trano.utils.utils import is_success  # type: ignore
+
     print("Simulating...")
     try:
         results = simulate(modelica_model_path.parent, create_network_callable())
@@ -65,7 +91,7 @@ def _simulate(
 
 
 @app.command()
-def config(
+def config(  # noqa: PLR0913
     model: Annotated[
         str,
         typer.Argument(help="Local path to the ifc file."),
@@ -74,9 +100,34 @@ def config(
         bool,
         typer.Option(help="Show computed space boundaries."),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(help="Number of processes used to compute space boundaries."),
+    ] = 1,
+    cache_directory: Annotated[
+        Optional[Path],
+        typer.Option(help="Directory used to cache the tessellated geometry."),
+    ] = None,
+    cache_size: Annotated[
+        int,
+        typer.Option(help="Maximum size of the geometry cache in megabytes."),
+    ] = DEFAULT_CACHE_SIZE
+    // 1024**2,
+    geometry_profile: Annotated[
+        str,
+        typer.Option(
+            help="Geometry profile trading accuracy for speed: fast, default or precise."
+        ),
+    ] = "default",
+    trace: Annotated[
+        Optional[Path],
+        typer.Option(help="Write a Chrome trace of the run to this JSON file."),
+    ] = None,
 ) -> None:
+    from ifctrano.building import Building
+
     working_directory = Path.cwd()
-    with Progress(
+    with tracing(trace), Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
@@ -87,7 +138,12 @@ def config(
             description=f"Generating {config_path} configuration file.",
             total=None,
         )
-        building = Building.from_ifc(Path(model))
+        building = Building.from_ifc(
+            Path(model),
+            workers=jobs,
+            geometry_cache=_geometry_cache(cache_directory, cache_size),
+            geometry_profile=_geometry_profile(geometry_profile),
+        )
         if show_space_boundaries:
             print(f"{CHECKMARK} Showing space boundaries.")
             building.show()
@@ -134,7 +190,7 @@ def from_config(
 
 
 @app.command()
-def create(
+def create(  # noqa: PLR0913
     model: Annotated[
         str,
         typer.Argument(help="Local path to the ifc file."),
@@ -151,8 +207,33 @@ def create(
         bool,
         typer.Option(help="Simulate the generated model."),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(help="Number of processes used to compute space boundaries."),
+    ] = 1,
+    cache_directory: Annotated[
+        Optional[Path],
+        typer.Option(help="Directory used to cache the tessellated geometry."),
+    ] = None,
+    cache_size: Annotated[
+        int,
+        typer.Option(help="Maximum size of the geometry cache in megabytes."),
+    ] = DEFAULT_CACHE_SIZE
+    // 1024**2,
+    geometry_profile: Annotated[
+        str,
+        typer.Option(
+            help="Geometry profile trading accuracy for speed: fast, default or precise."
+        ),
+    ] = "default",
+    trace: Annotated[
+        Optional[Path],
+        typer.Option(help="Write a Chrome trace of the run to this JSON file."),
+    ] = None,
 ) -> None:
-    with Progress(
+    from ifctrano.building import Building
+
+    with tracing(trace), Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
@@ -166,7 +247,12 @@ def create(
             description=f"Generating model {modelica_model_path.name} with library {library} from {model}",
             total=None,
         )
-        building = Building.from_ifc(Path(model))
+        building = Building.from_ifc(
+            Path(model),
+            workers=jobs,
+            geometry_cache=_geometry_cache(cache_directory, cache_size),
+            geometry_profile=_geometry_profile(geometry_profile),
+        )
         if show_space_boundaries:
             print(f"{CHECKMARK} Showing space boundaries.")
             building.show()
@@ -183,8 +269,135 @@ def create(
             _simulate(modelica_model_path, create_network_callable)
 
 
+@app.command()
+def batch(  # noqa: PLR0913
+    pattern: Annotated[
+        str,
+        typer.Argument(help="Directory containing ifc files, or glob pattern."),
+    ],
+    output: Annotated[
+        str,
+        typer.Option(help="Generate a yaml configuration (config) or a model (model)."),
+    ] = "config",
+    library: Annotated[
+        str,
+        typer.Option(help="Modelica library used when generating models."),
+    ] = "Buildings",
+    output_directory: Annotated[
+        Optional[Path],
+        typer.Option(help="Output directory, next to each ifc file by default."),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(help="Number of files converted in parallel.", min=1),
+    ] = 1,
+    timeout: Annotated[
+        Optional[float],
+        typer.Option(help="Maximum number of seconds spent on a file."),
+    ] = None,
+    summary: Annotated[
+        Path,
+        typer.Option(help="Path of the json summary of the conversions."),
+    ] = Path("batch_summary.json"),
+    cache_directory: Annotated[
+        Optional[Path],
+        typer.Option(help="Directory used to cache the tessellated geometry."),
+    ] = None,
+    cache_size: Annotated[
+        int,
+        typer.Option(help="Maximum size of the geometry cache in megabytes."),
+    ] = DEFAULT_CACHE_SIZE
+    // 1024**2,
+    geometry_profile: Annotated[
+        str,
+        typer.Option(
+            help="Geometry profile trading accuracy for speed: fast, default or precise."
+        ),
+    ] = "default",
+) -> None:
+    if library not in get_args(Libraries):
+        raise InvalidLibraryError(
+            f"Invalid library {library}. Valid libraries are {get_args(Libraries)}"
+        )
+    if output not in get_args(BatchOutput):
+        raise typer.BadParameter(
+            f"Invalid output {output}. Valid outputs are {get_args(BatchOutput)}"
+        )
+    ifc_file_paths = collect_ifc_files(pattern)
+    if not ifc_file_paths:
+        print(f"{CROSS_MARK} No ifc file found in {pattern}.")
+        raise typer.Exit(1)
+    options = BatchOptions(
+        output=output,
+        library=library,
+        output_directory=output_directory,
+        geometry_profile=_geometry_profile(geometry_profile),
+        geometry_cache=_geometry_cache(cache_directory, cache_size),
+    )
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        transient=True,
+    ) as progress:
+        task = progress.add_task(
+            description=f"Converting {len(ifc_file_paths)} ifc files with {jobs} processes...",
+            total=None,
+        )
+        batch_summary = run_batch(ifc_file_paths, options, jobs, timeout)
+        progress.remove_task(task)
+    for result in batch_summary.results:
+        if result.status == "success":
+            print(
+                f"{CHECKMARK} {result.path}: {result.spaces} spaces in "
+                f"{result.timings['total']:.1f}s."
+            )
+        else:
+            print(f"{CROSS_MARK} {result.path}: {result.status}. {result.error}")
+    batch_summary.to_json(summary)
+    counts = batch_summary.counts()
+    print(
+        f"{counts['success']} converted, {counts['failed']} failed, "
+        f"{counts['timeout']} timed out in {batch_summary.duration:.1f}s. "
+        f"Summary written to {summary}."
+    )
+    if counts["success"] != len(ifc_file_paths):
+        raise typer.Exit(1)
+
+
+@app.command()
+def serve(
+    host: Annotated[
+        str,
+        typer.Option(help="Host the server listens on."),
+    ] = DEFAULT_HOST,
+    port: Annotated[
+        int,
+        typer.Option(help="Port the server listens on."),
+    ] = DEFAULT_PORT,
+    warm_up: Annotated[
+        bool,
+        typer.Option(help="Convert an example file before serving requests."),
+    ] = True,
+    cache_directory: Annotated[
+        Optional[Path],
+        typer.Option(help="Directory used to cache the tessellated geometry."),
+    ] = None,
+    cache_size: Annotated[
+        int,
+        typer.Option(help="Maximum size of the geometry cache in megabytes."),
+    ] = DEFAULT_CACHE_SIZE
+    // 1024**2,
+) -> None:
+    print(f"{CHECKMARK} Serving conversions on http://{host}:{port}")
+    serve_conversions(
+        host, port, _geometry_cache(cache_directory, cache_size), warm_up=warm_up
+    )
+
+
 @app.command()
 def verify() -> None:
+    from ifctrano.building import Building
+
     verification_ifc = Path(__file__).parent / "example" / "verification.ifc"
     with Progress(
         SpinnerColumn(),
@@ -0,0 +1,177 @@
+import json
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.metadata import version
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+import yaml
+from pydantic import BaseModel
+
+from ifctrano.base import GeometryProfile, Libraries
+from ifctrano.batch import BatchOutput
+from ifctrano.geometry_cache import GeometryCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+WARM_UP_IFC = Path(__file__).parent / "example" / "verification.ifc"
+
+
+class ConversionRequest(BaseModel):
+    output: BatchOutput = "config"
+    library: Libraries = "Buildings"
+    geometry_profile: GeometryProfile = "default"
+    name: str = "building"
+    path: Optional[Path] = None
+
+
+def convert_ifc(
+    ifc_file_path: Path,
+    request: ConversionRequest,
+    geometry_cache: Optional[GeometryCache] = None,
+) -> str:
+    """Yaml configuration or Modelica model of an IFC file."""
+    from ifctrano.building import Building
+
+    building = Building.from_ifc(
+        ifc_file_path,
+        geometry_cache=geometry_cache,
+        geometry_profile=request.geometry_profile,
+    )
+    if request.output == "config":
+        return str(yaml.dump(building.to_config()))
+    return str(building.create_network(library=request.library).model())
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """HTTP server converting IFC files in a process kept warm between requests.
+
+    Conversions run one at a time, other requests such as health checks are
+    answered meanwhile.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        geometry_cache: Optional[GeometryCache] = None,
+    ) -> None:
+        super().__init__(address, ConversionHandler)
+        self.geometry_cache = geometry_cache
+        self.lock = threading.Lock()
+
+    def convert(self, request: ConversionRequest, content: Optional[bytes]) -> str:
+        with self.lock:
+            if content is None:
+                if request.path is None or not request.path.exists():
+                    raise FileNotFoundError(f"File {request.path} does not exist.")
+                return convert_ifc(request.path, request, self.geometry_cache)
+            with TemporaryDirectory() as directory:
+                ifc_file_path = Path(directory) / f"{Path(request.name).name}.ifc"
+                ifc_file_path.write_bytes(content)
+                return convert_ifc(ifc_file_path, request, self.geometry_cache)
+
+    def warm_up(self) -> None:
+        """Convert an example file so that the first request is served warm."""
+        try:
+            for output in ["config", "model"]:
+                convert_ifc(WARM_UP_IFC, ConversionRequest(output=output))
+        except Exception as e:
+            logger.warning(f"Warm up failed: {e}")
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """Routes of the conversion server.
+
+    GET /health returns the server status. POST /convert converts the IFC
+    file sent as the request body, or the file at the path given in a json
+    body, with the options of ConversionRequest as query parameters.
+    """
+
+    server: ConversionServer
+
+    def _send(
+        self, status: HTTPStatus, body: str, content_type: str = "application/json"
+    ) -> None:
+        content = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_json(self, status: HTTPStatus, data: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(data))
+
+    def do_GET(self) -> None:  # noqa: N802
+        if urlparse(self.path).path != "/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        self._send_json(HTTPStatus.OK, {"status": "ok", "version": version("ifctrano")})
+
+    def _parse_request(
+        self, query: str, body: bytes
+    ) -> Tuple[ConversionRequest, Optional[bytes]]:
+        """Options of the request and the IFC content, if sent as the body."""
+        parameters: Dict[str, Any] = dict(parse_qsl(query))
+        if self.headers.get_content_type() != "application/json":
+            return ConversionRequest.model_validate(parameters), body
+        fields = json.loads(body or b"{}")
+        if not isinstance(fields, dict):
+            raise ValueError("The json body must be an object.")
+        return ConversionRequest.model_validate(parameters | fields), None
+
+    def do_POST(self) -> None:  # noqa: N802
+        url = urlparse(self.path)
+        if url.path != "/convert":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length < 0:
+                raise ValueError("Content-Length must not be negative.")
+            request, content = self._parse_request(url.query, self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        try:
+            result = self.server.convert(request, content)
+        except FileNotFoundError as e:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.exception(f"Conversion failed: {e}")
+            self._send_json(
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+                {"error": f"{type(e).__name__}: {e}"},
+            )
+            return
+        self._send(
+            HTTPStatus.OK,
+            result,
+            "application/yaml" if request.output == "config" else "text/plain",
+        )
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+        logger.info(f"{self.address_string()} {format % args}")
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    geometry_cache: Optional[GeometryCache] = None,
+    warm_up: bool = True,
+) -> None:
+    server = ConversionServer((host, port), geometry_cache)
+    if warm_up:
+        server.warm_up()
+    logger.info(f"Serving conversions on http://{host}:{server.server_port}")
+    with server:
+        server.serve_forever()
@@ -1,19 +1,26 @@
 import logging
 import math
 import multiprocessing
-from typing import Optional, List, Tuple, Any, Annotated, Dict
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Tuple,
+    Any,
+    Annotated,
+    DefaultDict,
+    Dict,
+)
 
 import ifcopenshell
 import ifcopenshell.geom
-import ifcopenshell.util.shape
 from ifcopenshell import entity_instance, file
 from pydantic import Field, BeforeValidator, BaseModel, ConfigDict
-from shapely import wkt  # type: ignore
-from trano.data_models.conversion import SpaceParameter  # type: ignore
+from shapely import STRtree  # type: ignore
 from trano.elements import Space as TranoSpace, ExternalWall, Window, BaseWall, ExternalDoor  # type: ignore
 from trano.elements.system import Occupancy  # type: ignore
 from trano.elements.types import Tilt  # type: ignore
-from vedo import Line  # type: ignore
 
 from ifctrano.base import (
     GlobalId,
@@ -23,9 +30,11 @@ from ifctrano.base import (
     CLASH_CLEARANCE,
     Vector,
     BaseShow,
+    Entity,
 )
-from ifctrano.bounding_box import OrientedBoundingBox
+from ifctrano.bounding_box import OrientedBoundingBox, ShapeCache
 from ifctrano.construction import glass, Constructions, default_construction
+from ifctrano.tracing import span, traced
 from ifctrano.utils import (
     remove_non_alphanumeric,
     _round,
@@ -35,38 +44,89 @@ from ifctrano.utils import (
 
 ROOF_VECTOR = Vector(x=0, y=0, z=1)
 
+if TYPE_CHECKING:
+    from vedo import Line  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
-def initialize_tree(ifc_file: file) -> ifcopenshell.geom.tree:
+@traced("initialize_tree")
+def initialize_tree(
+    ifc_file: file, shape_cache: Optional[ShapeCache] = None
+) -> ifcopenshell.geom.tree:
     tree = ifcopenshell.geom.tree()
+    add_shapes(tree, ifc_file, shape_cache)
+    return tree
 
+
+def add_shapes(
+    tree: ifcopenshell.geom.tree,
+    ifc_file: file,
+    shape_cache: Optional[ShapeCache] = None,
+    include: Optional[List[entity_instance]] = None,
+) -> None:
+    """Tessellate the entities of the file, or only those included, into tree."""
+    if include is not None and not include:
+        return
     iterator = ifcopenshell.geom.iterator(
-        settings, ifc_file, multiprocessing.cpu_count()
+        shape_cache.settings if shape_cache is not None else settings,
+        ifc_file,
+        multiprocessing.cpu_count(),
+        include=include,
     )
     if iterator.initialize():  # type: ignore
         while True:
-            tree.add_element(iterator.get())  # type: ignore
+            entity_shape = iterator.get()  # type: ignore
+            tree.add_element(entity_shape)  # type: ignore
+            if shape_cache is not None:
+                shape_cache.add_shape(entity_shape)
             if not iterator.next():  # type: ignore
                 break
-    return tree
+
+
+def get_space_candidates(
+    ifc_file: file, tree: ifcopenshell.geom.tree, spaces: List[entity_instance]
+) -> Dict[str, List[entity_instance]]:
+    elements = get_building_elements(ifc_file)
+    with span("clash_clearance_many", spaces=len(spaces), elements=len(elements)):
+        clashes = tree.clash_clearance_many(
+            spaces,
+            elements,
+            clearance=CLASH_CLEARANCE,
+        )
+    candidates: Dict[str, Dict[str, entity_instance]] = {
+        space.GlobalId: {} for space in spaces
+    }
+    for clash in clashes:
+        global_ids = [clash.a.get_argument(0), clash.b.get_argument(0)]
+        space_id = next(
+            global_id for global_id in global_ids if global_id in candidates
+        )
+        for global_id in global_ids:
+            entity = ifc_file.by_guid(global_id)
+            if entity.is_a() not in ["IfcSpace"]:
+                candidates[space_id][global_id] = entity
+    return {
+        space_id: list(elements_.values()) for space_id, elements_ in candidates.items()
+    }
 
 
 class Space(GlobalId):
     name: Optional[str] = None
     bounding_box: OrientedBoundingBox
-    entity: entity_instance
+    entity: Entity
     average_room_height: Annotated[float, BeforeValidator(_round)]
     floor_area: Annotated[float, BeforeValidator(_round)]
     bounding_box_height: Annotated[float, BeforeValidator(_round)]
     bounding_box_volume: Annotated[float, BeforeValidator(_round)]
 
     @classmethod
-    def from_entity(cls, entity: entity_instance) -> "Space":
-        bounding_box = OrientedBoundingBox.from_entity(entity)
-        entity_shape = ifcopenshell.geom.create_shape(settings, entity)
-        area = ifcopenshell.util.shape.get_footprint_area(entity_shape.geometry)  # type: ignore
-        volume = ifcopenshell.util.shape.get_volume(entity_shape.geometry)  # type: ignore
+    def from_entity(
+        cls, entity: entity_instance, shape_cache: Optional[ShapeCache] = None
+    ) -> "Space":
+        shape_cache = shape_cache or ShapeCache()
+        bounding_box = OrientedBoundingBox.from_entity(entity, shape_cache)
+        area, volume = shape_cache.get_footprint_area_and_volume(entity)
         if area:
             average_room_height = volume / area
         else:
@@ -258,7 +318,7 @@ class Azimuths(BaseModel):
 
 class SpaceBoundary(BaseModelConfig):
     bounding_box: OrientedBoundingBox
-    entity: entity_instance
+    entity: Entity
     common_surface: CommonSurface
     adjacent_spaces: List[Space] = Field(default_factory=list)
 
@@ -267,7 +327,7 @@ class SpaceBoundary(BaseModelConfig):
 
     def boundary_name(self) -> str:
         return (
-            f"{remove_non_alphanumeric(self.entity.Name) or self.entity.is_a().lower()}_"
+            f"{remove_non_alphanumeric(self.entity.Name) or self.entity.is_a().lower()}_"  # type: ignore
             f"__{remove_non_alphanumeric(self.entity.GlobalId)}{short_uuid()}"
         )
 
@@ -326,9 +386,12 @@ class SpaceBoundary(BaseModelConfig):
 
     @classmethod
     def from_space_and_element(
-        cls, bounding_box: OrientedBoundingBox, entity: entity_instance
+        cls,
+        bounding_box: OrientedBoundingBox,
+        entity: entity_instance,
+        shape_cache: Optional[ShapeCache] = None,
     ) -> Optional["SpaceBoundary"]:
-        bounding_box_ = OrientedBoundingBox.from_entity(entity)
+        bounding_box_ = OrientedBoundingBox.from_entity(entity, shape_cache)
         common_surface = bounding_box.intersect_faces(bounding_box_)
         if common_surface:
             return cls(
@@ -352,16 +415,17 @@ class SpaceBoundaries(BaseShow):
     def description(self) -> set[tuple[float, tuple[float, ...], Any, str]]:
         return {b.description() for b in self.boundaries}
 
-    def lines(self) -> List[Line]:
+    def lines(self) -> List["Line"]:
         lines = []
         for boundary in self.boundaries:
             lines += boundary.common_surface.lines()
         return lines
 
     def remove(self, space_boundaries: List[SpaceBoundary]) -> None:
-        for space_boundary in space_boundaries:
-            if space_boundary in self.boundaries:
-                self.boundaries.remove(space_boundary)
+        removed = {id(space_boundary) for space_boundary in space_boundaries}
+        self.boundaries = [
+            boundary for boundary in self.boundaries if id(boundary) not in removed
+        ]
 
     def to_config(
         self,
@@ -369,6 +433,8 @@ class SpaceBoundaries(BaseShow):
         north_axis: Vector,
         constructions: Constructions,
     ) -> Optional[Dict[str, Any]]:
+        from trano.data_models.conversion import SpaceParameter  # type: ignore
+
         external_boundaries: Dict[str, Any] = {
             "external_walls": [],
             "floor_on_grounds": [],
@@ -433,6 +499,8 @@ class SpaceBoundaries(BaseShow):
         north_axis: Vector,
         constructions: Constructions,
     ) -> Optional[TranoSpace]:
+        from trano.data_models.conversion import SpaceParameter
+
         external_boundaries = []
         for boundary in self.boundaries:
             boundary_model = boundary.model_element(
@@ -467,41 +535,105 @@ class SpaceBoundaries(BaseShow):
         ifcopenshell_file: file,
         tree: ifcopenshell.geom.tree,
         space: entity_instance,
+        shape_cache: Optional[ShapeCache] = None,
     ) -> "SpaceBoundaries":
-        space_ = Space.from_entity(space)
+        candidates = get_space_candidates(ifcopenshell_file, tree, [space])
+        return cls.from_space_candidates(space, candidates[space.GlobalId], shape_cache)
+
+    @classmethod
+    def from_space_candidates(
+        cls,
+        space: entity_instance,
+        candidates: List[entity_instance],
+        shape_cache: Optional[ShapeCache] = None,
+    ) -> "SpaceBoundaries":
+        with span(
+            "space_boundaries",
+            space=space.GlobalId,
+            name=space.Name,
+            candidates=len(candidates),
+        ) as attributes:
+            with span("Space.from_entity", space=space.GlobalId):
+                space_ = Space.from_entity(space, shape_cache)
+            space_boundaries = []
+            with span("intersect_faces", space=space.GlobalId):
+                for element in candidates:
+                    space_boundary = SpaceBoundary.from_space_and_element(
+                        space_.bounding_box, element, shape_cache
+                    )
+                    if space_boundary:
+                        space_boundaries.append(space_boundary)
+            with span("merge_boundaries_from_part", space=space.GlobalId):
+                merged_boundaries = MergedSpaceBoundaries.from_boundaries(
+                    space_boundaries
+                )
+                space_boundaries_ = merged_boundaries.merge_boundaries_from_part()
+            with span("remove_duplicate_boundaries", space=space.GlobalId):
+                space_boundaries__ = remove_duplicate_boundaries(space_boundaries_)
+            attributes["boundaries"] = len(space_boundaries__)
+        return cls(space=space_, boundaries=space_boundaries__)
 
-        elements = get_building_elements(ifcopenshell_file)
-        clashes = tree.clash_clearance_many(
-            [space],
-            elements,
-            clearance=CLASH_CLEARANCE,
-        )
-        space_boundaries = []
-        elements_ = {
-            entity
-            for c in clashes
-            for entity in [
-                ifcopenshell_file.by_guid(c.a.get_argument(0)),
-                ifcopenshell_file.by_guid(c.b.get_argument(0)),
-            ]
-            if entity.is_a() not in ["IfcSpace"]
-        }
 
-        for element in list(elements_):
-            space_boundary = SpaceBoundary.from_space_and_element(
-                space_.bounding_box, element
+def _remove_duplicate_boundaries_of_type(
+    references: List[SpaceBoundary],
+) -> List[SpaceBoundary]:
+    global_ids = [reference.entity.GlobalId for reference in references]
+    indexes_by_global_id: DefaultDict[str, List[int]] = defaultdict(list)
+    for index, global_id in enumerate(global_ids):
+        indexes_by_global_id[global_id].append(index)
+    polygons = [
+        reference.common_surface.polygon.to_polygon() for reference in references
+    ]
+    tree = STRtree(polygons)
+    removed = [False] * len(references)
+    kept = []
+    for index, reference in enumerate(references):
+        if removed[index]:
+            continue
+        polygon = polygons[index]
+        intersecting = [
+            other
+            for other in sorted(tree.query(polygon, predicate="intersects").tolist())
+            if not removed[other]
+            and other != index
+            and not (
+                global_ids[other] == global_ids[index]
+                and references[other] == reference
             )
-            if space_boundary:
-                space_boundaries.append(space_boundary)
-        merged_boundaries = MergedSpaceBoundaries.from_boundaries(space_boundaries)
-        space_boundaries_ = merged_boundaries.merge_boundaries_from_part()
-        space_boundaries__ = remove_duplicate_boundaries(space_boundaries_)
-        return cls(space=space_, boundaries=space_boundaries__)
+            and references[other].common_surface.orientation
+            == reference.common_surface.orientation
+            and polygons[other].intersection(polygon).area > 0
+        ]
+        current_group = sorted(
+            [*intersecting, index], key=lambda member: global_ids[member]
+        )
+        kept.append(references[current_group[0]])
+        for member in current_group:
+            removed[member] = True
+        members_by_global_id: DefaultDict[str, List[int]] = defaultdict(list)
+        for member in current_group:
+            members_by_global_id[global_ids[member]].append(member)
+        for global_id, members in members_by_global_id.items():
+            for other in indexes_by_global_id[global_id]:
+                if (
+                    other > index
+                    and not removed[other]
+                    and any(
+                        references[other] == references[member] for member in members
+                    )
+                ):
+                    removed[other] = True
+    return kept
 
 
 def remove_duplicate_boundaries(
     boundaries: List[SpaceBoundary],
 ) -> List[SpaceBoundary]:
+    """Keep one boundary per group of overlapping roof or slab boundaries.
+
+    Groups are formed greedily in GlobalId order: each remaining boundary
+    takes all the remaining ones that overlap it with the same orientation.
+    """
     types = ["IfcRoof", "IfcSlab"]
     boundaries = sorted(boundaries, key=lambda b: b.entity.GlobalId)
     boundaries_without_types = [
@@ -509,34 +641,9 @@ def remove_duplicate_boundaries(
     ]
     new_boundaries = []
     for type_ in types:
-        references = [sp for sp in boundaries if sp.entity.is_a() == type_]
-        while True:
-            reference = next(iter(references), None)
-            if not reference:
-                break
-            others = [p_ for p_ in references if p_ != reference]
-            intersecting = [
-                o
-                for o in others
-                if (
-                    wkt.loads(o.common_surface.polygon).intersects(
-                        wkt.loads(reference.common_surface.polygon)
-                    )
-                    and o.common_surface.orientation
-                    == reference.common_surface.orientation
-                )
-                and (
-                    wkt.loads(o.common_surface.polygon).intersection(
-                        wkt.loads(reference.common_surface.polygon)
-                    )
-                ).area
-                > 0
-            ]
-            current_group = sorted(
-                [*intersecting, reference], key=lambda p: p.entity.GlobalId
-            )
-            new_boundaries.append(next(iter(current_group)))
-            references = [p_ for p_ in references if p_ not in current_group]
+        new_boundaries += _remove_duplicate_boundaries_of_type(
+            [sp for sp in boundaries if sp.entity.is_a() == type_]
+        )
     return [*boundaries_without_types, *new_boundaries]
 
 
@@ -565,23 +672,25 @@ class MergedSpaceBoundaries(BaseModel):
     def from_boundaries(
         cls, space_boundaries: List[SpaceBoundary]
     ) -> "MergedSpaceBoundaries":
+        # Boundaries of detached entities were merged before being detached.
         building_element_part_boundaries = [
-            boundary
+            (boundary, boundary.entity)
             for boundary in space_boundaries
-            if boundary.entity.is_a() in ["IfcBuildingElementPart"]
+            if isinstance(boundary.entity, entity_instance)
+            and boundary.entity.is_a() in ["IfcBuildingElementPart"]
         ]
         existing_parent_entities = {
             decompose.RelatingObject
-            for b in building_element_part_boundaries
-            for decompose in b.entity.Decomposes
+            for _, entity in building_element_part_boundaries
+            for decompose in entity.Decomposes
         }
         part_boundaries = [
             MergedSpaceBoundary(
                 parent=parent,
                 related_boundaries=[
                     b
-                    for b in building_element_part_boundaries
-                    for decompose in b.entity.Decomposes
+                    for b, entity in building_element_part_boundaries
+                    for decompose in entity.Decomposes
                     if decompose.RelatingObject == parent
                 ],
             )
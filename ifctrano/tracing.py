@@ -0,0 +1,102 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+TraceEvent = Dict[str, Any]
+F = TypeVar("F", bound=Callable[..., Any])
+
+CATEGORY = "ifctrano"
+
+
+class Tracer(BaseModel):
+    """Collect spans as complete events of the Chrome trace event format.
+
+    The saved file can be loaded in chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    events: List[TraceEvent] = Field(default_factory=list)
+
+    @contextmanager
+    def span(
+        self, name: str, /, **attributes: Any  # noqa: ANN401
+    ) -> Iterator[Dict[str, Any]]:
+        start = time.time_ns()
+        try:
+            yield attributes
+        finally:
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": CATEGORY,
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": (time.time_ns() - start) / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": attributes,
+                }
+            )
+
+    def merge(self, events: List[TraceEvent]) -> None:
+        self.events.extend(events)
+
+    def save(self, path: Path) -> None:
+        path.write_text(
+            json.dumps(
+                {"traceEvents": self.events, "displayTimeUnit": "ms"}, default=str
+            )
+        )
+
+
+_tracer: ContextVar[Optional[Tracer]] = ContextVar("tracer", default=None)
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer.get()
+
+
+@contextmanager
+def tracing(path: Optional[Path] = None) -> Iterator[Tracer]:
+    """Record the spans of the enclosed code, saved to path if given."""
+    tracer = Tracer()
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+        if path is not None:
+            tracer.save(path)
+
+
+@contextmanager
+def span(name: str, /, **attributes: Any) -> Iterator[Dict[str, Any]]:  # noqa: ANN401
+    """Span of the current tracer, if any.
+
+    The yielded attributes can be completed once the span's work is done.
+    """
+    tracer = _tracer.get()
+    if tracer is None:
+        yield attributes
+        return
+    with tracer.span(name, **attributes) as attributes_:
+        yield attributes_
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def decorator(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with span(name):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -34,7 +34,12 @@ def linting(session: Session) -> None:
 
 @nox.session(python=["3.10"])
 def tests(session: Session) -> None:
-    session.run("poetry", "run", "pytest", "-m", "not large")
+    session.run("poetry", "run", "pytest", "-m", "not large and not benchmark")
+
+
+@nox.session(python=["3.10"])
+def benchmark(session: Session) -> None:
+    session.run("poetry", "run", "pytest", "-m", "benchmark", "-s")
 
 
 @nox.session(python=["3.10"])
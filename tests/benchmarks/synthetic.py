@@ -0,0 +1,208 @@
+"""Synthetic buildings made of a grid of rooms, used by the benchmarks."""
+
+from pathlib import Path
+from typing import Any
+
+import ifcopenshell
+import ifcopenshell.api
+import numpy as np
+from ifcopenshell import entity_instance, file
+
+WALL_THICKNESS = 0.2
+ROOM_SIZE = 4.0
+ROOM_HEIGHT = 3.0
+WINDOW_WIDTH = 1.5
+WINDOW_HEIGHT = 1.2
+WINDOW_SILL = 1.0
+
+
+def _box(
+    ifc_file: file, body: entity_instance, size: tuple[float, float, float]
+) -> entity_instance:
+    dx, dy, dz = size
+    profile = ifc_file.createIfcRectangleProfileDef(
+        "AREA",
+        None,
+        ifc_file.createIfcAxis2Placement2D(
+            ifc_file.createIfcCartesianPoint((dx / 2, dy / 2))
+        ),
+        dx,
+        dy,
+    )
+    solid = ifc_file.createIfcExtrudedAreaSolid(
+        profile,
+        ifc_file.createIfcAxis2Placement3D(
+            ifc_file.createIfcCartesianPoint((0.0, 0.0, 0.0))
+        ),
+        ifc_file.createIfcDirection((0.0, 0.0, 1.0)),
+        dz,
+    )
+    return ifc_file.createIfcShapeRepresentation(body, "Body", "SweptSolid", [solid])
+
+
+class SyntheticBuilding:
+    """Grid of nx by ny rooms over nz storeys.
+
+    Rooms are separated by walls and storeys by slabs, the top storey has a
+    roof and each room of the first row has a window in its outer wall.
+    """
+
+    def __init__(self, nx: int, ny: int, nz: int = 1) -> None:
+        self.nx = nx
+        self.ny = ny
+        self.nz = nz
+        self.ifc_file = ifcopenshell.file(schema="IFC4")
+        project = self._run(
+            "root.create_entity", ifc_class="IfcProject", name="synthetic"
+        )
+        length = self._run("unit.add_si_unit", unit_type="LENGTHUNIT")
+        self._run("unit.assign_unit", units=[length])
+        context = self._run("context.add_context", context_type="Model")
+        self.body = self._run(
+            "context.add_context",
+            context_type="Model",
+            context_identifier="Body",
+            target_view="MODEL_VIEW",
+            parent=context,
+        )
+        site = self._run("root.create_entity", ifc_class="IfcSite", name="site")
+        self.building = self._run(
+            "root.create_entity", ifc_class="IfcBuilding", name="building"
+        )
+        self._run("aggregate.assign_object", relating_object=project, products=[site])
+        self._run(
+            "aggregate.assign_object", relating_object=site, products=[self.building]
+        )
+        concrete = self._run("material.add_material", name="concrete")
+        self.layer_set = self._run(
+            "material.add_material_set",
+            name="concrete_layer_set",
+            set_type="IfcMaterialLayerSet",
+        )
+        layer = self._run(
+            "material.add_layer", layer_set=self.layer_set, material=concrete
+        )
+        self._run(
+            "material.edit_layer",
+            layer=layer,
+            attributes={"LayerThickness": WALL_THICKNESS},
+        )
+        for storey in range(nz):
+            self._add_storey(storey)
+
+    def _run(self, usecase: str, **kwargs: Any) -> Any:  # noqa: ANN401
+        return ifcopenshell.api.run(usecase, self.ifc_file, **kwargs)
+
+    @property
+    def spaces(self) -> int:
+        return self.nx * self.ny * self.nz
+
+    def _add_element(  # noqa: PLR0913
+        self,
+        ifc_class: str,
+        name: str,
+        storey: entity_instance,
+        origin: tuple[float, float, float],
+        size: tuple[float, float, float],
+    ) -> entity_instance:
+        element = self._run("root.create_entity", ifc_class=ifc_class, name=name)
+        self._run(
+            "geometry.assign_representation",
+            product=element,
+            representation=_box(self.ifc_file, self.body, size),
+        )
+        matrix = np.eye(4)
+        matrix[:3, 3] = origin
+        self._run(
+            "geometry.edit_object_placement",
+            product=element,
+            matrix=matrix,
+            is_si=True,
+        )
+        if ifc_class == "IfcSpace":
+            self._run(
+                "aggregate.assign_object", relating_object=storey, products=[element]
+            )
+            return element
+        self._run(
+            "spatial.assign_container", relating_structure=storey, products=[element]
+        )
+        if ifc_class in ["IfcWall", "IfcSlab"]:
+            self._run(
+                "material.assign_material",
+                products=[element],
+                material=self.layer_set,
+            )
+        return element
+
+    def _add_storey(self, index: int) -> None:
+        storey = self._run(
+            "root.create_entity",
+            ifc_class="IfcBuildingStorey",
+            name=f"storey_{index}",
+        )
+        self._run(
+            "aggregate.assign_object", relating_object=self.building, products=[storey]
+        )
+        step = ROOM_SIZE + WALL_THICKNESS
+        level = index * (ROOM_HEIGHT + WALL_THICKNESS)
+        floor = level + WALL_THICKNESS
+        length_x = self.nx * step + WALL_THICKNESS
+        length_y = self.ny * step + WALL_THICKNESS
+        for i in range(self.nx):
+            for j in range(self.ny):
+                self._add_element(
+                    "IfcSpace",
+                    f"room_{index}_{i}_{j}",
+                    storey,
+                    (WALL_THICKNESS + i * step, WALL_THICKNESS + j * step, floor),
+                    (ROOM_SIZE, ROOM_SIZE, ROOM_HEIGHT),
+                )
+        self._add_element(
+            "IfcSlab",
+            f"slab_{index}",
+            storey,
+            (0, 0, level),
+            (length_x, length_y, WALL_THICKNESS),
+        )
+        if index == self.nz - 1:
+            self._add_element(
+                "IfcRoof",
+                "roof",
+                storey,
+                (0, 0, floor + ROOM_HEIGHT),
+                (length_x, length_y, WALL_THICKNESS),
+            )
+        for i in range(self.nx + 1):
+            self._add_element(
+                "IfcWall",
+                f"wall_x_{index}_{i}",
+                storey,
+                (i * step, 0, floor),
+                (WALL_THICKNESS, length_y, ROOM_HEIGHT),
+            )
+        for j in range(self.ny + 1):
+            self._add_element(
+                "IfcWall",
+                f"wall_y_{index}_{j}",
+                storey,
+                (WALL_THICKNESS, j * step, floor),
+                (length_x - 2 * WALL_THICKNESS, WALL_THICKNESS, ROOM_HEIGHT),
+            )
+        for i in range(self.nx):
+            self._add_element(
+                "IfcWindow",
+                f"window_{index}_{i}",
+                storey,
+                (WALL_THICKNESS + i * step + WINDOW_SILL, 0, floor + WINDOW_SILL),
+                (WINDOW_WIDTH, WALL_THICKNESS, WINDOW_HEIGHT),
+            )
+
+    def write(self, path: Path) -> Path:
+        self.ifc_file.write(str(path))
+        return path
+
+
+def synthetic_building(path: Path, nx: int, ny: int, nz: int = 1) -> Path:
+    """Write a synthetic building of nx by ny rooms over nz storeys to path."""
+    return SyntheticBuilding(nx, ny, nz).write(path)
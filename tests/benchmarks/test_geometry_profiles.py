@@ -0,0 +1,57 @@
+import time
+from pathlib import Path
+from typing import Dict, Tuple, get_args
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from ifctrano.base import GeometryProfile
+from ifctrano.building import Building
+
+MODELS = ["two_zone_path", "duplex_apartment_path", "smiley_west_path"]
+PRECISE_AREA_TOLERANCE = 0.01
+
+
+def boundary_areas(building: Building) -> Dict[Tuple[str, str], float]:
+    return {
+        (space_boundaries.space.global_id, boundary.entity.GlobalId): (
+            boundary.common_surface.area
+        )
+        for space_boundaries in building.space_boundaries
+        for boundary in space_boundaries.boundaries
+    }
+
+
+def relative_area_error(
+    areas: Dict[Tuple[str, str], float], reference: Dict[Tuple[str, str], float]
+) -> float:
+    total = sum(reference.values())
+    difference = sum(
+        abs(areas.get(key, 0) - reference.get(key, 0))
+        for key in areas.keys() | reference.keys()
+    )
+    return difference / total
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("model", MODELS)
+def test_geometry_profiles(request: FixtureRequest, model: str) -> None:
+    ifc_file_path: Path = request.getfixturevalue(model)
+    timings = {}
+    areas = {}
+    for geometry_profile in get_args(GeometryProfile):
+        start = time.perf_counter()
+        building = Building.from_ifc(ifc_file_path, geometry_profile=geometry_profile)
+        timings[geometry_profile] = time.perf_counter() - start
+        areas[geometry_profile] = boundary_areas(building)
+    for geometry_profile in get_args(GeometryProfile):
+        error = relative_area_error(areas[geometry_profile], areas["default"])
+        print(
+            f"{ifc_file_path.name} {geometry_profile}: "
+            f"{timings[geometry_profile]:.2f}s, "
+            f"{len(areas[geometry_profile])} boundaries, "
+            f"area error {error:.2%}"
+        )
+    assert (
+        relative_area_error(areas["precise"], areas["default"]) < PRECISE_AREA_TOLERANCE
+    )
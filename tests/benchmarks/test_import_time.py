@@ -0,0 +1,31 @@
+import subprocess
+import sys
+import time
+from typing import List
+
+import pytest
+
+ROUNDS = 3
+COMMANDS = {
+    "import ifctrano": ([sys.executable, "-c", "import ifctrano"], 0.5),
+    "ifctrano --help": ([sys.executable, "-m", "ifctrano.main", "--help"], 3.0),
+}
+
+
+def startup_time(command: List[str]) -> float:
+    """Best of ROUNDS wall clock times of running command."""
+    durations = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True, check=True)  # noqa: S603
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", COMMANDS)
+def test_startup_time(name: str) -> None:
+    command, threshold = COMMANDS[name]
+    duration = startup_time(command)
+    print(f"{name}: {duration:.2f}s (threshold {threshold:.2f}s)")
+    assert duration < threshold
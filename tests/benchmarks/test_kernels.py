@@ -0,0 +1,275 @@
+import json
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pytest
+from ifcopenshell import entity_instance
+from scipy.spatial.transform import Rotation
+
+from ifctrano.base import FaceVertices, ProjectedFaceVertices, Vertices
+from ifctrano.bounding_box import (
+    OrientedBoundingBox,
+    ShapeCache,
+    get_convex_hull_vertices,
+)
+from ifctrano.space_boundary import get_space_candidates, initialize_tree
+from ifctrano.utils import get_building_elements
+from tests.benchmarks.synthetic import SyntheticBuilding
+
+BASELINE_PATH = Path(__file__).parent / "kernels_baseline.json"
+SAVE_BASELINE = os.environ.get("IFCTRANO_SAVE_BASELINE") == "1"
+MIN_DURATION = 0.2
+ROUNDS = 5
+SPEED_TOLERANCE = 0.3
+ALLOCATION_TOLERANCE = 0.1
+SEED = 0
+KERNELS = [
+    "OrientedBoundingBox.from_vertices[random]",
+    "OrientedBoundingBox.from_vertices[synthetic]",
+    "OrientedBoundingBox.from_hull_vertices[synthetic]",
+    "OrientedBoundingBox.intersect_faces[random]",
+    "OrientedBoundingBox.intersect_faces[synthetic]",
+    "FaceVertices.project[synthetic]",
+    "ProjectedFaceVertices.to_polygon[synthetic]",
+    "Vertices.get_local_coordinate_system[random]",
+    "Vertices.get_bounding_box[random]",
+]
+
+Kernel = Callable[..., Any]
+Inputs = List[Tuple[Any, ...]]
+
+
+def random_boxes(count: int) -> List[np.ndarray[Any, np.dtype[np.float64]]]:
+    """Corners of randomly sized, placed and rotated boxes."""
+    rng = np.random.default_rng(SEED)
+    unit = np.array(
+        [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float64
+    )
+    return [
+        Rotation.from_euler("z", rng.uniform(0, 90), degrees=True).apply(
+            unit * rng.uniform(0.1, 10, 3)
+        )
+        + rng.uniform(-50, 50, 3)
+        for _ in range(count)
+    ]
+
+
+def random_point_clouds(count: int) -> List[np.ndarray[Any, np.dtype[np.float64]]]:
+    """Points inside randomly placed and rotated boxes, with their corners."""
+    rng = np.random.default_rng(SEED)
+    return [
+        np.vstack([box, box.min(axis=0) + rng.random((200, 3)) * np.ptp(box, axis=0)])
+        for box in random_boxes(count)
+    ]
+
+
+def synthetic_shapes() -> Tuple[
+    List[Tuple[np.ndarray[Any, np.dtype[np.float64]], entity_instance]],
+    List[Tuple[OrientedBoundingBox, OrientedBoundingBox]],
+]:
+    """Tessellated vertices and bounding boxes of a synthetic building.
+
+    Returns the vertices of all elements with their entity and the pairs of
+    space and candidate element bounding boxes.
+    """
+    ifc_file = SyntheticBuilding(3, 3, 2).ifc_file
+    shape_cache = ShapeCache()
+    tree = initialize_tree(ifc_file, shape_cache)
+    spaces = ifc_file.by_type("IfcSpace")
+    candidates = get_space_candidates(ifc_file, tree, spaces)
+    vertices = [
+        (shape_cache.get_vertices(entity), entity)
+        for entity in [*spaces, *get_building_elements(ifc_file)]
+    ]
+    pairs = [
+        (
+            shape_cache.get_bounding_box(space),
+            shape_cache.get_bounding_box(element),
+        )
+        for space in spaces
+        for element in candidates[space.GlobalId]
+    ]
+    return vertices, pairs
+
+
+def face_pairs(
+    pairs: List[Tuple[OrientedBoundingBox, OrientedBoundingBox]],
+) -> List[Tuple[FaceVertices, FaceVertices]]:
+    return [
+        (face.vertices, other_face.vertices)
+        for box, other_box in pairs
+        for face, other_face in box.candidate_face_pairs(other_box)
+    ]
+
+
+def kernels() -> Dict[str, Tuple[Kernel, Inputs]]:
+    vertices, pairs = synthetic_shapes()
+    random_pairs = [
+        (
+            OrientedBoundingBox.from_vertices(box),
+            OrientedBoundingBox.from_vertices(
+                box + np.array([0, 0, np.ptp(box[:, 2])])
+            ),
+        )
+        for box in random_boxes(50)
+    ]
+    projected = [face.project(other_face) for face, other_face in face_pairs(pairs)]
+    random_vertices = [Vertices.from_arrays(box) for box in random_boxes(50)]
+    return {
+        "OrientedBoundingBox.from_vertices[random]": (
+            OrientedBoundingBox.from_vertices,
+            [(points,) for points in random_point_clouds(50)],
+        ),
+        "OrientedBoundingBox.from_vertices[synthetic]": (
+            OrientedBoundingBox.from_vertices,
+            [(vertices_,) for vertices_, _ in vertices],
+        ),
+        "OrientedBoundingBox.from_hull_vertices[synthetic]": (
+            OrientedBoundingBox.from_hull_vertices,
+            [
+                (get_convex_hull_vertices(vertices_, entity), entity)
+                for vertices_, entity in vertices
+            ],
+        ),
+        "OrientedBoundingBox.intersect_faces[random]": (
+            OrientedBoundingBox.intersect_faces,
+            random_pairs,
+        ),
+        "OrientedBoundingBox.intersect_faces[synthetic]": (
+            OrientedBoundingBox.intersect_faces,
+            pairs,
+        ),
+        "FaceVertices.project[synthetic]": (
+            FaceVertices.project,
+            face_pairs(pairs),
+        ),
+        "ProjectedFaceVertices.to_polygon[synthetic]": (
+            ProjectedFaceVertices.to_polygon,
+            [(projected_,) for projected_ in projected],
+        ),
+        "Vertices.get_local_coordinate_system[random]": (
+            Vertices.get_local_coordinate_system,
+            [(vertices_,) for vertices_ in random_vertices],
+        ),
+        "Vertices.get_bounding_box[random]": (
+            Vertices.get_bounding_box,
+            [(vertices_,) for vertices_ in random_vertices],
+        ),
+    }
+
+
+def calibration(vertices: np.ndarray[Any, np.dtype[np.float64]]) -> float:
+    """Small NumPy operations on Python objects, like the kernels run."""
+    total = 0.0
+    for point in vertices:
+        total += float(np.linalg.norm(np.cross(point, point[::-1])))
+    return total
+
+
+CALIBRATION_INPUTS: Inputs = [(np.random.default_rng(SEED).random((100, 3)),)]
+
+
+def _operations_per_second(kernel: Kernel, inputs: Inputs) -> float:
+    """Rate of calls over the inputs lasting MIN_DURATION."""
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < MIN_DURATION:
+        for arguments in inputs:
+            kernel(*arguments)
+        calls += len(inputs)
+    return calls / elapsed
+
+
+def operations_per_second(kernel: Kernel, inputs: Inputs) -> Tuple[float, float]:
+    """Best rate of ROUNDS rounds, and its ratio to the best rate of calibration.
+
+    Rounds of the kernel and of the calibration alternate, so that both best
+    rates are measured under the same load of the machine.
+    """
+    rates = []
+    calibration_rates = []
+    for _ in range(ROUNDS):
+        rates.append(_operations_per_second(kernel, inputs))
+        calibration_rates.append(
+            _operations_per_second(calibration, CALIBRATION_INPUTS)
+        )
+    return max(rates), max(rates) / max(calibration_rates)
+
+
+def allocated_bytes_per_call(kernel: Kernel, inputs: Inputs) -> float:
+    """Average peak of the memory allocated while calling the kernel."""
+    tracemalloc.start()
+    try:
+        allocated = 0
+        for arguments in inputs:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            kernel(*arguments)
+            allocated += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return allocated / len(inputs)
+
+
+@pytest.fixture(scope="module")
+def kernel_inputs() -> Dict[str, Tuple[Kernel, Inputs]]:
+    return kernels()
+
+
+@pytest.fixture(scope="module")
+def baseline() -> Iterator[Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, float]] = (
+        json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    )
+    yield results
+    if SAVE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", KERNELS)
+def test_kernel(
+    name: str,
+    kernel_inputs: Dict[str, Tuple[Kernel, Inputs]],
+    baseline: Dict[str, Dict[str, float]],
+) -> None:
+    """Compare a kernel with the baseline.
+
+    Speeds are compared relative to the calibration workload measured along
+    the kernel, so that the baseline holds on a slower or busier machine than
+    the one it was recorded on.
+    """
+    kernel, inputs = kernel_inputs[name]
+    speed, relative_speed = operations_per_second(kernel, inputs)
+    result = {
+        "operations_per_second": speed,
+        "relative_speed": relative_speed,
+        "allocated_bytes_per_call": allocated_bytes_per_call(kernel, inputs),
+    }
+    reference = baseline.get(name)
+    print(
+        f"{name}: {result['operations_per_second']:.0f} ops/s, "
+        f"{result['relative_speed']:.4f} relative, "
+        f"{result['allocated_bytes_per_call']:.0f} B/call"
+        + (
+            f" (baseline {reference['relative_speed']:.4f} relative, "
+            f"{reference['allocated_bytes_per_call']:.0f} B/call)"
+            if reference
+            else ""
+        )
+    )
+    if SAVE_BASELINE:
+        baseline[name] = result
+        return
+    if reference is None:
+        pytest.skip(f"No baseline for {name}, set IFCTRANO_SAVE_BASELINE=1.")
+    assert result["relative_speed"] >= reference["relative_speed"] * (
+        1 - SPEED_TOLERANCE
+    )
+    assert result["allocated_bytes_per_call"] <= reference[
+        "allocated_bytes_per_call"
+    ] * (1 + ALLOCATION_TOLERANCE)
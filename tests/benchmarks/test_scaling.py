@@ -0,0 +1,82 @@
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from importlib.metadata import version
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ifctrano.building import Building
+from tests.benchmarks.synthetic import synthetic_building
+
+resource = pytest.importorskip("resource")
+
+RESULTS_DIRECTORY = Path(__file__).parent / "results"
+SIZES = [(2, 2, 1), (4, 4, 1), (4, 4, 2), (8, 4, 2), (8, 8, 2), (8, 8, 4)]
+
+
+def peak_memory() -> int:
+    """Peak resident memory of the current process in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(max_rss if sys.platform == "darwin" else max_rss * 1024)
+
+
+def run(ifc_file_path: Path) -> Dict[str, Any]:
+    start = time.perf_counter()
+    building = Building.from_ifc(ifc_file_path)
+    from_ifc = time.perf_counter()
+    building.to_config()
+    to_config = time.perf_counter()
+    building.create_network()
+    create_network = time.perf_counter()
+    return {
+        "space_boundaries": len(building.space_boundaries),
+        "internal_elements": len(building.internal_elements.elements),
+        "from_ifc": from_ifc - start,
+        "to_config": to_config - from_ifc,
+        "create_network": create_network - to_config,
+        "peak_memory": peak_memory(),
+    }
+
+
+@pytest.mark.benchmark
+def test_scaling(tmp_path: Path) -> None:
+    results = []
+    for nx, ny, nz in SIZES:
+        ifc_file_path = synthetic_building(tmp_path / f"{nx}x{ny}x{nz}.ifc", nx, ny, nz)
+        # A fresh process per size so that peak memory is not shared between sizes.
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn")
+        ) as executor:
+            result = executor.submit(run, ifc_file_path).result()
+        spaces = nx * ny * nz
+        assert result["space_boundaries"] == spaces
+        results.append(
+            {"nx": nx, "ny": ny, "nz": nz, "spaces": spaces}
+            | result
+            | {"from_ifc_per_space": result["from_ifc"] / spaces}
+        )
+        print(
+            f"{spaces} spaces: from_ifc {result['from_ifc']:.2f}s, "
+            f"to_config {result['to_config']:.2f}s, "
+            f"create_network {result['create_network']:.2f}s, "
+            f"peak memory {result['peak_memory'] / 1024**2:.0f} MB"
+        )
+    RESULTS_DIRECTORY.mkdir(exist_ok=True)
+    (RESULTS_DIRECTORY / "scaling.json").write_text(
+        json.dumps(
+            {
+                "date": datetime.now(timezone.utc).isoformat(),
+                "ifctrano": version("ifctrano"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
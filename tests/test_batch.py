@@ -0,0 +1,66 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ifctrano.batch import BatchOptions, collect_ifc_files, run_batch
+from ifctrano.main import app
+
+
+def test_collect_ifc_files(tmp_path: Path) -> None:
+    for name in ["b.ifc", "a.IFC", "c.txt"]:
+        (tmp_path / name).write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "d.ifc").write_text("")
+    assert collect_ifc_files(str(tmp_path)) == [tmp_path / "a.IFC", tmp_path / "b.ifc"]
+    assert collect_ifc_files(str(tmp_path / "**" / "*.ifc")) == [
+        tmp_path / "b.ifc",
+        tmp_path / "sub" / "d.ifc",
+    ]
+
+
+def test_run_batch_failure(tmp_path: Path) -> None:
+    invalid_path = tmp_path / "invalid.ifc"
+    invalid_path.write_text("not an ifc file")
+    summary = run_batch([invalid_path, tmp_path / "missing.ifc"], jobs=2)
+    assert [result.status for result in summary.results] == ["failed", "failed"]
+    assert all(result.error for result in summary.results)
+    summary_path = tmp_path / "summary.json"
+    summary.to_json(summary_path)
+    assert json.loads(summary_path.read_text())["counts"] == {
+        "success": 0,
+        "failed": 2,
+        "timeout": 0,
+    }
+
+
+@pytest.mark.parametrize("jobs", [0, -1])
+def test_run_batch_invalid_jobs(tmp_path: Path, jobs: int) -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        run_batch([tmp_path / "missing.ifc"], jobs=jobs)
+    result = CliRunner().invoke(app, ["batch", str(tmp_path), "--jobs", str(jobs)])
+    assert result.exit_code == 2
+
+
+def test_run_batch(two_zone_path: Path, tmp_path: Path) -> None:
+    ifc_file_paths = []
+    for index in range(3):
+        ifc_file_paths.append(tmp_path / f"two_zone_{index}.ifc")
+        shutil.copy(two_zone_path, ifc_file_paths[-1])
+    output_directory = tmp_path / "output"
+    summary = run_batch(
+        ifc_file_paths, BatchOptions(output_directory=output_directory), jobs=2
+    )
+    assert summary.counts()["success"] == 3
+    for ifc_file_path, result in zip(ifc_file_paths, summary.results):
+        assert result.path == ifc_file_path
+        assert result.output_path == output_directory / f"{ifc_file_path.stem}.yaml"
+        assert result.output_path.exists()
+        assert result.spaces == 2
+
+
+def test_run_batch_timeout(two_zone_path: Path) -> None:
+    summary = run_batch([two_zone_path], timeout=0.001)
+    assert summary.results[0].status == "timeout"
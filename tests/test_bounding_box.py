@@ -1,7 +1,25 @@
+import pickle
+import ifcopenshell
 import numpy as np
-
-from ifctrano.base import Vector, FaceVertices, ROUNDING_FACTOR
-from ifctrano.bounding_box import OrientedBoundingBox
+import pytest
+from ifctrano.base import (
+    ArrayModel,
+    Vector,
+    FaceVertices,
+    ROUNDING_FACTOR,
+    Point,
+    CommonSurface,
+    PolygonRing,
+)
+from ifctrano.box_points import get_axis_aligned_box_points
+from ifctrano.exceptions import VectorWithNansError
+from ifctrano.bounding_box import (
+    OrientedBoundingBox,
+    BoundingBoxStore,
+    have_candidate_face_pairs,
+    get_extreme_vertices,
+    EXTREME_POINT_THRESHOLD,
+)
 
 
 def test_oriented_bounding_box_along_x() -> None:
@@ -416,3 +434,218 @@ def test_face_vertices_coordinates() -> None:
         [3.05973, 9.74078, 7.04172],
         [3.25489, 9.35797, 7.61803],
     ]
+
+
+def test_bounding_box_store() -> None:
+    ifc_file = ifcopenshell.file(schema="IFC4")
+    walls = [
+        ifc_file.createIfcWall(ifcopenshell.guid.new()),
+        ifc_file.createIfcWall(ifcopenshell.guid.new()),
+    ]
+    boxes = [
+        OrientedBoundingBox.from_vertices(
+            np.array([[x, y, z] for x in [0, 10] for y in [0, 0.5] for z in [0, 2]]),
+            walls[0],
+        ),
+        OrientedBoundingBox.from_vertices(
+            np.array([[x, y, z] for x in [0, 1] for y in [2, 3] for z in [0, 4]]),
+            walls[1],
+        ),
+    ]
+    store = BoundingBoxStore()
+    for box in boxes:
+        store.add_bounding_box(box)
+    other_store = BoundingBoxStore()
+    other_store.add_arrays(
+        [wall.id() for wall in walls], store.corners, store.properties()
+    )
+
+    assert len(other_store) == 2
+    assert walls[0].id() in other_store
+    assert np.array_equal(other_store.normals, store.normals)
+    assert np.array_equal(store.normals[0], boxes[0].normals())
+    np.testing.assert_allclose(other_store.volumes, [10.0, 4.0])
+    np.testing.assert_allclose(other_store.min_bounds()[1], [0, 2, 0], atol=1e-6)
+    np.testing.assert_allclose(other_store.max_bounds()[1], [1, 3, 4], atol=1e-6)
+    for box, wall in zip(boxes, walls):
+        view = other_store.get(wall)
+        assert view.faces.description() == box.faces.description()
+        assert view.centroid == box.centroid
+        assert sorted(
+            np.round(np.abs(other_store.normals[other_store.indexes[wall.id()]]), 6)
+            .sum(axis=0)
+            .tolist()
+        ) == [2.0, 2.0, 2.0]
+    np.testing.assert_allclose(
+        other_store.min_bounds([walls[1].id()]), [[0, 2, 0]], atol=1e-6
+    )
+    np.testing.assert_allclose(
+        other_store.max_bounds([walls[1].id()]), [[1, 3, 4]], atol=1e-6
+    )
+    view = other_store.get(walls[0])
+    assert other_store.get(walls[0]) is view
+    unpickled_store = pickle.loads(pickle.dumps(other_store))  # noqa: S301
+    assert unpickled_store.get(walls[0]) is not view
+    assert unpickled_store.get(walls[0]).centroid == view.centroid
+
+
+def test_array_backed_points() -> None:
+    point = Point(x=1.123456789012345, y=2, z=np.float64(3.5))
+    assert point.to_list() == [1.123456789, 2.0, 3.5]
+    assert point - Point(x=1, y=1, z=1) == Vector(x=0.123456789, y=1, z=2.5)
+    assert Vector(x=3, y=0, z=0).normalize() == Vector(x=1, y=0, z=0)
+    with pytest.raises(VectorWithNansError):
+        Vector(x=0, y=0, z=0).normalize()
+    with pytest.raises(ValueError):
+        FaceVertices.from_arrays(np.array([[0, 0, 0], [1, 0, 0]]))
+
+    face_vertices = FaceVertices.from_arrays(
+        np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    )
+    common_surface = CommonSurface(
+        area=1,
+        orientation=face_vertices.get_normal(),
+        main_vertices=face_vertices,
+        common_vertices=face_vertices,
+        polygon=face_vertices.project(face_vertices).to_polygon().wkt,
+    )
+    loaded = CommonSurface.model_validate(common_surface.model_dump())
+    assert loaded == common_surface
+    assert loaded.orientation == Vector(x=0, y=0, z=1)
+    assert loaded.polygon == common_surface.polygon
+    assert loaded.polygon.wkt == "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))"
+    assert hash(loaded) == hash(common_surface)
+
+
+def test_polygon_ring() -> None:
+    ring = PolygonRing(coordinates=[[0, 0], [2, 0], [2, 1.5], [0, 1.5], [0, 0]])
+    assert ring.to_polygon().area == 3.0
+    assert PolygonRing.from_wkt(ring.wkt) == ring
+    assert PolygonRing.model_validate(ring.model_dump()) == ring
+    assert hash(PolygonRing(coordinates=[[-0.0, 0.0]])) == hash(
+        PolygonRing(coordinates=[[0.0, 0.0]])
+    )
+    assert PolygonRing().wkt == "POLYGON EMPTY"
+    assert PolygonRing.from_wkt("POLYGON EMPTY").to_polygon().is_empty
+
+
+def test_candidate_face_pairs() -> None:
+    vertices = np.array([[x, y, z] for x in [0, 2] for y in [0, 2] for z in [0, 2]])
+    obb = OrientedBoundingBox.from_vertices(vertices)
+    obb_right = OrientedBoundingBox.from_vertices(vertices + np.array([2, 0, 0]))
+    obb_far = OrientedBoundingBox.from_vertices(vertices + np.array([10, 10, 0]))
+
+    pairs = obb.candidate_face_pairs(obb_right)
+    assert len(pairs) == 4
+    assert all(
+        abs(face.normal.dot(other_face.normal)) == 1 and abs(face.normal.x) == 1
+        for face, other_face in pairs
+    )
+    assert obb.candidate_face_pairs(obb_far) == []
+    assert obb.intersect_faces(obb_right).description() == ([4.0], [1.0, 0.0, 0.0])
+
+
+def test_have_candidate_face_pairs() -> None:
+    rng = np.random.default_rng(0)
+    vertices = np.array([[x, y, z] for x in [0, 2] for y in [0, 2] for z in [0, 2]])
+    boxes = []
+    for angle in rng.uniform(0, np.pi / 2, 12):
+        rotation = np.array(
+            [
+                [np.cos(angle), -np.sin(angle), 0],
+                [np.sin(angle), np.cos(angle), 0],
+                [0, 0, 1],
+            ]
+        )
+        boxes.append(
+            OrientedBoundingBox.from_vertices(
+                vertices * rng.uniform(0.5, 2, 3) @ rotation.T + rng.uniform(0, 4, 3)
+            )
+        )
+    pairs = [(index, other) for index in range(12) for other in range(12)]
+    found = have_candidate_face_pairs(boxes, pairs)
+    assert found.any()
+    assert not found.all()
+    assert found.tolist() == [
+        bool(boxes[index].candidate_face_pairs(boxes[other])) for index, other in pairs
+    ]
+
+
+def test_aligned_face_intersection_matches_polygons() -> None:
+    face = FaceVertices.from_arrays(
+        np.array([[0, 0, 0], [4, 0, 0], [4, 3, 0], [0, 3, 0]])
+    )
+    other_face = FaceVertices.from_arrays(
+        np.array([[3.8, -1, 0], [4.2, -1, 0], [4.2, 5, 0], [3.8, 5, 0]])
+    )
+    rotated_face = FaceVertices.from_arrays(
+        np.array([[2, -1, 0], [5, 2, 0], [2, 5, 0], [-1, 2, 0]])
+    )
+    projected_face = face.project(face)
+    for other in [other_face, rotated_face]:
+        projected_other = face.project(other)
+        intersection = projected_other.to_polygon().intersection(
+            projected_face.to_polygon()
+        )
+        area, coordinates = projected_face.intersect(projected_other)
+        assert area == intersection.area
+        assert PolygonRing(coordinates=coordinates).to_polygon().equals(intersection)
+    assert projected_face.intersect_rectangle(face.project(other_face)) is not None
+    assert projected_face.intersect_rectangle(face.project(rotated_face)) is None
+
+
+def test_get_extreme_vertices_keeps_bounding_box() -> None:
+    vertices = np.random.default_rng(0).normal(size=(10000, 3))
+    extreme_vertices = get_extreme_vertices(vertices)
+    assert len(extreme_vertices) <= 26
+    assert np.array_equal(extreme_vertices.min(axis=0), vertices.min(axis=0))
+    assert np.array_equal(extreme_vertices.max(axis=0), vertices.max(axis=0))
+    small = vertices[:EXTREME_POINT_THRESHOLD]
+    assert get_extreme_vertices(small) is small
+
+
+def test_axis_aligned_box_points_match_open3d() -> None:
+    import open3d  # type: ignore
+
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        vertices = rng.normal(size=(20, 3)) * rng.uniform(0.1, 100, 3)
+        points = open3d.utility.Vector3dVector(vertices + rng.uniform(-1e3, 1e3, 3))
+        aab = open3d.geometry.AxisAlignedBoundingBox.create_from_points(points)
+        assert np.array_equal(
+            get_axis_aligned_box_points(np.asarray(points)),
+            np.asarray(aab.get_box_points()),
+        )
+
+
+def test_hull_box_matches_open3d_axis_aligned_box() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        vertices = rng.normal(size=(20, 3)) * rng.uniform(0.1, 100, 3)
+        hull_box = OrientedBoundingBox.from_hull_vertices(vertices, None)  # type: ignore
+        open3d_box = OrientedBoundingBox.from_vertices(
+            get_axis_aligned_box_points(vertices)
+        )
+        assert np.allclose(
+            np.unique(hull_box.to_box_points().round(6), axis=0),
+            np.unique(open3d_box.to_box_points().round(6), axis=0),
+        )
+        assert np.allclose(
+            np.unique([f.normal.to_array() for f in hull_box.faces.faces], axis=0),
+            np.unique(
+                np.round([f.normal.to_array() for f in open3d_box.faces.faces], 8),
+                axis=0,
+            ),
+        )
+        assert np.allclose(hull_box.to_properties(), open3d_box.to_properties())
+
+
+def test_array_model_requires_dict_conversions() -> None:
+    class Incomplete(ArrayModel):
+        __slots__ = ()
+
+        def model_dump(self) -> dict[str, float]:
+            return {}
+
+    with pytest.raises(TypeError, match="_from_dict"):
+        Incomplete()  # type: ignore
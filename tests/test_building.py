@@ -1,11 +1,29 @@
+import pickle
+import random
 import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import DefaultDict, List, Optional, Tuple
 
+import ifcopenshell
+import ifcopenshell.api
+import ifcopenshell.util.placement
+import numpy as np
 import pytest
 from _pytest.fixtures import FixtureRequest
 
-from ifctrano.building import Building
+from ifctrano.base import CommonSurface
+from ifctrano.bounding_box import OrientedBoundingBox
+from ifctrano.building import (
+    Building,
+    get_close_global_ids,
+    get_element_index,
+    get_internal_elements,
+    get_space_pair_matches,
+    iter_space_boundaries,
+)
+from ifctrano.space_boundary import SpaceBoundaries
+from tests.benchmarks.synthetic import synthetic_building
 from tests.conftest import compare, compare_config
 
 SHOW_FIGURES = False
@@ -111,6 +129,15 @@ def test_building_two_zone_save_file(two_zone_path: Path) -> None:
         assert temp_ifc_file.parent.joinpath(f"{building.name}.mo").exists()
 
 
+def test_building_two_zone_parallel(two_zone_path: Path) -> None:
+    building = Building.from_ifc(two_zone_path, workers=2)
+    assert building.description() == Building.from_ifc(two_zone_path).description()
+    assert (
+        building.internal_elements.description()
+        == Building.from_ifc(two_zone_path).internal_elements.description()
+    )
+
+
 def test_building_two_zone_adjacency(
     request: FixtureRequest, two_zone_path: Path
 ) -> None:
@@ -177,3 +204,203 @@ def test_building_layer_configuration(
     if SHOW_FIGURES:
         building.show()
     assert compare_config(building, request)
+
+
+def test_update_from_ifc(tmp_path: Path, two_zone_path: Path) -> None:
+    previous = Building.from_ifc(two_zone_path)
+    unchanged = Building.update_from_ifc(two_zone_path, previous)
+    assert unchanged.description() == previous.description()
+    assert (
+        unchanged.internal_elements.description()
+        == previous.internal_elements.description()
+    )
+
+    ifc_file = ifcopenshell.open(str(two_zone_path))
+    wall = ifc_file.by_type("IfcWall")[0]
+    matrix = ifcopenshell.util.placement.get_local_placement(wall.ObjectPlacement)
+    matrix[0, 3] += 0.1
+    ifcopenshell.api.run(
+        "geometry.edit_object_placement",
+        ifc_file,
+        product=wall,
+        matrix=matrix,
+        is_si=True,
+    )
+    revision_path = tmp_path / two_zone_path.name
+    ifc_file.write(str(revision_path))
+    updated = Building.update_from_ifc(revision_path, previous)
+    building = Building.from_ifc(revision_path)
+    assert updated.description() == building.description()
+    assert (
+        updated.internal_elements.description()
+        == building.internal_elements.description()
+    )
+
+
+def test_update_from_ifc_matches_affected_space_pairs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ifc_file_path = synthetic_building(tmp_path / "building.ifc", 3, 1)
+    previous = Building.from_ifc(ifc_file_path)
+    ifc_file = ifcopenshell.open(str(ifc_file_path))
+    window = next(
+        window
+        for window in ifc_file.by_type("IfcWindow")
+        if window.Name == "window_0_0"
+    )
+    matrix = ifcopenshell.util.placement.get_local_placement(window.ObjectPlacement)
+    matrix[0, 3] += 0.1
+    ifcopenshell.api.run(
+        "geometry.edit_object_placement",
+        ifc_file,
+        product=window,
+        matrix=matrix,
+        is_si=True,
+    )
+    revision_path = tmp_path / "revision.ifc"
+    ifc_file.write(str(revision_path))
+    matched = []
+
+    def record_space_pair_matches(
+        space_boundaries_1: SpaceBoundaries,
+        space_boundaries_2: SpaceBoundaries,
+        boundary_pairs: List[Tuple[int, int]],
+    ) -> List[Tuple[int, int, int]]:
+        matched.append(
+            (space_boundaries_1.space.entity.Name, space_boundaries_2.space.entity.Name)
+        )
+        return get_space_pair_matches(
+            space_boundaries_1, space_boundaries_2, boundary_pairs
+        )
+
+    monkeypatch.setattr(
+        "ifctrano.building.get_space_pair_matches", record_space_pair_matches
+    )
+    updated = Building.update_from_ifc(revision_path, previous)
+    assert sorted(matched) == [
+        ("room_0_0_0", "room_0_1_0"),
+        ("room_0_1_0", "room_0_0_0"),
+    ]
+    assert (
+        updated.internal_elements.description()
+        == previous.internal_elements.description()
+    )
+    assert updated.description() == Building.from_ifc(revision_path).description()
+
+
+def test_get_close_global_ids() -> None:
+    bounds = {
+        "a": np.array([[0, 0, 0], [1, 1, 1]]),
+        "b": np.array([[5, 0, 0], [6, 1, 1]]),
+        "c": np.array([[1.4, 0, 0], [2, 1, 1]]),
+    }
+    assert get_close_global_ids(bounds, {"d": np.array([[0.5] * 3, [0.6] * 3])}) == {
+        "a"
+    }
+    assert get_close_global_ids(bounds, {"e": np.array([[2.3, 0, 0], [3, 1, 1]])}) == {
+        "c"
+    }
+    assert get_close_global_ids(bounds, {}) == set()
+
+
+def test_internal_elements_intersect_adjacent_spaces(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    space_boundaries = list(
+        iter_space_boundaries(synthetic_building(tmp_path / "building.ifc", 3, 3, 2))
+    )
+    intersected = []
+    intersect_faces = OrientedBoundingBox.intersect_faces
+
+    def record_intersect_faces(
+        bounding_box: OrientedBoundingBox, other: OrientedBoundingBox
+    ) -> Optional[CommonSurface]:
+        intersected.append((bounding_box.entity.GlobalId, other.entity.GlobalId))
+        return intersect_faces(bounding_box, other)
+
+    monkeypatch.setattr(OrientedBoundingBox, "intersect_faces", record_intersect_faces)
+    internal_elements = get_internal_elements(space_boundaries)
+    space_pairs = [
+        (element.spaces[0].global_id, element.spaces[1].global_id)
+        for element in internal_elements.elements
+    ]
+    assert len(internal_elements.elements) == 12 * 2 + 9
+    assert sorted(intersected) == sorted(
+        space_pairs + [(other, index) for index, other in space_pairs]
+    )
+
+
+def test_internal_elements_visit_shared_elements_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    space_boundaries = list(
+        iter_space_boundaries(synthetic_building(tmp_path / "building.ifc", 2, 2))
+    )
+    indexed = []
+    matched = []
+
+    def record_element_index(
+        space_boundaries_: List[SpaceBoundaries],
+    ) -> DefaultDict[str, List[Tuple[int, int]]]:
+        indexed.append(len(space_boundaries_))
+        return get_element_index(space_boundaries_)
+
+    def record_space_pair_matches(
+        space_boundaries_1: SpaceBoundaries,
+        space_boundaries_2: SpaceBoundaries,
+        boundary_pairs: List[Tuple[int, int]],
+    ) -> List[Tuple[int, int, int]]:
+        matched.extend(
+            (
+                space_boundaries_1.boundaries[index].entity.Name,
+                space_boundaries_1.space.entity.Name,
+                space_boundaries_2.space.entity.Name,
+            )
+            for index, _ in boundary_pairs
+        )
+        return get_space_pair_matches(
+            space_boundaries_1, space_boundaries_2, boundary_pairs
+        )
+
+    monkeypatch.setattr("ifctrano.building.get_element_index", record_element_index)
+    monkeypatch.setattr(
+        "ifctrano.building.get_space_pair_matches", record_space_pair_matches
+    )
+    internal_elements = get_internal_elements(space_boundaries)
+    assert indexed == [4]
+    assert len(matched) == len(set(matched)) == 8
+    assert {element for element, *_ in matched} == {"wall_x_0_1", "wall_y_0_1"}
+    assert len(internal_elements.elements) == 4
+
+
+def test_iter_space_boundaries(two_zone_path: Path) -> None:
+    building = Building.from_ifc(two_zone_path)
+    global_ids = [
+        space_boundaries.space.global_id
+        for space_boundaries in building.space_boundaries
+    ]
+    assert [
+        space_boundaries.space.global_id
+        for space_boundaries in iter_space_boundaries(two_zone_path)
+    ] == global_ids
+    space_boundaries = iter_space_boundaries(two_zone_path, workers=2)
+    assert next(space_boundaries).space.global_id == global_ids[0]
+    space_boundaries.close()
+
+
+def test_detach(two_zone_path: Path) -> None:
+    building = Building.from_ifc(two_zone_path)
+    detached = pickle.loads(pickle.dumps(building.detach()))  # noqa: S301
+    assert detached.ifc_file is None
+    assert detached.description() == building.description()
+    assert (
+        detached.internal_elements.description()
+        == building.internal_elements.description()
+    )
+    random.seed(0)
+    config = building.to_config()
+    random.seed(0)
+    assert detached.to_config() == config
+    assert detached.get_model()
+    updated = Building.update_from_ifc(two_zone_path, detached)
+    assert updated.description() == building.description()
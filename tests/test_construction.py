@@ -1,5 +1,9 @@
+import ifcopenshell
+import pytest
 from ifcopenshell import file
 
+from ifctrano.base import DetachedEntity
+from ifctrano.exceptions import DetachedEntityError
 from ifctrano.construction import Materials, Layers, Constructions
 
 from ifctrano.utils import get_building_elements
@@ -56,3 +60,44 @@ def test_construction_example_hom(example_hom: file) -> None:
     for wall in get_building_elements(example_hom):
         construction = constructions.get_construction(wall)
         assert construction.layers
+
+
+def test_construction_detached_entity(two_zones: file) -> None:
+    constructions = Constructions.from_ifc(two_zones)
+    for wall in get_building_elements(two_zones):
+        detached = DetachedEntity.from_entity(
+            wall, constructions.get_construction_id(wall)
+        )
+        assert (detached.GlobalId, detached.Name, detached.is_a()) == (
+            wall.GlobalId,
+            wall.Name,
+            wall.is_a(),
+        )
+        assert constructions.get_construction(
+            detached
+        ) == constructions.get_construction(wall)
+
+
+def test_detached_entity_has_no_id() -> None:
+    wall = ifcopenshell.file(schema="IFC4").create_entity(
+        "IfcWall", GlobalId="0" * 22, Name="wall"
+    )
+    with pytest.raises(DetachedEntityError):
+        DetachedEntity.from_entity(wall).id()
+
+
+def test_construction_lookups_are_cached(two_zones: file) -> None:
+    constructions = Constructions.from_ifc(two_zones)
+    wall = two_zones.by_type("IfcWall")[0]
+    construction = constructions.get_construction(wall)
+    assert constructions.get_construction(wall) is construction
+    assert constructions.get_construction_id(wall) in {
+        construction_.id for construction_ in constructions.constructions
+    }
+    materials = Materials.from_ifc(two_zones)
+    material_id = materials.materials[0].id
+    assert materials.get_material(material_id) is materials.get_material(material_id)
+    layers = Layers.from_ifc(two_zones, materials)
+    ids = [layer.id for layer in layers.layers]
+    assert layers.from_ids(list(reversed(ids))) == layers.from_ids(ids)
+    assert len(layers.from_ids(ids)) == len(ids)
@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+
+import ifcopenshell
+
+from ifctrano.base import get_settings
+from ifctrano.building import Building
+from ifctrano.geometry_cache import (
+    GeometryCache,
+    ACCESS_MARKER,
+    PART_PREFIX,
+    cache_key,
+)
+from tests.benchmarks.synthetic import synthetic_building
+
+
+def test_building_two_zone_geometry_cache(two_zone_path: Path, tmp_path: Path) -> None:
+    geometry_cache = GeometryCache(directory=tmp_path)
+    building = Building.from_ifc(two_zone_path)
+    cached_building = Building.from_ifc(two_zone_path, geometry_cache=geometry_cache)
+    assert len(geometry_cache.entries()) == 1
+    reloaded_building = Building.from_ifc(two_zone_path, geometry_cache=geometry_cache)
+    assert (
+        building.description()
+        == cached_building.description()
+        == reloaded_building.description()
+    )
+    assert (
+        building.internal_elements.description()
+        == reloaded_building.internal_elements.description()
+    )
+
+
+def test_geometry_cache_only_adds_new_geometry(tmp_path: Path) -> None:
+    ifc_file_path = synthetic_building(tmp_path / "building.ifc", 2, 1)
+    space_global_ids = [
+        space.GlobalId
+        for space in ifcopenshell.open(str(ifc_file_path)).by_type("IfcSpace")
+    ]
+    geometry_cache = GeometryCache(directory=tmp_path / "cache")
+
+    def parts() -> dict[Path, int]:
+        return {
+            path: path.stat().st_mtime_ns
+            for path in geometry_cache.directory.glob(f"*/{PART_PREFIX}*/*")
+        }
+
+    Building.from_ifc(
+        ifc_file_path, space_global_ids[:1], geometry_cache=geometry_cache
+    )
+    first_parts = parts()
+    building = Building.from_ifc(ifc_file_path, geometry_cache=geometry_cache)
+    second_parts = parts()
+    assert first_parts.items() < second_parts.items()
+    reloaded_building = Building.from_ifc(ifc_file_path, geometry_cache=geometry_cache)
+    assert parts() == second_parts
+    assert (
+        Building.from_ifc(ifc_file_path).description()
+        == building.description()
+        == reloaded_building.description()
+    )
+
+
+def test_cache_key_depends_on_content(tmp_path: Path) -> None:
+    ifc_file_path = tmp_path / "model.ifc"
+    ifc_file_path.write_text("ISO-10303-21;")
+    key = cache_key(ifc_file_path)
+    assert key == cache_key(ifc_file_path)
+    ifc_file_path.write_text("ISO-10303-21;END-ISO-10303-21;")
+    assert key != cache_key(ifc_file_path)
+
+
+def test_cache_key_depends_on_geometry_profile(tmp_path: Path) -> None:
+    ifc_file_path = tmp_path / "model.ifc"
+    ifc_file_path.write_text("ISO-10303-21;")
+    keys = {
+        cache_key(ifc_file_path, get_settings(geometry_profile))
+        for geometry_profile in ["fast", "default", "precise"]
+    }
+    assert len(keys) == 3
+    assert cache_key(ifc_file_path) == cache_key(ifc_file_path, get_settings())
+
+
+def test_geometry_cache_eviction(tmp_path: Path) -> None:
+    geometry_cache = GeometryCache(directory=tmp_path, max_size=2500)
+    for index, name in enumerate(["old", "recent", "current"]):
+        entry = tmp_path / name
+        entry.mkdir()
+        (entry / "vertices.npy").write_bytes(b"0" * 1000)
+        (entry / ACCESS_MARKER).touch()
+        os.utime(entry / ACCESS_MARKER, (index, index))
+    geometry_cache.evict(keep="current")
+    assert sorted(entry.name for entry in geometry_cache.entries()) == [
+        "current",
+        "recent",
+    ]
+    geometry_cache.max_size = 0
+    geometry_cache.evict(keep="current")
+    assert [entry.name for entry in geometry_cache.entries()] == ["current"]
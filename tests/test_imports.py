@@ -0,0 +1,29 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "vedo",
+    "open3d",
+    "trano.data_models.conversion",
+    "trano.reporting.html",
+    "trano.simulate.simulate",
+]
+
+
+def imported_modules(module: str) -> set[str]:
+    """Modules loaded by importing module in a fresh interpreter."""
+    command = f"import json, sys, {module}; print(json.dumps(list(sys.modules)))"
+    arguments = [sys.executable, "-c", command]
+    output = subprocess.check_output(arguments, text=True)  # noqa: S603
+    return set(json.loads(output))
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["ifctrano.main", "ifctrano.building", "ifctrano.batch", "ifctrano.server"],
+)
+def test_heavy_modules_are_not_imported(module: str) -> None:
+    assert not imported_modules(module) & set(HEAVY_MODULES)
@@ -0,0 +1,103 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+import yaml
+
+from ifctrano.geometry_cache import ACCESS_MARKER, GeometryCache, cache_key
+from ifctrano.server import ConversionServer
+from tests.benchmarks.synthetic import synthetic_building
+
+
+@pytest.fixture(scope="module")
+def server_url() -> Iterator[str]:
+    server = ConversionServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def post(
+    url: str, data: bytes, headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, Any]:
+    try:
+        with urlopen(  # noqa: S310
+            Request(url, data=data, headers=headers or {})  # noqa: S310
+        ) as response:
+            return response.status, response.read().decode()
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_server_health(server_url: str) -> None:
+    with urlopen(f"{server_url}/health") as response:  # noqa: S310
+        assert json.loads(response.read())["status"] == "ok"
+
+
+def test_server_errors(server_url: str) -> None:
+    status, body = post(f"{server_url}/unknown", b"")
+    assert status == 404
+    status, body = post(f"{server_url}/convert?output=unknown", b"")
+    assert status == 400
+    status, body = post(
+        f"{server_url}/convert",
+        json.dumps({"path": "missing.ifc"}).encode(),
+        {"Content-Type": "application/json"},
+    )
+    assert status == 404
+    for invalid_json in [b"{not json", b"[1, 2]", b'"config"']:
+        status, body = post(
+            f"{server_url}/convert", invalid_json, {"Content-Type": "application/json"}
+        )
+        assert status == 400
+        assert body["error"]
+    for content_length in ["abc", "-1"]:
+        status, body = post(
+            f"{server_url}/convert", b"", {"Content-Length": content_length}
+        )
+        assert status == 400
+        assert body["error"]
+    status, body = post(f"{server_url}/convert", b"not an ifc file")
+    assert status == 422
+    assert body["error"]
+
+
+def test_server_convert(server_url: str, two_zone_path: Path) -> None:
+    status, body = post(f"{server_url}/convert", two_zone_path.read_bytes())
+    assert status == 200
+    assert len(yaml.safe_load(body)["spaces"]) == 2
+    status, body = post(
+        f"{server_url}/convert",
+        json.dumps({"path": str(two_zone_path), "output": "model"}).encode(),
+        {"Content-Type": "application/json"},
+    )
+    assert status == 200
+    assert "model" in body
+
+
+def test_server_caches_uploads(tmp_path: Path) -> None:
+    geometry_cache = GeometryCache(directory=tmp_path / "cache")
+    server = ConversionServer(("127.0.0.1", 0), geometry_cache)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    ifc_file_path = synthetic_building(tmp_path / "synthetic.ifc", 2, 1)
+    entry = geometry_cache.entry(cache_key(ifc_file_path))
+    try:
+        for _ in range(2):
+            status, body = post(
+                f"http://127.0.0.1:{server.server_port}/convert",
+                ifc_file_path.read_bytes(),
+            )
+            assert status == 200
+            assert len(yaml.safe_load(body)["spaces"]) == 2
+            assert entry.exists()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert (entry / ACCESS_MARKER).exists()
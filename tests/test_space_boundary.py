@@ -1,11 +1,20 @@
+import ifcopenshell
+import numpy as np
 from _pytest.fixtures import FixtureRequest
 from ifcopenshell import file
 
-from ifctrano.base import Vector
-from ifctrano.bounding_box import OrientedBoundingBox
+from ifctrano.base import Vector, CommonSurface, FaceVertices, PolygonRing
+from ifctrano.bounding_box import OrientedBoundingBox, ShapeCache
 from ifctrano.building import get_internal_elements
 from ifctrano.construction import Constructions
-from ifctrano.space_boundary import initialize_tree, SpaceBoundaries, Space
+from ifctrano.space_boundary import (
+    initialize_tree,
+    SpaceBoundaries,
+    Space,
+    get_space_candidates,
+    SpaceBoundary,
+    remove_duplicate_boundaries,
+)
 from tests.conftest import SHOW_FIGURES, compare
 
 
@@ -44,6 +53,34 @@ def test_get_space_boundaries(request: FixtureRequest, duplex_apartment: file) -
     assert compare(boundaries, request)
 
 
+def test_get_space_boundaries_with_shape_cache(duplex_apartment: file) -> None:
+    shape_cache = ShapeCache()
+    tree = initialize_tree(duplex_apartment, shape_cache)
+    space = duplex_apartment.by_guid("0BTBFw6f90Nfh9rP1dl_CZ")
+    boundaries = SpaceBoundaries.from_space_entity(
+        duplex_apartment, tree, space, shape_cache
+    )
+    assert space.id() in shape_cache.bounding_boxes
+    assert (
+        boundaries.description()
+        == SpaceBoundaries.from_space_entity(
+            duplex_apartment, tree, space
+        ).description()
+    )
+
+
+def test_get_space_candidates(duplex_apartment: file) -> None:
+    tree = initialize_tree(duplex_apartment)
+    spaces = duplex_apartment.by_type("IfcSpace")
+    candidates = get_space_candidates(duplex_apartment, tree, spaces)
+    assert list(candidates) == [space.GlobalId for space in spaces]
+    for space in spaces[:3]:
+        space_candidates = get_space_candidates(duplex_apartment, tree, [space])
+        assert {e.GlobalId for e in candidates[space.GlobalId]} == {
+            e.GlobalId for e in space_candidates[space.GlobalId]
+        }
+
+
 def test_get_space_boundaries_another_space(
     request: FixtureRequest, duplex_apartment: file
 ) -> None:
@@ -363,3 +400,36 @@ def test_space_boundary_layer(request: FixtureRequest, layer: file) -> None:
     if SHOW_FIGURES:
         boundaries.show()
     assert compare(boundaries, request)
+
+
+def test_remove_duplicate_boundaries() -> None:
+    ifc_file = ifcopenshell.file(schema="IFC4")
+    vertices = np.array([[x, y, z] for x in [0, 1] for y in [0, 1] for z in [0, 1]])
+    bounding_box = OrientedBoundingBox.from_vertices(vertices)
+    face_vertices = FaceVertices.from_arrays(vertices[:4])
+
+    def boundary(global_id: str, x: float, ifc_class: str = "IfcSlab") -> SpaceBoundary:
+        coordinates = [[x, 0], [x, 1], [x + 1, 1], [x + 1, 0], [x, 0]]
+        return SpaceBoundary(
+            bounding_box=bounding_box,
+            entity=ifc_file.create_entity(ifc_class, GlobalId=global_id),
+            common_surface=CommonSurface(
+                area=1,
+                orientation=Vector(x=0, y=0, z=-1),
+                main_vertices=face_vertices,
+                common_vertices=face_vertices,
+                polygon=PolygonRing(coordinates=coordinates),
+            ),
+        )
+
+    duplicated = boundary("d", 5)
+    boundaries = [
+        boundary("c", 1.2),
+        boundary("a", 0),
+        boundary("b", 0.6),
+        duplicated,
+        boundary("e", 5, "IfcWall"),
+        duplicated,
+    ]
+    kept = remove_duplicate_boundaries(boundaries)
+    assert [b.entity.GlobalId for b in kept] == ["e", "a", "c", "d"]
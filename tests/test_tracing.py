@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+from ifctrano.building import Building
+from ifctrano.tracing import get_tracer, span, traced, tracing
+
+
+@traced("traced_function")
+def traced_function(value: int) -> int:
+    return value + 1
+
+
+def test_tracing(tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.json"
+    with span("ignored"):
+        assert get_tracer() is None
+    with tracing(trace_path) as tracer:
+        with span("stage", space="space_id") as attributes:
+            attributes["boundaries"] = 2
+        assert traced_function(1) == 2
+    assert get_tracer() is None
+    assert [event["name"] for event in tracer.events] == ["stage", "traced_function"]
+    assert tracer.events[0]["args"] == {"space": "space_id", "boundaries": 2}
+    assert tracer.events[0]["ph"] == "X"
+    assert json.loads(trace_path.read_text())["traceEvents"] == tracer.events
+
+
+def test_building_two_zone_trace(two_zone_path: Path) -> None:
+    with tracing() as tracer:
+        building = Building.from_ifc(two_zone_path, workers=2)
+        building.to_config()
+    names = {event["name"] for event in tracer.events}
+    assert {
+        "Building.from_ifc",
+        "initialize_tree",
+        "clash_clearance_many",
+        "space_boundaries",
+        "intersect_faces",
+        "remove_duplicate_boundaries",
+        "get_internal_elements",
+        "Constructions.from_ifc",
+        "Building.to_config",
+    } <= names
+    assert sum(event["name"] == "space_boundaries" for event in tracer.events) == len(
+        building.space_boundaries
+    )